@@ -1,13 +1,54 @@
+"""
+Collects timings for every day into results.json.
+
+`python dayNN.py` in a subprocess mostly measures interpreter boot and imports, so the
+Python side is split into three numbers:
+
+    startup_time  a bare `python -c pass`, what every script pays before doing anything
+    import_time   importing the day module in a fresh interpreter (numpy / z3 / graphviz land here)
+    solve_time    median `soln()` time in one warm process, via `aoc.py --bench`
+
+Rust is built once per session. Each day reports the process wall time and the solve time
+the binary prints itself.
+
+The numbers go under a `measured` key for each language, so the hand-written notes and
+complexity in results.json survive a re-run. Every duration is in nanoseconds, in a key
+ending in `_ns` (see results_schema.py). Every sample also goes into the history.
+
+    python collect_metrics.py
+    python collect_metrics.py day01 day09 --iterations 20 --skip-rust
+"""
+
+import argparse
 import json
+import re
 import statistics
 import subprocess
+import sys
 import time
+from pathlib import Path
+
+from history import append_records, git_commit, make_record
+from results_schema import load_results, save_results
 
 # Paths to directories
-PYTHON_DIR = "./python"
-RUST_DIR = "./rust"
-INPUT_DIR = "./inputs"
-RESULTS_FILE = "./results.json"
+ROOT_DIR = Path(__file__).parent.parent
+PYTHON_DIR = ROOT_DIR / "python"
+RUST_DIR = ROOT_DIR / "rust"
+INPUT_DIR = ROOT_DIR / "inputs"
+RESULTS_FILE = Path(__file__).parent / "results.json"
+
+DAY_FILE_PATTERN = re.compile(r"^(day\d{2})\.(py|rs)$")
+# what `{:?}` prints for a std::time::Duration, e.g. `day01: 643.573µs`
+RUST_DURATION_PATTERN = re.compile(r"(day\d{2}): ([\d.]+)(ns|µs|ms|s)$", re.MULTILINE)
+RUST_DURATION_UNITS = {"ns": 1, "µs": 1e3, "ms": 1e6, "s": 1e9}
+# how much of a failed subprocess's stderr goes into its error, the end of a traceback is what matters
+STDERR_TAIL_LINES = 5
+
+# import the day module and report how long that took, from inside the fresh interpreter
+IMPORT_SNIPPET = (
+    "import sys, time; t = time.perf_counter_ns(); __import__(sys.argv[1]); print(time.perf_counter_ns() - t)"
+)
 
 
 # Helper function to count lines of code
@@ -18,58 +59,195 @@ def count_lines_of_code(file_path):
     return len([line for line in lines if line.strip() and not line.strip().startswith("#")])
 
 
-# Run Python solution
-def time_python_solution(day, input_file, iterations=10):
-    script_path = f"{PYTHON_DIR}/{day}.py"
-    times = []
+def discover_days(directory):
+    return sorted(match.group(1) for path in directory.iterdir() if (match := DAY_FILE_PATTERN.match(path.name)))
+
+
+def stderr_tail(stderr):
+    if isinstance(stderr, bytes):
+        stderr = stderr.decode(errors="replace")
+    return "\n".join((stderr or "").strip().splitlines()[-STDERR_TAIL_LINES:])
+
+
+def describe_failure(error):
+    """A failed `subprocess.run(..., check=True)` as its exit code plus the end of its stderr."""
+    tail = stderr_tail(error.stderr)
+    return f"exited with {error.returncode}" + (f": {tail}" if tail else "")
+
+
+def time_command(command, iterations, cwd=None):
+    times_ns = []
     for _ in range(iterations):
-        start_time = time.perf_counter()
-        subprocess.run(["python", script_path], check=True)
-        end_time = time.perf_counter()
-        times.append(end_time - start_time)
-    return statistics.mean(times), statistics.stdev(times), count_lines_of_code(script_path)
+        start_ns = time.perf_counter_ns()
+        subprocess.run(command, cwd=cwd, check=True, capture_output=True)
+        times_ns.append(time.perf_counter_ns() - start_ns)
+    return times_ns
 
 
-# Run Rust solution
-def time_rust_solution(day, iterations=10):
-    # Build Rust project
-    subprocess.run(["cargo", "build", "--release"], cwd=RUST_DIR, check=True)
+# Interpreter boot alone, the same for every day so it's only measured once
+def time_python_startup(iterations=10):
+    return time_command([sys.executable, "-c", "pass"], iterations)
 
-    binary_path = f"{RUST_DIR}/target/release/rust"
+
+def time_python_import(day, iterations=10):
     times = []
     for _ in range(iterations):
-        start_time = time.perf_counter()
-        subprocess.run([binary_path, day], check=True)
-        end_time = time.perf_counter()
-        times.append(end_time - start_time)
-
-    # Count LOC for Rust implementation
-    rust_src_files = [f"{RUST_DIR}/src/{day}.rs"]
-    total_loc = sum(count_lines_of_code(file) for file in rust_src_files)
+        completed = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET, day], cwd=PYTHON_DIR, check=True, capture_output=True, text=True
+        )
+        times.append(int(completed.stdout.strip().splitlines()[-1]))
+    return times
+
+
+# Solve time + peak memory for all the Python days in one warm process, measured by aoc.py
+def time_python_solutions(days):
+    completed = subprocess.run(
+        [sys.executable, "aoc.py", *days, "--bench", "--memory", "--json", "--inputs-dir", str(INPUT_DIR.resolve())],
+        cwd=PYTHON_DIR,
+        capture_output=True,
+        text=True,
+    )
+    # aoc.py exits 1 if any day failed, the report still has the others
+    try:
+        report = json.loads(completed.stdout)
+    except json.JSONDecodeError:
+        raise RuntimeError(
+            f"aoc.py exited with {completed.returncode} without a JSON report: {stderr_tail(completed.stderr)}"
+        ) from None
+    return {day_report["day"]: day_report for day_report in report["days"]}
+
+
+def build_rust():
+    subprocess.run(["cargo", "build", "--release"], cwd=RUST_DIR, check=True)
+    return RUST_DIR / "target" / "release" / "rust"
 
-    return statistics.mean(times), statistics.stdev(times), total_loc
 
+def parse_rust_duration_ns(output, day):
+    for match_day, value, unit in RUST_DURATION_PATTERN.findall(output):
+        if match_day == day:
+            return float(value) * RUST_DURATION_UNITS[unit]
+    raise ValueError(f"No timing line for {day} in the rust output")
 
-if __name__ == "__main__":
-    days = ["day01"]  # Add more days as you go
-    results = {}
 
-    for day in days:
-        input_file = f"{INPUT_DIR}/{day}.txt"
+# Run Rust solution, the binary has to be built already
+def time_rust_solution(binary_path, day, iterations=10):
+    process_times = []
+    solve_times = []
+    for _ in range(iterations):
+        start_ns = time.perf_counter_ns()
+        completed = subprocess.run([str(binary_path), day], check=True, capture_output=True, text=True)
+        process_times.append(time.perf_counter_ns() - start_ns)
+        solve_times.append(parse_rust_duration_ns(completed.stdout, day))
 
-        print(f"Timing Python solution for {day}...")
-        python_avg, python_stdev, python_loc = time_python_solution(day, input_file)
+    # Count LOC for Rust implementation
+    rust_src_files = [RUST_DIR / "src" / f"{day}.rs"]
+    total_loc = sum(count_lines_of_code(file) for file in rust_src_files)
 
-        print(f"Timing Rust solution for {day}...")
-        rust_avg, rust_stdev, rust_loc = time_rust_solution(day)
+    return process_times, solve_times, total_loc
+
+
+def summarize(times_ns):
+    return {
+        "mean_ns": statistics.mean(times_ns),
+        "median_ns": statistics.median(times_ns),
+        "stdev_ns": statistics.stdev(times_ns) if len(times_ns) > 1 else 0.0,
+        "min_ns": min(times_ns),
+        "max_ns": max(times_ns),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Collect startup / import / solve timings into results.json.")
+    parser.add_argument("days", nargs="*", help="days to collect, e.g. day01 (default: every day)")
+    parser.add_argument("--iterations", type=int, default=10, help="subprocess runs per measurement")
+    parser.add_argument("--skip-rust", action="store_true")
+    args = parser.parse_args(argv)
+
+    days = args.days or discover_days(PYTHON_DIR)
+    rust_days = set(discover_days(RUST_DIR / "src"))
+
+    # older files (duration strings, seconds) come back in the current shape
+    results = load_results(RESULTS_FILE)
+    history = []
+    commit, dirty = git_commit()
+
+    print("Timing Python interpreter startup...")
+    startup_times = time_python_startup(args.iterations)
+    print(f"Timing Python solutions for {len(days)} days in-process...")
+    try:
+        solve_reports = time_python_solutions(days)
+        not_run = "not run"
+    except RuntimeError as e:
+        # the import and rust numbers are still worth keeping
+        print(f"warning: {e}", file=sys.stderr)
+        solve_reports = {}
+        not_run = str(e)
+
+    binary_path = None
+    if not args.skip_rust and rust_days & set(days):
+        print("Building Rust solutions...")
+        try:
+            binary_path = build_rust()
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"warning: rust build failed, skipping rust: {e}", file=sys.stderr)
 
-        results[day] = {
-            "python": {"avg_time": python_avg, "stdev_time": python_stdev, "loc": python_loc},
-            "rust": {"avg_time": rust_avg, "stdev_time": rust_stdev, "loc": rust_loc},
-        }
+    for day in days:
+        print(f"Timing {day}...")
+        python = {"startup_time": summarize(startup_times)}
+        try:
+            import_times = time_python_import(day, args.iterations)
+        except subprocess.CalledProcessError as e:
+            # a day that doesn't import (a syntax error, numpy missing) is just an error for that day
+            python["error"] = f"import {describe_failure(e)}"
+        else:
+            python["import_time"] = summarize(import_times)
+            history.append(make_record(day, "python", "import", import_times, commit, dirty))
+        python["loc"] = count_lines_of_code(PYTHON_DIR / f"{day}.py")
+
+        solve_report = solve_reports.get(day)
+        if solve_report and solve_report["benchmark"]:
+            bench = solve_report["benchmark"]
+            python["solve_time"] = {
+                key: bench[key] for key in ("mean_ns", "median_ns", "stdev_ns", "min_ns", "max_ns", "p95_ns")
+            }
+            python["phases_ns"] = {path: phase["median_ns"] for path, phase in bench["phases"].items()}
+            python["counters"] = bench["counters"]
+            python["memory"] = solve_report["memory"]
+            history.append(
+                make_record(day, "python", "in-process", bench["samples_ns"], commit, dirty, solve_report["input_file"])
+            )
+        elif "error" not in python:
+            python["error"] = solve_report["error"] if solve_report else not_run
+        results.setdefault(day, {}).setdefault("python", {})["measured"] = python
+
+        if binary_path and day in rust_days:
+            try:
+                process_times, solve_times, rust_loc = time_rust_solution(binary_path, day, args.iterations)
+            except subprocess.CalledProcessError as e:
+                results[day].setdefault("rust", {})["measured"] = {"error": describe_failure(e)}
+                continue
+            except ValueError as e:
+                results[day].setdefault("rust", {})["measured"] = {"error": str(e)}
+                continue
+            results[day].setdefault("rust", {})["measured"] = {
+                "process_time": summarize(process_times),
+                "solve_time": summarize(solve_times),
+                "loc": rust_loc,
+            }
+            # the binary reads the same inputs directory
+            rust_input = INPUT_DIR / f"{day}.txt"
+            history.append(make_record(day, "rust", "subprocess", process_times, commit, dirty, rust_input))
+            history.append(make_record(day, "rust", "self-reported", solve_times, commit, dirty, rust_input))
 
     # Save results to JSON
-    with open(RESULTS_FILE, "w") as f:
-        json.dump(results, f, indent=4)
-
+    save_results(results, RESULTS_FILE)
     print(f"Results saved to {RESULTS_FILE}")
+
+    # results.json only ever has the latest numbers, the history keeps every run
+    append_records(history)
+    print(f"Appended {len(history)} records to the benchmark history")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,139 @@
+"""
+Charts from results.json, the scaling runs and the benchmark history.
+
+Every duration is in nanoseconds (see results_schema.py). The time charts pick the unit that
+reads best for their range and use a log axis, since the days go from microseconds to seconds.
+
+    python generate_visualizations.py                            # every chart there's data for
+    python generate_visualizations.py times phases
+    python generate_visualizations.py scaling --scaling-json scaling.json
+    python generate_visualizations.py history --days day11 day22
+
+`scaling.json` is the output of `python scaling.py --all --json` (run from ../python).
+"""
+
+import argparse
 import json
+import sys
+from datetime import datetime
+from pathlib import Path
 
-import matplotlib.pyplot as plt
+from history import HISTORY_FILE, load_records, machine_fingerprint
+from results_schema import RESULTS_FILE, headline_ns, load_results, phases_ns, spread_ns
 
-RESULTS_FILE = "./results.json"
+ANALYSIS_DIR = Path(__file__).parent
+LANGUAGES = ("python", "rust")
+# biggest first, so the first one a value reaches is the one to show it in
+TIME_UNITS = (("s", 1e9), ("ms", 1e6), ("µs", 1e3), ("ns", 1))
+CHARTS = {
+    "times": "avg_time_comparison.png",
+    "variability": "timing_variability.png",
+    "phases": "phase_breakdown.png",
+    "scaling": "scaling_curves.png",
+    "history": "history_trends.png",
+}
 
 
-def generate_bar_chart(data, key, title, ylabel, filename):
-    days = list(data.keys())
-    python_values = [float(data[day]["python"][key].replace("µs", "").replace("ms", "")) for day in days]
-    rust_values = [float(data[day]["rust"][key].replace("µs", "").replace("ms", "")) for day in days]
+def pick_unit(values_ns):
+    """The largest unit the smallest value is at least one of, e.g. ("ms", 1e6)."""
+    values_ns = [value for value in values_ns if value]
+    if not values_ns:
+        return TIME_UNITS[-1]
+    smallest = min(values_ns)
+    for name, scale in TIME_UNITS:
+        if smallest >= scale:
+            return name, scale
+    return TIME_UNITS[-1]
 
-    x = range(len(days))
-    plt.figure(figsize=(10, 6))
-    plt.bar(x, python_values, width=0.4, label="Python", align="center")
-    plt.bar([p + 0.4 for p in x], rust_values, width=0.4, label="Rust", align="center")
-    plt.xticks(x, days, rotation=45)
+
+def times_data(results):
+    """{language: {day: headline ns}}, only days that have a number for that language."""
+    data = {}
+    for language in LANGUAGES:
+        data[language] = {}
+        for day, entry in results.items():
+            value = headline_ns(entry.get(language))
+            if value is not None:
+                data[language][day] = value
+    return data
+
+
+def variability_data(results):
+    """{language: {day: (headline, min, max) ns}}, only measured days know their min / max."""
+    data = {}
+    for language in LANGUAGES:
+        data[language] = {}
+        for day, entry in results.items():
+            spread = spread_ns(entry.get(language))
+            if spread is not None:
+                data[language][day] = spread
+    return data
+
+
+def phases_data(results, language="python"):
+    """
+    {day: {phase: ns}} with only the top level phases, `other` being whatever the solve took
+    outside of them.
+    """
+    data = {}
+    for day, entry in results.items():
+        phases = {name: value for name, value in phases_ns(entry.get(language)).items() if "/" not in name}
+        if not phases:
+            continue
+        total = headline_ns(entry.get(language))
+        if total is not None and total > sum(phases.values()):
+            phases["other"] = total - sum(phases.values())
+        data[day] = phases
+    return data
+
+
+def scaling_data(scaling_report):
+    """{day: [(input bytes, median ns)]} from `scaling.py --json`, skipping rungs that failed."""
+    data = {}
+    for day_report in scaling_report["days"]:
+        points = [
+            (point["input_bytes"], point["median_ns"])
+            for point in day_report["points"]
+            if point["median_ns"] is not None
+        ]
+        if points:
+            data[day_report["day"]] = sorted(points)
+    return data
+
+
+def history_data(records, machine=None, days=None, variant="python", method="in-process"):
+    """
+    {day: [(timestamp, median ns)]} for one machine, since numbers from different boxes don't
+    compare. Defaults to this one, or the one with the most records if this one has none.
+    """
+    records = [record for record in records if record["variant"] == variant and record["method"] == method]
+    if days:
+        records = [record for record in records if record["day"] in days]
+    if machine is None:
+        machines = [record["machine"] for record in records]
+        here = machine_fingerprint()
+        machine = here if here in machines else max(set(machines), key=machines.count, default=None)
+    data = {}
+    for record in records:
+        if record["machine"] == machine:
+            data.setdefault(record["day"], []).append(
+                (datetime.fromisoformat(record["timestamp"]), record["median_ns"])
+            )
+    return {day: sorted(points) for day, points in sorted(data.items())}
+
+
+def _pyplot():
+    # only needed to draw, the data functions above work without it
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _save(plt, title, ylabel, filename):
+    plt.yscale("log")
     plt.ylabel(ylabel)
     plt.title(title)
     plt.legend()
@@ -23,54 +142,129 @@ def generate_bar_chart(data, key, title, ylabel, filename):
     plt.close()
 
 
-def generate_timing_error_chart(data, title, ylabel, filename):
-    days = list(data.keys())
-    python_avg = [float(data[day]["python"]["avg_time"].replace("µs", "").replace("ms", "")) for day in days]
-    python_min = [float(data[day]["python"]["min_time"].replace("µs", "").replace("ms", "")) for day in days]
-    python_max = [float(data[day]["python"]["max_time"].replace("µs", "").replace("ms", "")) for day in days]
-    rust_avg = [float(data[day]["rust"]["avg_time"].replace("µs", "").replace("ms", "")) for day in days]
-    rust_min = [float(data[day]["rust"]["min_time"].replace("µs", "").replace("ms", "")) for day in days]
-    rust_max = [float(data[day]["rust"]["max_time"].replace("µs", "").replace("ms", "")) for day in days]
+def generate_bar_chart(data, title, filename):
+    plt = _pyplot()
+    days = sorted(set().union(*(data[language] for language in LANGUAGES)))
+    unit, scale = pick_unit([value for language in LANGUAGES for value in data[language].values()])
 
-    x = range(len(days))
-    plt.figure(figsize=(10, 6))
+    width = 0.4
+    plt.figure(figsize=(12, 6))
+    for offset, language in enumerate(LANGUAGES):
+        x = [i + offset * width for i, day in enumerate(days) if day in data[language]]
+        values = [data[language][day] / scale for day in days if day in data[language]]
+        plt.bar(x, values, width=width, label=language.capitalize(), align="center")
+    plt.xticks([i + width / 2 for i in range(len(days))], days, rotation=45)
+    _save(plt, title, f"Time ({unit})", filename)
 
-    # Python error bars
-    plt.errorbar(
-        x,
-        python_avg,
-        yerr=[[(a - b) for a, b in zip(python_avg, python_min)], [(a - b) for a, b in zip(python_max, python_avg)]],
-        fmt="o",
-        label="Python",
-        capsize=5,
-    )
-
-    # Rust error bars
-    plt.errorbar(
-        x,
-        rust_avg,
-        yerr=[[(a - b) for a, b in zip(rust_avg, rust_min)], [(a - b) for a, b in zip(rust_max, rust_avg)]],
-        fmt="o",
-        label="Rust",
-        capsize=5,
-    )
-
-    plt.xticks(x, days, rotation=45)
-    plt.ylabel(ylabel)
+
+def generate_timing_error_chart(data, title, filename):
+    plt = _pyplot()
+    days = sorted(set().union(*(data[language] for language in LANGUAGES)))
+    unit, scale = pick_unit([spread[1] for language in LANGUAGES for spread in data[language].values()])
+
+    plt.figure(figsize=(12, 6))
+    for offset, language in enumerate(LANGUAGES):
+        spreads = [(i, data[language][day]) for i, day in enumerate(days) if day in data[language]]
+        if not spreads:
+            continue
+        x = [i + offset * 0.2 for i, _ in spreads]
+        middle = [spread[0] / scale for _, spread in spreads]
+        lower = [(spread[0] - spread[1]) / scale for _, spread in spreads]
+        upper = [(spread[2] - spread[0]) / scale for _, spread in spreads]
+        plt.errorbar(x, middle, yerr=[lower, upper], fmt="o", label=language.capitalize(), capsize=5)
+    plt.xticks(range(len(days)), days, rotation=45)
+    _save(plt, title, f"Time ({unit})", filename)
+
+
+def generate_phase_chart(data, title, filename):
+    plt = _pyplot()
+    days = sorted(data)
+    phase_names = list(dict.fromkeys(name for day in days for name in data[day]))
+
+    # share of each day's time rather than absolute time: the days are orders of magnitude
+    # apart, which a stacked bar can't show on one axis
+    plt.figure(figsize=(12, 6))
+    bottoms = [0.0] * len(days)
+    for name in phase_names:
+        values = [100 * data[day].get(name, 0) / sum(data[day].values()) for day in days]
+        plt.bar(range(len(days)), values, bottom=bottoms, label=name)
+        bottoms = [bottom + value for bottom, value in zip(bottoms, values)]
+    plt.xticks(range(len(days)), days, rotation=45)
+    plt.ylabel("Share of solve time (%)")
     plt.title(title)
-    plt.legend()
+    plt.legend(fontsize="small", ncol=2)
     plt.tight_layout()
     plt.savefig(filename)
     plt.close()
 
 
-if __name__ == "__main__":
-    # Load results
-    with open(RESULTS_FILE) as f:
-        data = json.load(f)
+def generate_scaling_chart(data, title, filename):
+    plt = _pyplot()
+    unit, scale = pick_unit([median for points in data.values() for _, median in points])
 
-    # Generate bar chart for average execution time
-    generate_bar_chart(data, "avg_time", "Average Execution Time", "Time (µs)", "avg_time_comparison.png")
+    plt.figure(figsize=(10, 6))
+    for day, points in sorted(data.items()):
+        plt.plot([size for size, _ in points], [median / scale for _, median in points], marker="o", label=day)
+    plt.xscale("log")
+    plt.xlabel("Input size (bytes)")
+    _save(plt, title, f"Time ({unit})", filename)
 
-    # # Generate error chart for timing variability
-    # generate_timing_error_chart(data, "Timing Variability (Min/Max/Avg)", "Time (µs)", "timing_variability.png")
+
+def generate_history_chart(data, title, filename):
+    plt = _pyplot()
+    unit, scale = pick_unit([median for points in data.values() for _, median in points])
+
+    plt.figure(figsize=(12, 6))
+    for day, points in data.items():
+        plt.plot([when for when, _ in points], [median / scale for _, median in points], marker=".", label=day)
+    plt.gcf().autofmt_xdate()
+    _save(plt, title, f"Median time ({unit})", filename)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Charts from results.json, scaling runs and the benchmark history.")
+    parser.add_argument("charts", nargs="*", help=f"charts to draw: {', '.join(CHARTS)} (default: all with data)")
+    parser.add_argument("--results", type=Path, default=RESULTS_FILE)
+    parser.add_argument("--history", type=Path, default=HISTORY_FILE)
+    parser.add_argument("--scaling-json", type=Path, help="output of `scaling.py --json`, for the scaling chart")
+    parser.add_argument("--days", nargs="+", help="only these days in the history chart, e.g. day11")
+    parser.add_argument("--out-dir", type=Path, default=ANALYSIS_DIR)
+    args = parser.parse_args(argv)
+    # not argparse `choices`, which rejects an empty `nargs="*"`
+    unknown = sorted(set(args.charts) - set(CHARTS))
+    if unknown:
+        parser.error(f"unknown charts: {', '.join(unknown)} (expected {', '.join(CHARTS)})")
+    charts = args.charts or list(CHARTS)
+
+    results = load_results(args.results)
+    data = {
+        "times": times_data(results),
+        "variability": variability_data(results),
+        "phases": phases_data(results),
+        "history": history_data(load_records(args.history), days=args.days),
+    }
+    if args.scaling_json:
+        with open(args.scaling_json, encoding="utf-8") as f:
+            data["scaling"] = scaling_data(json.load(f))
+
+    generators = {
+        "times": (generate_bar_chart, "Solve Time"),
+        "variability": (generate_timing_error_chart, "Timing Variability (Min/Median/Max)"),
+        "phases": (generate_phase_chart, "Python Time per Phase"),
+        "scaling": (generate_scaling_chart, "Time vs Input Size"),
+        "history": (generate_history_chart, "Python Median Time over Time"),
+    }
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    for chart in charts:
+        chart_data = data.get(chart)
+        if not chart_data or not any(chart_data.values()):
+            print(f"skipping {chart}: no data")
+            continue
+        generate, title = generators[chart]
+        generate(chart_data, title, args.out_dir / CHARTS[chart])
+        print(f"wrote {args.out_dir / CHARTS[chart]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
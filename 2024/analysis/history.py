@@ -0,0 +1,292 @@
+"""
+Append-only benchmark history.
+
+Every measurement becomes one line of `history.jsonl`, keyed by git commit, day,
+implementation variant (`python`, `rust`, ...), how it was timed, a hash of the input it
+ran on and a fingerprint of the machine. Nothing is ever rewritten, so any two commits measured on the same machine
+can be compared after the fact.
+
+    python history.py record 1 2 3                 # bench days in-process via aoc.py
+    python history.py compare main                 # HEAD vs main, exits 1 on a slowdown
+    python history.py compare 3308b5b df647f3 --threshold 0.1
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+ANALYSIS_DIR = Path(__file__).parent
+PYTHON_DIR = ANALYSIS_DIR.parent / "python"
+HISTORY_FILE = ANALYSIS_DIR / "history.jsonl"
+
+# a slowdown has to be both statistically significant and at least this big to count
+DEFAULT_THRESHOLD = 0.05
+DEFAULT_ALPHA = 0.01
+
+
+def git_commit(cwd=ANALYSIS_DIR):
+    """Returns (sha, dirty). A dirty tree still gets recorded, it's just marked as such."""
+    sha = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+    status = subprocess.run(
+        ["git", "status", "--porcelain", "--untracked-files=no"], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout
+    return sha, bool(status.strip())
+
+
+def resolve_commit(ref, cwd=ANALYSIS_DIR):
+    completed = subprocess.run(
+        ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"], cwd=cwd, capture_output=True, text=True
+    )
+    # fall back to treating it as a sha prefix, the commit may not exist locally anymore
+    return completed.stdout.strip() if completed.returncode == 0 else ref
+
+
+def cpu_model():
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def machine_info():
+    return {
+        "cpu": cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "arch": platform.machine(),
+        "system": platform.system(),
+        "python": platform.python_version(),
+    }
+
+
+def machine_fingerprint(info=None):
+    """Short stable id for "the same box running the same interpreter"."""
+    info = info or machine_info()
+    return hashlib.sha1(json.dumps(info, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def input_digest(input_file):
+    """Short content hash, so a run on a generated x10 input never gets compared with one on the real input."""
+    if input_file is None or not Path(input_file).exists():
+        return None
+    return hashlib.sha256(Path(input_file).read_bytes()).hexdigest()[:16]
+
+
+def make_record(day, variant, method, samples_ns, commit=None, dirty=False, input_file=None, **extra):
+    info = machine_info()
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "dirty": dirty,
+        "machine": machine_fingerprint(info),
+        "machine_info": info,
+        "day": day,
+        "variant": variant,
+        "method": method,
+        "input_file": str(input_file) if input_file is not None else None,
+        "input_digest": input_digest(input_file),
+        "samples_ns": list(samples_ns),
+        "median_ns": statistics.median(samples_ns),
+        **extra,
+    }
+
+
+def append_records(records, path=HISTORY_FILE):
+    with open(path, "a") as f:
+        for record in records:
+            f.write(json.dumps(record, sort_keys=True) + "\n")
+
+
+def load_records(path=HISTORY_FILE):
+    if not Path(path).exists():
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def record_key(record):
+    # records from before inputs were hashed only match each other
+    return record["day"], record["variant"], record["method"], record.get("input_digest")
+
+
+def latest_by_key(records, commit, machine):
+    """Most recent record per (day, variant, method, input) for one commit (or sha prefix) on one machine."""
+    latest = {}
+    for record in records:
+        if record["machine"] != machine or not (record["commit"] or "").startswith(commit):
+            continue
+        key = record_key(record)
+        if key not in latest or record["timestamp"] >= latest[key]["timestamp"]:
+            latest[key] = record
+    return latest
+
+
+def mann_whitney_greater(candidate, baseline):
+    """
+    One-sided p-value for "candidate samples tend to be larger than baseline samples".
+
+    Normal approximation with tie and continuity correction, which is reasonable from
+    around 8 samples a side - the benchmark engine takes at least 5 rounds, usually more.
+    """
+    n1, n2 = len(candidate), len(baseline)
+    pooled = sorted([(value, 0) for value in candidate] + [(value, 1) for value in baseline])
+    ranks = [0.0] * len(pooled)
+    tie_term = 0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        # average rank for the tied block, ranks are 1-based
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_value, group) in zip(ranks, pooled) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    mean_u = n1 * n2 / 2
+    var_u = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if var_u <= 0:
+        return 1.0 if u <= mean_u else 0.0
+    z = (u - mean_u - 0.5) / var_u**0.5
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+@dataclass
+class Comparison:
+    day: str
+    variant: str
+    method: str
+    input_digest: str | None
+    baseline_ns: float
+    candidate_ns: float
+    ratio: float
+    p_slower: float
+    p_faster: float
+    status: str
+
+
+def compare_records(baseline, candidate, threshold=DEFAULT_THRESHOLD, alpha=DEFAULT_ALPHA):
+    comparisons = []
+    for key in sorted(baseline.keys() & candidate.keys()):
+        base_samples = baseline[key]["samples_ns"]
+        cand_samples = candidate[key]["samples_ns"]
+        base_median = statistics.median(base_samples)
+        cand_median = statistics.median(cand_samples)
+        ratio = cand_median / base_median
+        p_slower = mann_whitney_greater(cand_samples, base_samples)
+        p_faster = mann_whitney_greater(base_samples, cand_samples)
+        if p_slower < alpha and ratio > 1 + threshold:
+            status = "slower"
+        elif p_faster < alpha and ratio < 1 - threshold:
+            status = "faster"
+        else:
+            status = "same"
+        comparisons.append(Comparison(*key, base_median, cand_median, ratio, p_slower, p_faster, status))
+    return comparisons
+
+
+def format_comparison(comparison):
+    p_value = comparison.p_faster if comparison.status == "faster" else comparison.p_slower
+    input_label = f" [input {comparison.input_digest[:8]}]" if comparison.input_digest else ""
+    return (
+        f"{comparison.day} {comparison.variant}/{comparison.method}{input_label}: "
+        f"{comparison.baseline_ns / 1e6:.3f} ms -> {comparison.candidate_ns / 1e6:.3f} ms "
+        f"({(comparison.ratio - 1) * 100:+.1f}%, p={p_value:.3g}) {comparison.status.upper()}"
+    )
+
+
+def record_python(days, variant="python", inputs_dir=None, history_file=HISTORY_FILE):
+    """Benchmarks the days in one warm process through aoc.py and appends one record per day."""
+    inputs_args = ["--inputs-dir", str(Path(inputs_dir).resolve())] if inputs_dir else []
+    completed = subprocess.run(
+        [sys.executable, "aoc.py", *days, "--bench", "--json", *inputs_args],
+        cwd=PYTHON_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if not completed.stdout.strip():
+        raise RuntimeError(f"aoc.py produced no report:\n{completed.stderr}")
+    report = json.loads(completed.stdout)
+    commit, dirty = git_commit()
+    records = []
+    for day in report["days"]:
+        if day["error"]:
+            print(f"skipping {day['day']}: {day['error']}", file=sys.stderr)
+            continue
+        bench = day["benchmark"]
+        records.append(
+            make_record(
+                day["day"],
+                variant,
+                "in-process",
+                bench["samples_ns"],
+                commit=commit,
+                dirty=dirty,
+                input_file=day["input_file"],
+                loops=bench["loops"],
+            )
+        )
+    append_records(records, history_file)
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Append-only benchmark history and regression checks.")
+    parser.add_argument("--history", type=Path, default=HISTORY_FILE)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record = subparsers.add_parser("record", help="benchmark python days and append them to the history")
+    record.add_argument("days", nargs="*", help="days to record (default: all)")
+    record.add_argument("--variant", default="python", help="label for the implementation being measured")
+    record.add_argument("--inputs-dir", type=Path, default=None, help="passed through to aoc.py")
+
+    compare = subparsers.add_parser("compare", help="compare a run against a baseline, exits 1 on a slowdown")
+    compare.add_argument("baseline", help="baseline commit / ref")
+    compare.add_argument("candidate", nargs="?", default="HEAD", help="candidate commit / ref (default: HEAD)")
+    compare.add_argument("--machine", default=None, help="machine fingerprint (default: this machine)")
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="minimum relative slowdown")
+    compare.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="significance level")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        records = record_python(args.days, args.variant, args.inputs_dir, args.history)
+        commit = records[0]["commit"][:10] if records else "?"
+        print(f"Recorded {len(records)} day(s) at {commit} on {machine_fingerprint()} to {args.history}")
+        return 0
+
+    records = load_records(args.history)
+    machine = args.machine or machine_fingerprint()
+    baseline = latest_by_key(records, resolve_commit(args.baseline), machine)
+    candidate = latest_by_key(records, resolve_commit(args.candidate), machine)
+    if not baseline or not candidate:
+        missing = args.baseline if not baseline else args.candidate
+        print(f"error: no history for {missing} on machine {machine}", file=sys.stderr)
+        return 2
+
+    comparisons = compare_records(baseline, candidate, args.threshold, args.alpha)
+    if not comparisons:
+        print("error: baseline and candidate have no (day, variant, method, input) in common", file=sys.stderr)
+        return 2
+    for comparison in comparisons:
+        print(format_comparison(comparison))
+    return 1 if any(comparison.status == "slower" for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
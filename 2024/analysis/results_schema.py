@@ -0,0 +1,161 @@
+"""
+The results.json schema: every duration is a number of nanoseconds in a key ending in `_ns`.
+
+The hand-written entries used to be strings like "201.845µs" or "6.682449s" (sometimes a
+dict of them per part), and collect_metrics used to write seconds. `normalize_results`
+turns either into the current shape, so old files keep working:
+
+    "python": {
+        "avg_time_ns": 201845,                          # or {"pt1": ..., "pt2": ...}
+        "measured": {
+            "startup_time": {"mean_ns": ..., "median_ns": ..., "stdev_ns": ..., "min_ns": ..., "max_ns": ...},
+            "import_time": {...},
+            "solve_time": {...},
+            "phases_ns": {"parse": ..., "part1": ...},
+        },
+    }
+
+    python results_schema.py            # rewrite results.json in the current shape
+"""
+
+import argparse
+import copy
+import json
+import re
+import sys
+from pathlib import Path
+
+RESULTS_FILE = Path(__file__).parent / "results.json"
+
+DURATION_PATTERN = re.compile(r"^\s*([\d.]+(?:[eE][-+]?\d+)?)\s*(ns|µs|us|ms|s)\s*$")
+NS_PER_UNIT = {"ns": 1, "µs": 1e3, "us": 1e3, "ms": 1e6, "s": 1e9}
+
+# what collect_metrics wrote (in seconds) before everything was nanoseconds
+LEGACY_SECONDS_KEYS = ("mean", "median", "stdev", "min", "max")
+MEASURED_TIMINGS = ("startup_time", "import_time", "solve_time", "process_time")
+
+
+def parse_duration_ns(text):
+    """`"201.845µs"` -> `201845`, whole nanoseconds come back as ints."""
+    match = DURATION_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Not a duration: {text!r}")
+    value, unit = match.groups()
+    return _ns_number(float(value) * NS_PER_UNIT[unit])
+
+
+def _ns_number(ns):
+    # float maths leaves 201844.99999999997 for "201.845µs"
+    rounded = round(ns, 3)
+    return int(rounded) if rounded.is_integer() else rounded
+
+
+def _avg_time_ns(value):
+    if isinstance(value, dict):
+        return {part: _avg_time_ns(part_value) for part, part_value in value.items()}
+    if isinstance(value, str):
+        return parse_duration_ns(value)
+    return value
+
+
+def _timing_ns(timing):
+    """A measured timing block, converting the old seconds keys if that's what it has."""
+    converted = {}
+    for key, value in timing.items():
+        if key in LEGACY_SECONDS_KEYS:
+            converted[f"{key}_ns"] = _ns_number(value * 1e9)
+        else:
+            converted[key] = value
+    return converted
+
+
+def normalize_entry(entry):
+    # rebuilt key by key so the renamed ones stay where they were in the file
+    entry = {
+        ("avg_time_ns" if key == "avg_time" else key): (_avg_time_ns(value) if key == "avg_time" else value)
+        for key, value in copy.deepcopy(entry).items()
+    }
+    measured = entry.get("measured")
+    if measured:
+        for key in MEASURED_TIMINGS:
+            if isinstance(measured.get(key), dict):
+                measured[key] = _timing_ns(measured[key])
+    return entry
+
+
+def normalize_results(results):
+    normalized = {}
+    for day, day_entry in results.items():
+        day_entry = dict(day_entry)
+        for language in ("python", "rust"):
+            if isinstance(day_entry.get(language), dict):
+                day_entry[language] = normalize_entry(day_entry[language])
+        normalized[day] = day_entry
+    return normalized
+
+
+def load_results(path=RESULTS_FILE):
+    if not Path(path).exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return normalize_results(json.load(f))
+
+
+def save_results(results, path=RESULTS_FILE):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def _fastest_variants(parts):
+    # hand-written parts are either pt1 / pt2 or alternatives for each, like pt1_regex / pt1_iter
+    fastest = {}
+    for name, value in parts.items():
+        part = name.split("_", 1)[0]
+        fastest[part] = min(value, fastest.get(part, value))
+    return fastest
+
+
+def headline_ns(entry):
+    """The one number for a language's solution: the measured solve time, else the hand-written one."""
+    if not entry:
+        return None
+    solve_time = entry.get("measured", {}).get("solve_time")
+    if solve_time:
+        return solve_time.get("median_ns", solve_time.get("mean_ns"))
+    avg_time = entry.get("avg_time_ns")
+    if isinstance(avg_time, dict):
+        return sum(_fastest_variants(avg_time).values()) if avg_time else None
+    return avg_time
+
+
+def spread_ns(entry):
+    """(headline, min, max) of the measured solve time, None without a measurement that has them."""
+    solve_time = (entry or {}).get("measured", {}).get("solve_time") or {}
+    if "min_ns" not in solve_time or "max_ns" not in solve_time:
+        return None
+    return headline_ns(entry), solve_time["min_ns"], solve_time["max_ns"]
+
+
+def phases_ns(entry):
+    """Time per phase: measured spans if there are any, else the hand-written per-part times."""
+    if not entry:
+        return {}
+    measured = entry.get("measured", {}).get("phases_ns")
+    if measured:
+        return dict(measured)
+    avg_time = entry.get("avg_time_ns")
+    return _fastest_variants(avg_time) if isinstance(avg_time, dict) else {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rewrite results.json with every duration in nanoseconds.")
+    parser.add_argument("path", nargs="?", type=Path, default=RESULTS_FILE)
+    args = parser.parse_args(argv)
+    save_results(load_results(args.path), args.path)
+    print(f"Rewrote {args.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+How much do the coordinate types cost as dict keys and heap entries?
+
+    python adhoc/bench_points.py
+    python adhoc/bench_points.py --size 200 --repeat 7
+
+Every variant does the same work on a size x size grid of (x, y, direction) states:
+build them, put them all in a dict, look each one up, and push / pop them through a heap
+as (cost, state) pairs the way the searches in day16 / day18 / day20 do.
+"""
+
+import argparse
+import heapq
+import sys
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from input_util import (  # noqa: E402
+    DIRECTION_NAMES,
+    DirectionType,
+    PointWDirection,
+    PointWDirectionTuple,
+    pack_state,
+    pack_xy,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SlottedPointWDirection:
+    x: int
+    y: int
+    direction: DirectionType
+
+    def __lt__(self, other: "SlottedPointWDirection") -> bool:
+        return (self.x, self.y, self.direction) < (other.x, other.y, other.direction)
+
+
+def make_states(size: int, variant: str) -> list:
+    if variant == "packed int":
+        return [pack_state(pack_xy(x, y, size), d) for y in range(size) for x in range(size) for d in range(4)]
+    cls = {
+        "dataclass": PointWDirection,
+        "slotted dataclass": SlottedPointWDirection,
+        "namedtuple": PointWDirectionTuple,
+    }[variant]
+    return [cls(x, y, DIRECTION_NAMES[d]) for y in range(size) for x in range(size) for d in range(4)]
+
+
+def dict_workload(states: list) -> int:
+    dist = {state: idx for idx, state in enumerate(states)}
+    return sum(dist[state] for state in states)
+
+
+def heap_workload(states: list) -> int:
+    heap: list = []
+    # lots of equal costs, so the states themselves get compared to break ties
+    for idx, state in enumerate(states):
+        heapq.heappush(heap, (idx % 16, state))
+    total = 0
+    while heap:
+        total += heapq.heappop(heap)[0]
+    return total
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmark of coordinate types as keys / heap entries.")
+    parser.add_argument("--size", type=int, default=141, help="grid side length (141 is a real day16 map)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    variants = ["dataclass", "slotted dataclass", "namedtuple", "packed int"]
+    print(f"{args.size}x{args.size} grid, {args.size * args.size * 4} states, best of {args.repeat}")
+    print(f"{'variant':<20}{'build':>16}{'dict':>16}{'heap':>16}")
+    baseline: tuple[float, ...] = ()
+    for variant in variants:
+        build = min(timeit.repeat(lambda: make_states(args.size, variant), number=1, repeat=args.repeat))
+        states = make_states(args.size, variant)
+        dict_time = min(timeit.repeat(lambda: dict_workload(states), number=1, repeat=args.repeat))
+        heap_time = min(timeit.repeat(lambda: heap_workload(states), number=1, repeat=args.repeat))
+        timings = (build, dict_time, heap_time)
+        baseline = baseline or timings
+        # speedup is relative to the frozen dataclass the days use today
+        cells = "".join(f"{t * 1e3:>9.1f} ms {base / t:>3.1f}x" for t, base in zip(timings, baseline))
+        print(f"{variant:<20}{cells}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+The per-day searches over `Point` objects vs the same searches through grid_search.
+
+    python adhoc/bench_search.py
+    python adhoc/bench_search.py --inputs-dir ../inputs/generated/x10 --repeat 3
+
+Only the search itself is timed (the grids are built beforehand), and each pair has to
+agree on its answer before its timing is printed.
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import day16  # noqa: E402
+import day18  # noqa: E402
+import day20  # noqa: E402
+from input_util import (  # noqa: E402
+    Grid,
+    convert_to_point_matrix,
+    convert_to_point_matrix_old,
+    parse_input_as_matrix,
+)
+
+INPUTS_DIR = Path(__file__).resolve().parent.parent.parent / "inputs"
+
+# (name, original, grid_search version, how to compare the two results)
+Case = tuple[str, Callable[[], Any], Callable[[], Any], Callable[[Any, Any], bool]]
+
+
+def day16_cases(input_file: Path) -> list[Case]:
+    matrix = parse_input_as_matrix(input_file.read_text(), "str")
+    reindeer_map = convert_to_point_matrix_old(matrix)
+    start_loc, end_loc = day16.find_starting_and_end_location(reindeer_map)
+    grid = Grid.from_matrix(matrix)
+    return [
+        (
+            "day16 modified_dijkstras_exploration",
+            lambda: day16.modified_dijkstras_exploration(reindeer_map, start_loc, end_loc),
+            lambda: day16.modified_dijkstras_exploration_v2(grid, grid.find("S"), grid.find("E")),
+            # the original's score is whichever end state it popped last, the seats are comparable
+            lambda old, new: len(old[2]) == len(new[2]),
+        )
+    ]
+
+
+def day18_cases(input_file: Path) -> list[Case]:
+    memory_range = day18.MEMORY_RANGE
+    matrix = [["." for _ in range(memory_range + 1)] for _ in range(memory_range + 1)]
+    day18.populate_matrix_from_input(matrix, input_file)
+    grid = Grid.from_matrix(matrix)
+    return [
+        (
+            "day18 dijkstras",
+            lambda: day18.dijkstras(matrix),
+            lambda: day18.dijkstras_v2(grid, memory_range),
+            lambda old, new: old[0] == new[0] and len(old[1]) == len(new[1]),
+        )
+    ]
+
+
+def day20_cases(input_file: Path) -> list[Case]:
+    matrix = parse_input_as_matrix(input_file.read_text(), "str")
+    race_map = convert_to_point_matrix(matrix)
+    start_loc, end_loc = day20.find_starting_and_end_location(race_map)
+    grid = Grid.from_matrix(matrix)
+    return [
+        (
+            "day20 bfs_without_cheats",
+            lambda: day20.bfs_without_cheats(race_map, start_loc, end_loc),
+            lambda: day20.bfs_without_cheats_v2(grid, start_loc, end_loc),
+            lambda old, new: old == new,
+        )
+    ]
+
+
+CASES = {"day16": day16_cases, "day18": day18_cases, "day20": day20_cases}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the per-day searches against grid_search.")
+    parser.add_argument("days", nargs="*", default=list(CASES), help=f"any of {', '.join(CASES)}")
+    parser.add_argument("--inputs-dir", type=Path, default=INPUTS_DIR)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'search':<40}{'original':>14}{'grid_search':>14}{'speedup':>10}")
+    exit_code = 0
+    for day in args.days:
+        input_file = args.inputs_dir / f"{day}.txt"
+        if not input_file.exists():
+            print(f"{day}: no input at {input_file}")
+            continue
+        for name, original, rewritten, same in CASES[day](input_file):
+            if not same(original(), rewritten()):
+                print(f"{name}: results differ")
+                exit_code = 1
+                continue
+            original_time = min(timeit.repeat(original, number=1, repeat=args.repeat))
+            rewritten_time = min(timeit.repeat(rewritten, number=1, repeat=args.repeat))
+            print(
+                f"{name:<40}{original_time * 1e3:>11.2f} ms{rewritten_time * 1e3:>11.2f} ms"
+                f"{original_time / rewritten_time:>9.1f}x"
+            )
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""
+Single entry point for running any set of days in one warm process.
+
+    python aoc.py 1 2 3
+    python aoc.py --all --json
+    python aoc.py 18 --input day18=../inputs/day18_small.txt
+    python aoc.py --all --inputs-dir ../inputs/examples
+    python aoc.py 1 2 3 --bench --json
+    python aoc.py 22 --memory
+    python aoc.py 20 --profile --collapsed-dir /tmp/flame
+    python aoc.py 13 14 17 24 --bench --imports
+    python aoc.py --all --jobs 4 --timeout 60
+    python aoc.py --all --cache
+    python aoc.py 12 --trace debug
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import cache_util
+import counter_util
+import trace_util
+from parallel import run_days_parallel
+from profile_util import ProfileConfig, format_import_profile, format_profile
+from registry import DayResult, discover_days, normalize_day, run_day
+from timing_util import (
+    BenchmarkConfig,
+    TimeUnit,
+    format_benchmark_details,
+    format_memory_details,
+    format_phase_breakdown,
+)
+
+
+def parse_input_overrides(raw_overrides: list[str], days: list[str], inputs_dir: Path | None) -> dict[str, Path]:
+    """`--input` is either `dayNN=path` or, when only one day is selected, just `path`."""
+    overrides: dict[str, Path] = {day: inputs_dir / f"{day}.txt" for day in days} if inputs_dir else {}
+    for raw in raw_overrides:
+        if "=" in raw:
+            day, path = raw.split("=", 1)
+            overrides[normalize_day(day)] = Path(path)
+        elif len(days) == 1:
+            overrides[days[0]] = Path(raw)
+        else:
+            raise ValueError(f"--input {raw!r} is ambiguous with multiple days, use dayNN=path")
+    return overrides
+
+
+def select_days(requested: list[str], run_all: bool) -> list[str]:
+    available = discover_days()
+    if run_all or not requested:
+        return list(available)
+    days = [normalize_day(day) for day in requested]
+    missing = [day for day in days if day not in available]
+    if missing:
+        raise ValueError(f"No solution module for: {', '.join(missing)}")
+    return days
+
+
+def format_result(result: DayResult) -> str:
+    if not result.ok:
+        return f"{result.day}: ERROR {result.error}"
+    assert result.elapsed_ns is not None
+    cached = ", cached" if result.cached else ""
+    line = f"{result.day}: {result.answers} ({result.elapsed_ns / 1_000_000:.3f} ms{cached})"
+    phases = {}
+    if result.benchmark:
+        line += f"\n    {format_benchmark_details(result.benchmark, TimeUnit.MILLISECONDS)}"
+        phases = result.benchmark.phases
+    if result.memory:
+        line += f"\n    {format_memory_details(result.memory)}"
+    if result.imports:
+        line += f"\n    {format_import_profile(result.imports)}"
+    counters = result.benchmark.counters if result.benchmark else result.counters
+    if counters:
+        line += f"\n    {counter_util.format_counters(counters)}"
+    for phase_line in format_phase_breakdown(phases, result.elapsed_ns, result.memory, TimeUnit.MILLISECONDS):
+        line += f"\n      {phase_line}"
+    if result.profile:
+        # the headline number above is already the profiled run
+        for profile_line in format_profile(result.profile)[1:]:
+            line += f"\n    {profile_line}"
+    return line
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run Advent of Code 2024 solutions in-process.")
+    parser.add_argument("days", nargs="*", help="days to run, e.g. `1`, `01` or `day01` (default: all)")
+    parser.add_argument("--all", action="store_true", help="run every discovered day")
+    parser.add_argument(
+        "--input",
+        action="append",
+        default=[],
+        metavar="[DAY=]PATH",
+        help="override the input file for a day (repeatable)",
+    )
+    parser.add_argument(
+        "--inputs-dir", type=Path, default=None, help="look for `dayNN.txt` here instead of the default inputs dir"
+    )
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON to stdout")
+    parser.add_argument(
+        "--cache", action="store_true", help="reuse parsed inputs and answers from the on-disk cache when unchanged"
+    )
+    parser.add_argument("--clear-cache", action="store_true", help="empty the on-disk cache before running")
+    parser.add_argument(
+        "--trace", default=None, metavar="LEVEL", help="show the days' debug output on stderr (info, debug or trace)"
+    )
+
+    pool = parser.add_argument_group("parallel runs")
+    pool.add_argument(
+        "--jobs", type=int, default=1, help="run days across this many processes (0: one per available CPU)"
+    )
+    pool.add_argument("--timeout", type=float, default=None, help="seconds each day gets before it's cut off")
+    pool.add_argument(
+        "--pin-cpus", action="store_true", help="pin each worker process to its own CPU (Linux only)"
+    )
+
+    bench = parser.add_argument_group("benchmarking")
+    bench.add_argument("--bench", action="store_true", help="time each day with the benchmark engine")
+    bench.add_argument("--warmup", type=int, default=BenchmarkConfig.warmup_rounds, help="warmup rounds per day")
+    bench.add_argument("--rounds", type=int, default=None, help="fix the number of rounds (default: adaptive)")
+    bench.add_argument(
+        "--bench-time", type=float, default=BenchmarkConfig.target_time, help="seconds of measurement per day"
+    )
+    bench.add_argument("--keep-gc", action="store_true", help="leave the garbage collector on while measuring")
+    bench.add_argument(
+        "--memory", action="store_true", help="also measure peak memory / allocations with an extra traced run"
+    )
+
+    profile = parser.add_argument_group("profiling")
+    profile.add_argument(
+        "--imports", action="store_true", help="time importing each day in a fresh interpreter (-X importtime)"
+    )
+    profile.add_argument("--profile", action="store_true", help="run each day under cProfile instead of timing it")
+    profile.add_argument(
+        "--profile-top", type=int, default=ProfileConfig.top_n, help="how many functions to list per table"
+    )
+    profile.add_argument(
+        "--collapsed-dir",
+        type=Path,
+        default=None,
+        help="write `dayNN.collapsed` flamegraph stacks here (costs one extra run per day)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    try:
+        days = select_days(args.days, args.all)
+        overrides = parse_input_overrides(args.input, days, args.inputs_dir)
+        if args.trace:
+            trace_util.set_level(args.trace)
+            os.environ["AOC_TRACE"] = args.trace
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    if args.clear_cache:
+        cache_util.clear_cache()
+    if args.cache:
+        cache_util.set_enabled(True)
+        # for --jobs workers that start fresh rather than forking
+        os.environ["AOC_CACHE"] = "1"
+
+    bench_config = None
+    if args.bench:
+        bench_config = BenchmarkConfig(
+            warmup_rounds=args.warmup,
+            rounds=args.rounds,
+            target_time=args.bench_time,
+            disable_gc=not args.keep_gc,
+            track_memory=args.memory,
+        )
+
+    profile_configs: dict[str, ProfileConfig | None] = {}
+    for day in days:
+        profile_configs[day] = None
+        if args.profile:
+            collapsed_path = args.collapsed_dir / f"{day}.collapsed" if args.collapsed_dir else None
+            profile_configs[day] = ProfileConfig(top_n=args.profile_top, collapsed_path=collapsed_path)
+
+    start = time.perf_counter_ns()
+    results: list[DayResult] = []
+    if args.jobs != 1 or args.timeout is not None:
+        results = run_days_parallel(
+            days,
+            overrides,
+            jobs=args.jobs,
+            timeout=args.timeout,
+            pin_cpus=args.pin_cpus,
+            day_kwargs={day: {"profile_config": profile_configs[day]} for day in days},
+            bench_config=bench_config,
+            track_memory=args.memory,
+            measure_imports=args.imports,
+        )
+        if not args.json:
+            for result in results:
+                print(format_result(result))
+    else:
+        for day in days:
+            # the solutions print a lot - keep stdout clean for the JSON report
+            redirect = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+            with redirect:
+                result = run_day(
+                    day,
+                    overrides.get(day),
+                    bench_config,
+                    track_memory=args.memory,
+                    profile_config=profile_configs[day],
+                    measure_imports=args.imports,
+                )
+            results.append(result)
+            if not args.json:
+                print(format_result(result))
+    wall_elapsed_ns = time.perf_counter_ns() - start
+    total_elapsed_ns = sum(result.elapsed_ns or 0 for result in results)
+
+    if args.json:
+        report = {
+            "days": [result.to_dict() for result in results],
+            "total_elapsed_ns": total_elapsed_ns,
+            "wall_elapsed_ns": wall_elapsed_ns,
+        }
+        print(json.dumps(report, indent=2))
+    elif len(results) > 1:
+        print(f"{len(results)} days: {total_elapsed_ns / 1e9:.3f} s of solving in {wall_elapsed_ns / 1e9:.3f} s wall")
+
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
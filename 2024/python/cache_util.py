@@ -0,0 +1,185 @@
+"""
+Content-addressed on-disk cache for parsed inputs and answers.
+
+Entries are keyed by a hash of the arguments (file *contents* for paths) plus a hash of the
+source of the module doing the work and the local modules it uses, so editing either the
+input or the code is a miss. Values are pickled.
+
+    @disk_cached
+    def parse_input(input_file: Path) -> ...:
+
+It's off unless asked for (`aoc.py --cache`, or `AOC_CACHE=1`), since a benchmark of a
+cache hit isn't measuring much.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterator, TypeVar
+
+PYTHON_DIR = Path(__file__).parent
+CACHE_DIR = Path(os.environ.get("AOC_CACHE_DIR", PYTHON_DIR / ".cache"))
+# bump when the key or value layout changes
+CACHE_FORMAT_VERSION = 1
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_enabled = os.environ.get("AOC_CACHE", "") not in ("", "0")
+# (path, mtime_ns, size) -> sha256, so a benchmark loop doesn't re-hash the same file
+_file_digests: dict[tuple[str, int, int], str] = {}
+_source_digests: dict[str, str] = {}
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    global _enabled
+    _enabled = enabled
+
+
+@contextmanager
+def caching(enabled: bool = True) -> Iterator[None]:
+    previous = _enabled
+    set_enabled(enabled)
+    try:
+        yield
+    finally:
+        set_enabled(previous)
+
+
+def file_digest(path: Path) -> str:
+    stat = path.stat()
+    stat_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    if stat_key not in _file_digests:
+        _file_digests[stat_key] = hashlib.sha256(path.read_bytes()).hexdigest()
+    return _file_digests[stat_key]
+
+
+def _is_local(module: ModuleType | None) -> bool:
+    module_file = getattr(module, "__file__", None)
+    return module_file is not None and Path(module_file).resolve().parent == PYTHON_DIR.resolve()
+
+
+def local_dependencies(module: ModuleType) -> list[ModuleType]:
+    """
+    `module` plus every module from this directory it pulls names from (input_util, ...),
+    and the ones those pull from in turn, so an edit to grid_search counts for the days
+    that only get to it through another module.
+    """
+    deps = {module.__name__: module}
+    pending = [module]
+    while pending:
+        for dep in local_imports(pending.pop()):
+            if dep.__name__ not in deps:
+                deps[dep.__name__] = dep
+                pending.append(dep)
+    return [deps[name] for name in sorted(deps)]
+
+
+def local_imports(module: ModuleType) -> list[ModuleType]:
+    """Just the modules from this directory that `module` itself pulls names from."""
+    deps = {}
+    for value in vars(module).values():
+        name = value.__name__ if isinstance(value, ModuleType) else getattr(value, "__module__", None)
+        dep = sys.modules.get(name) if isinstance(name, str) else None
+        if dep is not None and dep is not module and _is_local(dep):
+            deps[dep.__name__] = dep
+    return list(deps.values())
+
+
+def source_digest(module_name: str) -> str:
+    """
+    Worked out once per process: the code that runs is whatever was imported, even if the
+    file has been edited since (the long-lived worker, say).
+    """
+    if module_name not in _source_digests:
+        digest = hashlib.sha256()
+        for dep in local_dependencies(sys.modules[module_name]):
+            module_file = getattr(dep, "__file__", None)
+            if module_file:
+                digest.update(file_digest(Path(module_file)).encode())
+        _source_digests[module_name] = digest.hexdigest()
+    return _source_digests[module_name]
+
+
+def forget_source_digests() -> None:
+    """For after reloading edited modules, so `source_digest` hashes what's running now."""
+    _source_digests.clear()
+
+
+def _arg_digest(value: Any) -> str:
+    if isinstance(value, Path):
+        return f"file:{file_digest(value)}"
+    if isinstance(value, str):
+        return f"str:{hashlib.sha256(value.encode()).hexdigest()}"
+    return f"pickle:{hashlib.sha256(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)).hexdigest()}"
+
+
+def cache_key(namespace: str, module_name: str, *args: Any, **kwargs: Any) -> str:
+    digest = hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{namespace}:{source_digest(module_name)}".encode())
+    for arg in args:
+        digest.update(_arg_digest(arg).encode())
+    for name in sorted(kwargs):
+        digest.update(f"{name}={_arg_digest(kwargs[name])}".encode())
+    return digest.hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return CACHE_DIR / key[:2] / f"{key}.pickle"
+
+
+def load(key: str) -> tuple[bool, Any]:
+    path = _entry_path(key)
+    try:
+        with open(path, "rb") as f:
+            return True, pickle.load(f)
+    except FileNotFoundError:
+        return False, None
+    except Exception:  # noqa: BLE001 - a truncated or stale entry is just a miss
+        path.unlink(missing_ok=True)
+        return False, None
+
+
+def store(key: str, value: Any) -> None:
+    path = _entry_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # write then rename, so a reader (or a parallel run) never sees half an entry
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def disk_cached(func: F) -> F:
+    """Caches `func`'s return value on disk while caching is enabled, a plain call otherwise."""
+    namespace = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        key = cache_key(namespace, func.__module__, *args, **kwargs)
+        hit, value = load(key)
+        if hit:
+            return value
+        value = func(*args, **kwargs)
+        store(key, value)
+        return value
+
+    return wrapper  # type: ignore[return-value]
+
+
+def clear_cache() -> int:
+    removed = 0
+    if CACHE_DIR.exists():
+        for path in CACHE_DIR.glob("*/*.pickle"):
+            path.unlink()
+            removed += 1
+    return removed
@@ -0,0 +1,150 @@
+"""
+Counts of algorithm-level work: nodes expanded, heap pushes / pops, revisits, memo hits.
+
+Wall time on a laptop is noisy, the number of states a search had to expand isn't, so
+the benchmark output reports these next to the timings:
+
+    from counter_util import HEAP_PUSHES, NODES_EXPANDED, count
+
+    count(HEAP_PUSHES)
+    count(NODES_EXPANDED, expanded)
+
+Like `span`, a `count` while nothing is recording is a global lookup and nothing else, but
+that's still a function call, so inside a tight loop keep a local int and hand the total
+over once at the end.
+
+`functools.lru_cache` / `memo` functions don't need any of that: `registry.run_day` watches
+every module level cache of the day it loads, and each recording adds the hits / misses the
+caches picked up while it was running (as `<function>.hits` / `<function>.misses`, plus
+`<function>.evictions` for a `memo`).
+Caches that only live for one call (a memoized helper defined inside a function) can be
+reported with `count_cache` before they go out of scope.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Any, Callable, Iterator
+
+# the usual names, any string works as a counter
+NODES_EXPANDED = "nodes_expanded"
+HEAP_PUSHES = "heap_pushes"
+HEAP_POPS = "heap_pops"
+QUEUE_PUSHES = "queue_pushes"
+# popped again after it was already settled more cheaply
+REVISITS = "revisits"
+
+CACHE_HITS_SUFFIX = ".hits"
+CACHE_MISSES_SUFFIX = ".misses"
+# only `memo` caches count these, `lru_cache` doesn't say
+CACHE_EVICTIONS_SUFFIX = ".evictions"
+
+# name -> lru_cache wrapped function, see `watch_caches`
+_watched_caches: dict[str, Callable[..., Any]] = {}
+
+
+def find_caches(module: ModuleType) -> dict[str, Callable[..., Any]]:
+    """The `lru_cache` / `cache` / `memo` functions defined at the top level of `module` (not imported into it)."""
+    caches = {}
+    for name, obj in vars(module).items():
+        if callable(getattr(obj, "cache_info", None)) and getattr(obj, "__module__", None) == module.__name__:
+            caches[name] = obj
+    return caches
+
+
+def watch_caches(caches: dict[str, Callable[..., Any]]) -> None:
+    _watched_caches.update(caches)
+
+
+def unwatch_caches() -> None:
+    _watched_caches.clear()
+
+
+class CounterRecorder:
+    """
+    Totals of every `count` made while it's recording, plus the hits / misses of the
+    watched caches. It can be started and stopped any number of times and keeps adding up.
+    """
+
+    def __init__(self) -> None:
+        self.counts: dict[str, int] = defaultdict(int)
+        self._cache_start: dict[str, tuple[int, int, int | None]] = {}
+
+    def start(self) -> None:
+        self._cache_start = {}
+        for name, func in _watched_caches.items():
+            info = func.cache_info()
+            self._cache_start[name] = (info.hits, info.misses, getattr(info, "evictions", None))
+
+    def stop(self) -> None:
+        for name, (start_hits, start_misses, start_evictions) in self._cache_start.items():
+            info = _watched_caches[name].cache_info()
+            # a cache some other day used doesn't move, so it doesn't show up
+            if info.hits != start_hits or info.misses != start_misses:
+                self.counts[name + CACHE_HITS_SUFFIX] += info.hits - start_hits
+                self.counts[name + CACHE_MISSES_SUFFIX] += info.misses - start_misses
+                if start_evictions is not None and info.evictions != start_evictions:
+                    self.counts[name + CACHE_EVICTIONS_SUFFIX] += info.evictions - start_evictions
+        self._cache_start = {}
+
+
+_active_recorder: CounterRecorder | None = None
+
+
+def enabled() -> bool:
+    return _active_recorder is not None
+
+
+def count(name: str, n: int = 1) -> None:
+    recorder = _active_recorder
+    if recorder is not None:
+        recorder.counts[name] += n
+
+
+def count_cache(name: str, func: Callable[..., Any]) -> None:
+    """Adds everything an (unwatched) `lru_cache` function has seen so far."""
+    recorder = _active_recorder
+    if recorder is not None:
+        info = func.cache_info()
+        recorder.counts[name + CACHE_HITS_SUFFIX] += info.hits
+        recorder.counts[name + CACHE_MISSES_SUFFIX] += info.misses
+
+
+@contextmanager
+def record_counters(recorder: CounterRecorder | None = None) -> Iterator[CounterRecorder]:
+    global _active_recorder
+    recorder = recorder or CounterRecorder()
+    previous = _active_recorder
+    _active_recorder = recorder
+    recorder.start()
+    try:
+        yield recorder
+    finally:
+        recorder.stop()
+        _active_recorder = previous
+
+
+def format_counters(counters: dict[str, float]) -> str:
+    """`counters: heap_pops 1,204, count_stones 3,612 hits / 120 misses (96.8%), ...`"""
+
+    def fmt(value: float) -> str:
+        return f"{value:,.0f}" if float(value).is_integer() else f"{value:,.1f}"
+
+    parts = []
+    for name, value in sorted(counters.items()):
+        if name.endswith((CACHE_MISSES_SUFFIX, CACHE_EVICTIONS_SUFFIX)):
+            # these always come in with the hits, they're shown on the same entry
+            continue
+        if name.endswith(CACHE_HITS_SUFFIX):
+            cache_name = name.removesuffix(CACHE_HITS_SUFFIX)
+            misses = counters.get(cache_name + CACHE_MISSES_SUFFIX, 0)
+            calls = value + misses
+            hit_rate = value / calls if calls else 0.0
+            entry = f"{cache_name} {fmt(value)} hits / {fmt(misses)} misses ({hit_rate:.1%})"
+            evictions = counters.get(cache_name + CACHE_EVICTIONS_SUFFIX)
+            if evictions:
+                entry += f" {fmt(evictions)} evicted"
+            parts.append(entry)
+        else:
+            parts.append(f"{name} {fmt(value)}")
+    return f"counters: {', '.join(parts)}"
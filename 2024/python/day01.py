@@ -55,6 +55,7 @@ import heapq
 from collections import defaultdict
 from pathlib import Path
 
+from input_util import MappedInput
 from timing_util import TimeUnit, TimingOptions, time_solution
 
 
@@ -64,12 +65,13 @@ def soln_easy(input_file: Path) -> tuple[int, int]:
     right: list[int] = []
     right_map = defaultdict(int)
 
-    with open(input_file, "r") as f:
-        for line in f:
-            a, b = map(int, line.strip().split())
-            left.append(a)
-            right.append(b)
-            right_map[b] += 1  # for part2
+    # mmap + a chunk of ints at a time, so a multi-GB list never has to fit in memory as text
+    with MappedInput(input_file) as mapped:
+        for numbers in mapped.int_chunks(whitespace_separated=True):
+            left += numbers[::2]
+            right += numbers[1::2]
+    for b in right:
+        right_map[b] += 1  # for part2
     left.sort()
     right.sort()
     list_distance_diff = 0
@@ -86,12 +88,13 @@ def soln(input_file: Path) -> tuple[int, int]:
     right_heap: list[int] = []
     right_map = defaultdict(int)
 
-    with open(input_file, "r") as f:
-        for line in f:
-            a, b = map(int, line.strip().split())
-            heapq.heappush(left_heap, a)
-            heapq.heappush(right_heap, b)
-            right_map[b] += 1  # for part2
+    with MappedInput(input_file) as mapped:
+        # chunks end on a line boundary, so every chunk holds whole (left, right) pairs
+        for numbers in mapped.int_chunks(whitespace_separated=True):
+            for a, b in zip(numbers[::2], numbers[1::2]):
+                heapq.heappush(left_heap, a)
+                heapq.heappush(right_heap, b)
+                right_map[b] += 1  # for part2
     list_distance_diff = 0
     list_similarity_score = 0
     while left_heap:
@@ -127,9 +130,8 @@ if __name__ == "__main__":
         "day01",
         soln_easy,
         input_file,
-        method=TimingOptions.TIMEIT,
+        method=TimingOptions.BENCHMARK,
         unit=TimeUnit.MICROSECONDS,
-        iterations=10,
     )
 
     # compare_functions(
@@ -138,7 +140,7 @@ if __name__ == "__main__":
     #         ("Sort Solution", soln_easy),
     #     ],
     #     input_file,
-    #     method=TimingOptions.TIMEIT,  # Options: perf_counter, timeit, average
+    #     method=TimingOptions.TIMEIT,  # Options: perf_counter, timeit, average, benchmark
     #     unit=TimeUnit.MILLISECONDS,  # Change to TimeUnit.NANOSECONDS or TimeUnit.SECONDS as needed
     #     iterations=10,  # Only relevant for "average"
     # )
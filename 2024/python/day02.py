@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from input_util import Coordinate
+from input_util import Coordinate, extract_ints
 from timing_util import TimeUnit, TimingOptions, time_solution
 
 
@@ -76,13 +76,11 @@ def is_report_safe_with_one_allowed(report_line: list[int]) -> bool:
 def soln(input_file: Path) -> Coordinate:
     safe_reports = 0
     safe_reports_with_one_allowed = 0
-    with open(input_file, "r") as f:
-        for line in f:
-            report_line = list(map(int, line.strip().split()))
-            if is_report_safe(report_line):
-                safe_reports += 1
-            if is_report_safe_with_one_allowed(report_line):
-                safe_reports_with_one_allowed += 1
+    for report_line in extract_ints(input_file, per_line=True):
+        if is_report_safe(report_line):
+            safe_reports += 1
+        if is_report_safe_with_one_allowed(report_line):
+            safe_reports_with_one_allowed += 1
     return safe_reports, safe_reports_with_one_allowed
 
 
@@ -93,7 +91,6 @@ if __name__ == "__main__":
         "day02",
         soln,
         input_file,
-        method=TimingOptions.TIMEIT,
+        method=TimingOptions.BENCHMARK,
         unit=TimeUnit.MICROSECONDS,
-        iterations=10,
     )
@@ -1,7 +1,11 @@
 import re
 from pathlib import Path
 
-from timing_util import TimeUnit, TimingOptions, compare_functions, time_solution
+from input_util import MappedInput
+from timing_util import TimeUnit, TimingOptions, compare_functions, span, time_solution
+
+# same as the pt2 regex, but over bytes so it can run straight on a memory mapped file
+INSTRUCTION_BYTES_PATTERN = re.compile(rb"do\(\)|don't\(\)|mul\((\d{1,3}),(\d{1,3})\)")
 
 
 def extract_and_multiple_pt1_regex(entire_input: str) -> int:
@@ -21,22 +25,32 @@ def extract_and_multiple_pt1_regex(entire_input: str) -> int:
     return total
 
 
+def mul_product_at(entire_input: str, i: int) -> int:
+    """x * y if a `mul(X,Y)` the regex would match starts at i, else 0."""
+    if not entire_input.startswith("mul(", i):
+        return 0
+    x_start = i + 4
+    x_end = entire_input.find(",", x_start, x_start + 4)
+    if x_end == -1:
+        return 0
+    maybe_x = entire_input[x_start:x_end]
+
+    y_start = x_end + 1
+    y_end = entire_input.find(")", y_start, y_start + 4)
+    if y_end == -1:
+        return 0
+    maybe_y = entire_input[y_start:y_end]
+
+    # isdecimal is what \d matches, isdigit would let "²" through too
+    if maybe_x.isdecimal() and maybe_y.isdecimal():
+        return int(maybe_x) * int(maybe_y)
+    return 0
+
+
 def extract_and_multiple_pt1_iter(entire_input: str) -> int:
     total = 0
     for i in range(len(entire_input) - 3):
-        if entire_input[i : i + 3] == "mul":
-            x_start = i + 4
-            x_end = entire_input.find(",", x_start)
-            maybe_x = entire_input[x_start:x_end]
-
-            y_start = x_end + 1
-            y_end = entire_input.find(")", y_start)
-            maybe_y = entire_input[y_start:y_end]
-
-            if maybe_x.isdigit() and maybe_y.isdigit():
-                x = int(maybe_x)
-                y = int(maybe_y)
-                total += x * y
+        total += mul_product_at(entire_input, i)
 
     return total
 
@@ -60,23 +74,12 @@ def extract_and_multiple_pt2_iter(entire_input: str) -> int:
     are_we_live = True
     total = 0
     for i in range(len(entire_input) - 3):
-        if entire_input[i : i + 3] == "do(":
+        if entire_input.startswith("do()", i):
             are_we_live = True
-        elif entire_input[i : i + 3] == "don":
+        elif entire_input.startswith("don't()", i):
             are_we_live = False
-        elif entire_input[i : i + 3] == "mul" and are_we_live:
-            x_start = i + 4
-            x_end = entire_input.find(",", x_start)
-            maybe_x = entire_input[x_start:x_end]
-
-            y_start = x_end + 1
-            y_end = entire_input.find(")", y_start)
-            maybe_y = entire_input[y_start:y_end]
-
-            if maybe_x.isdigit() and maybe_y.isdigit():
-                x = int(maybe_x)
-                y = int(maybe_y)
-                total += x * y
+        elif are_we_live:
+            total += mul_product_at(entire_input, i)
 
     return total
 
@@ -104,10 +107,30 @@ def extract_and_multiple_pt2_regex(entire_input: str) -> int:
     return total
 
 
+def extract_and_multiple_pt2_mapped(mapped: MappedInput) -> int:
+    """
+    `extract_and_multiple_pt2_regex` without reading the file into a string first, the regex
+    walks the mapping and only the matches get copied out.
+    """
+    total = 0
+    are_we_live = True
+    for match in mapped.finditer(INSTRUCTION_BYTES_PATTERN):
+        instruction = match.group(0)
+        if instruction == b"do()":
+            are_we_live = True
+        elif instruction == b"don't()":
+            are_we_live = False
+        elif are_we_live:
+            total += int(match.group(1)) * int(match.group(2))
+    return total
+
+
 def soln(input_file: Path) -> int:
-    with open(input_file, "r") as f:
-        entire_input = f.read()
-    rez = extract_and_multiple_pt2_regex(entire_input)
+    with span("parse"):
+        mapped = MappedInput(input_file)
+    # the pages only get read in as the scan reaches them, so some of the reading lands in part2
+    with mapped, span("part2"):
+        rez = extract_and_multiple_pt2_mapped(mapped)
     return rez
 
 
@@ -118,9 +141,8 @@ if __name__ == "__main__":
         "day03",
         soln,
         input_file,
-        method=TimingOptions.TIMEIT,
+        method=TimingOptions.BENCHMARK,
         unit=TimeUnit.MICROSECONDS,
-        iterations=10,
     )
 
     with open(input_file, "r") as f:
@@ -134,7 +156,6 @@ if __name__ == "__main__":
             ("pt2 iter", extract_and_multiple_pt2_iter),
         ],
         entire_input,
-        method=TimingOptions.AVERAGE,
+        method=TimingOptions.BENCHMARK,
         unit=TimeUnit.MICROSECONDS,
-        iterations=10,
     )
@@ -14,8 +14,9 @@ My thinking is we can just parse this as a matrix and then iterate through.
 import sys
 from pathlib import Path
 
-from input_util import Matrix, parse_input_as_matrix
-from timing_util import TimeUnit, TimingOptions, time_solution
+from input_util import Matrix, parse_input_as_matrix, parse_input_as_ndarray
+from timing_util import TimeUnit, TimingOptions, span, time_solution
+from trace_util import debug
 
 TARGET = "XMAS"
 TARGET_PT2 = "MAS"
@@ -147,20 +148,66 @@ def check_x_mas_x_shape(curr_row_idx: int, curr_col_idx: int, matrix: Matrix) ->
 
 
 def soln(input_file: Path) -> tuple[int, int]:
-    with open(input_file, "r") as f:
-        input_str = f.read()
-    matrix = parse_input_as_matrix(input_str, "str")
+    with span("parse"):
+        with open(input_file, "r") as f:
+            input_str = f.read()
+        matrix = parse_input_as_matrix(input_str, "str")
     total_xmas_count = 0
     total_xmas_xshape_count = 0
-    for i in range(len(matrix)):
-        for j in range(len(matrix[0])):
-            total_xmas_count += count_xmas_horizontal(i, j, matrix)
-            total_xmas_count += count_xmas_vertical(i, j, matrix)
-            total_xmas_count += check_xmas_diagonal(i, j, matrix)
-            total_xmas_xshape_count += check_x_mas_x_shape(i, j, matrix)
-
-    print("total_xmas_count:", total_xmas_count)
-    print("total_xmas_xshape_count:", total_xmas_xshape_count)
+    # both parts get counted in the same sweep over the grid
+    with span("search"):
+        for i in range(len(matrix)):
+            for j in range(len(matrix[0])):
+                total_xmas_count += count_xmas_horizontal(i, j, matrix)
+                total_xmas_count += count_xmas_vertical(i, j, matrix)
+                total_xmas_count += check_xmas_diagonal(i, j, matrix)
+                total_xmas_xshape_count += check_x_mas_x_shape(i, j, matrix)
+
+    debug("total_xmas_count: %s", total_xmas_count)
+    debug("total_xmas_xshape_count: %s", total_xmas_xshape_count)
+    return total_xmas_count, total_xmas_xshape_count
+
+
+# the 8 ways a word can run, backwards ones included so each match is counted exactly once
+WORD_DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+def soln_ndarray(input_file: Path) -> tuple[int, int]:
+    """
+    Same answers as `soln` but with numpy doing the sweep: rather than checking the word at
+    every cell, each letter of it is one whole-grid comparison against a shifted view.
+    """
+    import numpy as np
+
+    with span("parse"):
+        grid = parse_input_as_ndarray(input_file, "str")
+    num_rows, num_cols = grid.shape
+    codes = [ord(char) for char in TARGET]
+
+    with span("search"):
+        # padded so a shifted view never runs off the edge, the padding matches no letter
+        pad = LEN_TARGET - 1
+        padded = np.pad(grid, pad)
+        total_xmas_count = 0
+        for row_step, col_step in WORD_DIRECTIONS:
+            matches = np.ones(grid.shape, dtype=bool)
+            for i, code in enumerate(codes):
+                row, col = pad + i * row_step, pad + i * col_step
+                matches &= padded[row : row + num_rows, col : col + num_cols] == code
+            total_xmas_count += int(matches.sum())
+
+        # every A off the border, with M and S at opposite ends of both diagonals
+        m_code, s_code = ord("M"), ord("S")
+        top_left, top_right = grid[:-2, :-2], grid[:-2, 2:]
+        bottom_left, bottom_right = grid[2:, :-2], grid[2:, 2:]
+        diagonal = ((top_left == m_code) & (bottom_right == s_code)) | ((top_left == s_code) & (bottom_right == m_code))
+        anti_diagonal = ((top_right == m_code) & (bottom_left == s_code)) | (
+            (top_right == s_code) & (bottom_left == m_code)
+        )
+        total_xmas_xshape_count = int(((grid[1:-1, 1:-1] == ord("A")) & diagonal & anti_diagonal).sum())
+
+    debug("total_xmas_count: %s", total_xmas_count)
+    debug("total_xmas_xshape_count: %s", total_xmas_xshape_count)
     return total_xmas_count, total_xmas_xshape_count
 
 
@@ -196,7 +243,6 @@ if __name__ == "__main__":
         "day04",
         soln,
         input_file,
-        method=TimingOptions.AVERAGE,
+        method=TimingOptions.BENCHMARK,
         unit=TimeUnit.MILLISECONDS,
-        iterations=1,
     )
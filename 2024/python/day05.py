@@ -126,4 +126,4 @@ def soln(input_file: Path) -> tuple[int, int]:
 if __name__ == "__main__":
     curr_dir = Path(__file__).parent
     input_file = curr_dir.parent / "inputs" / "day05.txt"
-    time_solution("day05", soln, input_file, method=TimingOptions.AVERAGE, unit=TimeUnit.MILLISECONDS, iterations=10)
+    time_solution("day05", soln, input_file, method=TimingOptions.BENCHMARK, unit=TimeUnit.MILLISECONDS)
@@ -28,57 +28,31 @@ map.
 from pathlib import Path
 from typing import Literal
 
-from input_util import Matrix, parse_input_as_matrix
-from timing_util import time_solution
+from input_util import Grid
+from timing_util import span, time_solution
 
 GuardDirType = Literal["^", "v", "<", ">"]
 LocationType = tuple[int, int]
 
 
-BLOCKER = "#"
+BLOCKER = ord("#")
 
-# direction -> (row, col)
-GUARD_NEXT_POSITIONS: dict[GuardDirType, LocationType] = {
-    "^": (-1, 0),
-    "v": (1, 0),
-    "<": (0, -1),
-    ">": (0, 1),
-}
+# clockwise, lined up with Grid.neighbours4 (right, down, left, up) so that
+# turning right is just the next index
+GUARD_DIRS = ">v<^"
 
 
-def find_guard_starting_loc(matrix: Matrix) -> tuple[LocationType, GuardDirType]:
-    for row_idx, row in enumerate(matrix):
-        for col_idx, cell in enumerate(row):
-            if cell in GUARD_NEXT_POSITIONS:
-                return (row_idx, col_idx), cell
+def find_guard_starting_loc(guard_map: Grid) -> tuple[int, int]:
+    """Returns the guard's cell index and its direction index into `neighbours4`."""
+    for dir_idx, guard_char in enumerate(GUARD_DIRS):
+        if ord(guard_char) in guard_map.cells:
+            return guard_map.find(guard_char), dir_idx
 
-    return (-1, -1), "<"
+    return -1, 0
 
 
-def turn_guard(curr_dir: GuardDirType) -> GuardDirType:
-    if curr_dir == "^":
-        return ">"
-    if curr_dir == "v":
-        return "<"
-    if curr_dir == "<":
-        return "^"
-    if curr_dir == ">":
-        return "v"
-
-
-def advance_guard(curr_dir: GuardDirType, curr_loc: LocationType) -> LocationType:
-    row, col = curr_loc
-    next_row, next_col = GUARD_NEXT_POSITIONS[curr_dir]
-    return row + next_row, col + next_col
-
-
-def is_out_of_bounds(next_loc: LocationType, num_rows: int, num_cols: int) -> bool:
-    row, col = next_loc
-    return row < 0 or row >= num_rows or col < 0 or col >= num_cols
-
-
-def is_guard_blocked(next_loc: LocationType, map: Matrix) -> bool:
-    return map[next_loc[0]][next_loc[1]] == "#"
+def turn_guard(dir_idx: int) -> int:
+    return (dir_idx + 1) % 4
 
 
 def find_guard_blocker_positions(visited_locations: set[LocationType], hit_wall_locations: list[LocationType]) -> int:
@@ -168,36 +142,41 @@ def find_guard_blocker_positions(visited_locations: set[LocationType], hit_wall_
     return num_potential_blocking_locs
 
 
-def would_loop_with_blocker(guard_map: list[list[str]]) -> bool:
-    num_rows = len(guard_map)
-    num_cols = len(guard_map[0])
-    guard_loc, guard_dir = find_guard_starting_loc(guard_map)
+def would_loop_with_blocker(guard_map: Grid, guard_loc: int, guard_dir: int) -> bool:
+    cells = guard_map.cells
+    offsets = guard_map.neighbours4
+    sentinel = guard_map.sentinel
+    # one int per (location, direction) rather than a tuple
     visited_states = set()
 
     while True:
-        state = (guard_loc, guard_dir)
+        state = guard_loc * 4 + guard_dir
         if state in visited_states:
             # If we revisit the same location with the same direction, it's a loop
             return True
         visited_states.add(state)
 
-        next_loc = advance_guard(guard_dir, guard_loc)
-        if is_out_of_bounds(next_loc, num_rows, num_cols):
+        next_loc = guard_loc + offsets[guard_dir]
+        next_cell = cells[next_loc]
+        if next_cell == sentinel:
             return False
-        if is_guard_blocked(next_loc, guard_map):
+        if next_cell == BLOCKER:
             guard_dir = turn_guard(guard_dir)
         else:
             guard_loc = next_loc
 
 
-def simulate_blocker_positions_from_visited_locs(guard_map: Matrix, visited_locations: set[LocationType]) -> int:
+def simulate_blocker_positions_from_visited_locs(guard_map: Grid, visited_locations: set[int]) -> int:
     num_potential_blocking_spots = 0
-    orig_map = guard_map
+    guard_loc, guard_dir = find_guard_starting_loc(guard_map)
     for location in visited_locations:
-        row, col = location
-        sim_guard_map = [row[:] for row in orig_map]
-        sim_guard_map[row][col] = BLOCKER
-        if would_loop_with_blocker(sim_guard_map):
+        if location == guard_loc:
+            # the guard would notice us putting a crate on their head
+            continue
+        # copy-on-write, so this only copies the bytes when the blocker goes in
+        sim_guard_map = guard_map.clone()
+        sim_guard_map[location] = BLOCKER
+        if would_loop_with_blocker(sim_guard_map, guard_loc, guard_dir):
             num_potential_blocking_spots += 1
     return num_potential_blocking_spots
 
@@ -208,41 +187,36 @@ def soln(input_file: Path) -> tuple[int, int]:
     we've visited in our matrix and then return the count of unique ones
     """
 
-    guard_map = parse_input_as_matrix(input_file.read_text(), "int")
-    num_rows = len(guard_map)
-    num_cols = len(guard_map[0])
-    guard_loc, guard_dir = find_guard_starting_loc(guard_map)
-    guard_in_map = True
-    visited_nodes: set[tuple[int, int]] = set()
-    visited_nodes.add(guard_loc)
+    with span("parse"):
+        guard_map = Grid.from_str(input_file.read_text())
+    with span("part1"):
+        guard_loc, guard_dir = find_guard_starting_loc(guard_map)
+        visited_nodes: set[int] = {guard_loc}
 
-    # this is basically a list of where we had to turn
-    # not the actual wall locations, but where we turned
-    # we also want to include our starting location
-    hit_wall_guard_locations: list[tuple[int, int]] = []
+        # this is basically a list of where we had to turn
+        # not the actual wall locations, but where we turned
+        hit_wall_guard_locations: list[int] = []
 
-    while guard_in_map:
         # this part is going to:
         # 1. check the next location
-        # 2. if we can't take the next step, turn the guard
-        # 3. take the next step
-        # 4. check if we're out of bounds, if so we're done
-        # 5. add the location to the node
-        # 6. repeat
-        next_loc = advance_guard(guard_dir, guard_loc)
-        if is_out_of_bounds(next_loc, num_rows, num_cols):
-            guard_in_map = False
-            break
-
-        if is_guard_blocked(next_loc, guard_map):
-            hit_wall_guard_locations.append(guard_loc)
-            guard_dir = turn_guard(guard_dir)
-        true_next_loc = advance_guard(guard_dir, guard_loc)
-        visited_nodes.add(true_next_loc)
-        guard_loc = true_next_loc
+        # 2. if we can't take the next step, turn the guard (maybe more than once)
+        # 3. if we've stepped onto the border we're done
+        # 4. otherwise take the step and add the location to the visited nodes
+        # 5. repeat
+        while True:
+            next_loc = guard_loc + guard_map.neighbours4[guard_dir]
+            if guard_map[next_loc] == BLOCKER:
+                hit_wall_guard_locations.append(guard_loc)
+                guard_dir = turn_guard(guard_dir)
+                continue
+            if not guard_map.in_bounds(next_loc):
+                break
+            visited_nodes.add(next_loc)
+            guard_loc = next_loc
 
     # num_blocking_instructions = find_guard_blocker_positions(visited_nodes, hit_wall_guard_locations)
-    num_blocking_locations = simulate_blocker_positions_from_visited_locs(guard_map, visited_nodes)
+    with span("part2"):
+        num_blocking_locations = simulate_blocker_positions_from_visited_locs(guard_map, visited_nodes)
     return len(visited_nodes), num_blocking_locations
 
 
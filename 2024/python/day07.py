@@ -2,6 +2,7 @@ import itertools
 from functools import lru_cache
 from pathlib import Path
 
+from input_util import extract_ints
 from timing_util import time_solution
 
 OPERATIONS = ["+", "*", "||"]
@@ -98,14 +99,9 @@ def soln(input_file: Path) -> tuple[int, int]:
     We're then just trying to sum the valid targets.
     """
     sum_of_valid_targets = 0
-    with open(input_file, "r") as f:
-        for line in f:
-            cleansed_line = line.strip()
-            target_str, nums_str = cleansed_line.split(":")
-            target = int(target_str)
-            nums = list(map(int, nums_str.split()))
-            if can_find_equalizer_cache(target, nums):
-                sum_of_valid_targets += target
+    for target, *nums in extract_ints(input_file, per_line=True):
+        if can_find_equalizer_cache(target, nums):
+            sum_of_valid_targets += target
 
     return sum_of_valid_targets, 0
 
@@ -1,8 +1,9 @@
 from collections import defaultdict
 from pathlib import Path
-from pprint import pprint
 
 from input_util import Coordinate, Matrix, matrix_to_string, parse_input_as_matrix
+from timing_util import span
+from trace_util import Lazy, debug, pretty, trace
 
 
 def is_alphanumeric(char: str) -> bool:
@@ -28,7 +29,7 @@ def algo(matrix: Matrix) -> tuple[int, int]:
     # Now that we have the mapping, we can iterate through the mapping
     # and take every two positions and see if their antinodes are in the
     # matrix
-    pprint(antenna_frequency_to_position)
+    debug("%s", pretty(antenna_frequency_to_position))
     count_of_antinodes = 0
     matrix_copy = [row[:] for row in matrix]
     for key, positions in antenna_frequency_to_position.items():
@@ -126,15 +127,17 @@ def algo(matrix: Matrix) -> tuple[int, int]:
                 #     antinode_locations.add(potential_antinode)
                 #     count_of_antinodes += 1
 
-    print(matrix_to_string(matrix_copy))
+    debug("%s", Lazy(matrix_to_string, matrix_copy))
     return (len(antinode_locations_pt1), len(antinode_locations_pt2))
 
 
 def soln(input_file: Path) -> tuple[int, int]:
-    input_matrix = parse_input_as_matrix(input_file.read_text(), "str")
+    with span("parse"):
+        input_matrix = parse_input_as_matrix(input_file.read_text(), "str")
 
-    pprint(input_matrix)
-    num_antinodes, num_antinodes_with_resonance = algo(input_matrix)
+    trace("%s", pretty(input_matrix))
+    with span("solve"):
+        num_antinodes, num_antinodes_with_resonance = algo(input_matrix)
     return (num_antinodes, num_antinodes_with_resonance)
 
 
@@ -37,7 +37,7 @@ Continuing the first example, the first few blocks' position multiplied by its f
 
 from pathlib import Path
 
-from timing_util import time_solution
+from timing_util import span, time_solution
 
 FREE_SPACE_CHAR = "."
 
@@ -144,14 +144,16 @@ def soln(input_file: Path) -> tuple[int, int]:
     file_checksum_pt1 = 0
     file_checksum_pt2 = 0
 
-    compressed_disk_map = input_file.read_text().strip()
-    expanded_disk_map = expand_disk_map(compressed_disk_map)
-    expanded_disk_map_copy = expanded_disk_map.copy()
-    sorted_disk_map_pt1 = sort_disk_map_pt1(expanded_disk_map)
-    sorted_disk_map_pt2 = sort_disk_map_pt2(expanded_disk_map_copy)
-
-    file_checksum_pt1 = compute_checksum(sorted_disk_map_pt1)
-    file_checksum_pt2 = compute_checksum(sorted_disk_map_pt2)
+    with span("parse"):
+        compressed_disk_map = input_file.read_text().strip()
+        expanded_disk_map = expand_disk_map(compressed_disk_map)
+        expanded_disk_map_copy = expanded_disk_map.copy()
+    with span("part1"):
+        sorted_disk_map_pt1 = sort_disk_map_pt1(expanded_disk_map)
+        file_checksum_pt1 = compute_checksum(sorted_disk_map_pt1)
+    with span("part2"):
+        sorted_disk_map_pt2 = sort_disk_map_pt2(expanded_disk_map_copy)
+        file_checksum_pt2 = compute_checksum(sorted_disk_map_pt2)
     return (file_checksum_pt1, file_checksum_pt2)
 
 
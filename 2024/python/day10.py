@@ -1,7 +1,8 @@
 from pathlib import Path
 from typing import Literal
 
-from input_util import Matrix, is_in_bounds, parse_input_as_matrix
+from input_util import Grid, Matrix
+from timing_util import span
 
 DirKeyType = Literal["up", "down", "left", "right"]
 DirType = tuple[int, int]
@@ -10,6 +11,7 @@ Coordinate = tuple[int, int]
 STARTING_VAL = "0"
 PRE_TARGET_VAL = "8"
 TARGET_VAL = "9"
+TARGET_BYTE = ord(TARGET_VAL)
 DIRECTIONS: dict[DirKeyType, DirType] = {
     "up": (-1, 0),
     "down": (1, 0),
@@ -40,25 +42,20 @@ def visualize_matrix_path(matrix: Matrix, path: list[Coordinate]) -> str:
     return "\n".join(" ".join(str(cell).rjust(3)) for cell in visual_matrix)
 
 
-def find_starting_locations(matrix) -> list[Coordinate]:
-    starting_locs: list[Coordinate] = []
-    for row_idx, row in enumerate(matrix):
-        for col_idx, cell in enumerate(row):
-            if cell == STARTING_VAL:
-                starting_locs.append((row_idx, col_idx))
-    return starting_locs
+def find_starting_locations(grid: Grid) -> list[int]:
+    return grid.find_all(STARTING_VAL)
 
 
-def can_find_target_from_loc(matrix: Matrix, loc: Coordinate) -> bool:
-    return matrix[loc[0]][loc[1]] == TARGET_VAL
+def can_find_target_from_loc(grid: Grid, loc: int) -> bool:
+    return grid.char_at(loc) == TARGET_VAL
 
 
 def dfs_explore(
-    matrix: Matrix,
-    starting_loc: Coordinate,
-    visited: set[Coordinate],
-    target_locs: set[Coordinate],
-    debug_path: list[Coordinate],
+    grid: Grid,
+    starting_loc: int,
+    visited: set[int],
+    target_locs: set[int],
+    debug_path: list[int],
 ) -> tuple[int, int]:
     if starting_loc in visited:
         # we are in a cycle somehow, or we've already visited this location
@@ -67,25 +64,24 @@ def dfs_explore(
     visited.add(starting_loc)
     debug_path.append(starting_loc)
 
-    curr_loc = starting_loc
-    curr_val = matrix[starting_loc[0]][starting_loc[1]]
+    cells = grid.cells
+    curr_val = cells[starting_loc]
     total_paths = 0
 
-    for _, direction_vec in DIRECTIONS.items():
-        next_loc = (curr_loc[0] + direction_vec[0], curr_loc[1] + direction_vec[1])
-        if is_in_bounds(matrix, next_loc):
-            next_val = matrix[next_loc[0]][next_loc[1]]
+    # the border is all sentinel, and the sentinel (like ".") is never one more than a digit,
+    # so there's nothing to bounds check
+    for offset in grid.neighbours4:
+        next_loc = starting_loc + offset
+        next_val = cells[next_loc]
+        if next_val != curr_val + 1:
+            continue
 
-            if next_val == TARGET_VAL and curr_val == PRE_TARGET_VAL:
-                total_paths += 1
-                target_locs.add(next_loc)
-                continue
+        if next_val == TARGET_BYTE:
+            total_paths += 1
+            target_locs.add(next_loc)
+            continue
 
-            if next_val == ".":
-                continue
-
-            if int(next_val) == int(curr_val) + 1:
-                total_paths += dfs_explore(matrix, next_loc, visited, target_locs, debug_path)[1]
+        total_paths += dfs_explore(grid, next_loc, visited, target_locs, debug_path)[1]
 
     debug_path.pop()
     visited.remove(starting_loc)
@@ -93,16 +89,19 @@ def dfs_explore(
 
 
 def soln(input_file: Path) -> tuple[int, int]:
-    matrix = parse_input_as_matrix(input_file.read_text(), "str")
-    starting_locs = find_starting_locations(matrix)
+    with span("parse"):
+        grid = Grid.from_str(input_file.read_text())
+        starting_locs = find_starting_locations(grid)
     sum_trailhead_scores = 0
     sum_trailhead_rating = 0
-    for starting_loc in starting_locs:
-        visited = set()
-        target_locs = set()
-        trailhead_score, trailhead_rating = dfs_explore(matrix, starting_loc, visited, target_locs, [])
-        sum_trailhead_scores += trailhead_score
-        sum_trailhead_rating += trailhead_rating
+    # the dfs scores and rates each trailhead in one go
+    with span("explore"):
+        for starting_loc in starting_locs:
+            visited = set()
+            target_locs = set()
+            trailhead_score, trailhead_rating = dfs_explore(grid, starting_loc, visited, target_locs, [])
+            sum_trailhead_scores += trailhead_score
+            sum_trailhead_rating += trailhead_rating
     return (sum_trailhead_scores, sum_trailhead_rating)
 
 
@@ -1,7 +1,9 @@
 import math
-from functools import lru_cache
 from pathlib import Path
 
+from memo import memo, memo_scope
+from timing_util import span
+
 NUM_BLINKS = 75
 MULTIPLE_FACTOR = 2024
 
@@ -31,7 +33,8 @@ def apply_rules_for_num_blinks(stone_list: list[int], num_blinks: int) -> list[i
     # because we know we're going to do redundant work
     # for a given stone, and how many blinks are remaining
     # so instead of building the memo cache myself, i'm just going to use lru_cache
-    @lru_cache(maxsize=None)
+    # (well memo now - the lists get long fast, so it's capped on their size)
+    @memo(max_bytes=256 << 20)
     def process_stone(stone: int, num_blinks: int) -> list[int]:
         if num_blinks == 0:
             return [stone]
@@ -47,7 +50,8 @@ def apply_rules_for_num_blinks(stone_list: list[int], num_blinks: int) -> list[i
     return result_stones
 
 
-@lru_cache(maxsize=None)
+# there are only a few thousand distinct stones even on big inputs
+@memo(maxsize=1 << 13)
 def apply_rules(stone: int) -> list[int]:
     if stone == 0:
         return [1]
@@ -63,16 +67,22 @@ def apply_rules(stone: int) -> list[int]:
     return [stone * MULTIPLE_FACTOR]
 
 
+# module level so worker.py can keep the table warm between requests on purpose, everyone
+# else gets it cleared when soln returns (see memo_scope) so a benchmark round isn't just
+# cache hits. bounded so a huge input can't grow it forever, but keep the bound well above
+# the working set: a ~180k key input run with room for 64k went 5x slower from re-counting
+# evicted stones
+@memo(maxsize=1 << 18)
+def count_stones(stone: int, blinks: int) -> int:
+    if blinks == 0:
+        return 1
+    new_stones = apply_rules(stone)
+    return sum(count_stones(ns, blinks - 1) for ns in new_stones)
+
+
 def apply_rules_for_num_blinks_just_count(stone_list: list[int], num_blinks: int) -> int:
     # Ok let's forget about even keeping track of the list and just count how
     # many stones are in each transformation
-    @lru_cache(maxsize=None)
-    def count_stones(stone: int, blinks: int) -> int:
-        if blinks == 0:
-            return 1
-        new_stones = apply_rules(stone)
-        return sum(count_stones(ns, blinks - 1) for ns in new_stones)
-
     # Sum the counts for all initial stones after num_blinks transformations
     return sum(count_stones(stone, num_blinks) for stone in stone_list)
 
@@ -81,9 +91,11 @@ def soln(input_file: Path) -> tuple[int, int]:
     num_stones_pt1 = 0
     num_stones_pt2 = 0
 
-    input_str = input_file.read_text()
-    stone_list = list(map(int, input_str.split(" ")))
-    transformed_stones = apply_rules_for_num_blinks_just_count(stone_list, NUM_BLINKS)
+    with span("parse"):
+        input_str = input_file.read_text()
+        stone_list = list(map(int, input_str.split(" ")))
+    with span("part2"), memo_scope(count_stones, apply_rules):
+        transformed_stones = apply_rules_for_num_blinks_just_count(stone_list, NUM_BLINKS)
     num_stones_pt2 = transformed_stones
     # num_stones_pt1 = len(transformed_stones)
     return (num_stones_pt1, num_stones_pt2)
@@ -1,8 +1,9 @@
 from pathlib import Path
-from pprint import pprint
 from typing import Literal, TypedDict
 
 from input_util import Coordinate, Matrix, is_in_bounds, parse_input_as_matrix
+from timing_util import span
+from trace_util import debug, pretty, trace
 
 DirKeyType = Literal["up", "down", "left", "right"]
 DirType = tuple[int, int]
@@ -96,7 +97,7 @@ def calculate_sides_with_directions(region_key: str, region_edges: set[tuple[Coo
     visited_edges = set()
     region_sides = 0
 
-    print(f"Exploring region: {region_key}")
+    trace("Exploring region: %s", region_key)
     while region_edges:
         start_edge = min(region_edges, key=lambda edge: (edge[0][0], edge[0][1], edge[1]))
         curr_edge = start_edge
@@ -143,8 +144,7 @@ def get_region_info(
                 region_edges.add((curr_loc, dir_key))
                 region_info["perimeter"] += 1
 
-    print("Region edges:")
-    pprint(region_edges)
+    trace("Region edges:\n%s", pretty(region_edges))
 
     region_info["sides"] = calculate_sides_with_directions(curr_val, region_edges)
     return region_info
@@ -167,13 +167,15 @@ def explore_farm(matrix: Matrix) -> list[tuple[str, Region]]:
     return regions
 
 
-def soln(input_file: Path, debug: bool = True) -> tuple[int, int]:
+def soln(input_file: Path) -> tuple[int, int]:
     pt1_ans = 0
     pt2_ans = 0
-    matrix = parse_input_as_matrix(input_file.read_text(), "str")
-    plant_type_to_region_info = explore_farm(matrix)
-    if debug:
-        pprint(plant_type_to_region_info)
+    with span("parse"):
+        matrix = parse_input_as_matrix(input_file.read_text(), "str")
+    # area, perimeter and sides all come out of the same flood fill
+    with span("explore"):
+        plant_type_to_region_info = explore_farm(matrix)
+    debug("%s", pretty(plant_type_to_region_info))
     for region_key_and_info in plant_type_to_region_info:
         region_key, region_info = region_key_and_info
         perim_price = region_info["area"] * region_info["perimeter"]
@@ -34,6 +34,9 @@ from typing import Tuple
 
 import numpy as np
 
+from input_util import extract_ints
+from timing_util import span
+
 BUTTON_PUSH_A_TOKEN_COST = 3
 BUTTON_PUSH_B_TOKEN_COST = 1
 MAX_SINGLE_BUTTON_PUSH = 100
@@ -147,81 +150,64 @@ def find_possible_solutions(a_rule: ButtonRule, b_rule: ButtonRule, prize: Prize
 
 
 def parse_input(input_file: Path) -> list[ClawMachineInfo]:
-    def parse_button_rule(line: str, cost: int) -> ButtonRule:
-        rule_info = line.split(":")[1].strip()
-        x_info, y_info = rule_info.split(",")
-        x_move, y_move = x_info.split("+")[1], y_info.split("+")[1]
-        return ButtonRule(
-            int(x_move),
-            int(y_move),
-            cost,
-        )
-
-    def parse_prize_rule(line: str) -> Prize:
-        prize_info = line.split(":")[1].strip()
-        x_target, y_target = prize_info.split(",")
-        x_target, y_target = int(x_target.split("=")[1]), int(y_target.split("=")[1])
-        return Prize(x_target, y_target)
+    # each machine is exactly six numbers: button A's x/y, button B's x/y, then the prize x/y
+    nums = extract_ints(input_file)
+    if len(nums) % 6:
+        raise AssertionError("Something went wrong with parsing input")
 
     claw_machine_infos: list[ClawMachineInfo] = []
-    with open(input_file) as f:
-        lines = [line.strip() for line in f.readlines() if line.strip()]
-        for i in range(0, len(lines), 3):
-            button_a_line = lines[i]
-            button_b_line = lines[i + 1]
-            prize_line = lines[i + 2]
-
-            if "Button A" not in button_a_line or "Button B" not in button_b_line or "Prize" not in prize_line:
-                raise AssertionError("Something went wrong with parsing input")
-
-            a_rule = parse_button_rule(lines[i], BUTTON_PUSH_A_TOKEN_COST)
-            b_rule = parse_button_rule(lines[i + 1], BUTTON_PUSH_B_TOKEN_COST)
-            prize_rule = parse_prize_rule(lines[i + 2])
-            claw_machine_infos.append(ClawMachineInfo(a_rule, b_rule, prize_rule))
+    for i in range(0, len(nums), 6):
+        a_rule = ButtonRule(nums[i], nums[i + 1], BUTTON_PUSH_A_TOKEN_COST)
+        b_rule = ButtonRule(nums[i + 2], nums[i + 3], BUTTON_PUSH_B_TOKEN_COST)
+        prize_rule = Prize(nums[i + 4], nums[i + 5])
+        claw_machine_infos.append(ClawMachineInfo(a_rule, b_rule, prize_rule))
 
     return claw_machine_infos
 
 
 def soln(input_file: Path) -> tuple[int, int]:
-    claw_machine_info_list = parse_input(input_file)
+    with span("parse"):
+        claw_machine_info_list = parse_input(input_file)
     total_token_cost_pt_1 = 0
     total_token_cost_pt_2 = 0
     for claw_machine_info in claw_machine_info_list:
         # Part 1
         a_rule, b_rule, prize = claw_machine_info.unpack()
-        if not can_hit_target(a_rule.x_move, b_rule.x_move, prize.x_target):
-            pass
-        elif not can_hit_target(a_rule.y_move, b_rule.y_move, prize.y_target):
-            pass
-        else:
-            possible_solutions = find_possible_solutions(a_rule, b_rule, prize)
-            for solution in possible_solutions:
-                num_button_a_presses, num_button_b_presses = solution
-                if not is_in_button_press_range(num_button_a_presses, num_button_b_presses):
-                    continue
-                total_token_cost_pt_1 += (
-                    num_button_a_presses * a_rule.push_cost + num_button_b_presses * b_rule.push_cost
-                )
+        with span("part1"):
+            if not can_hit_target(a_rule.x_move, b_rule.x_move, prize.x_target):
+                pass
+            elif not can_hit_target(a_rule.y_move, b_rule.y_move, prize.y_target):
+                pass
+            else:
+                possible_solutions = find_possible_solutions(a_rule, b_rule, prize)
+                for solution in possible_solutions:
+                    num_button_a_presses, num_button_b_presses = solution
+                    if not is_in_button_press_range(num_button_a_presses, num_button_b_presses):
+                        continue
+                    total_token_cost_pt_1 += (
+                        num_button_a_presses * a_rule.push_cost + num_button_b_presses * b_rule.push_cost
+                    )
 
         # Part 2
-        prize.x_target += PT2_OFFSET
-        prize.y_target += PT2_OFFSET
-        if not can_hit_target(a_rule.x_move, b_rule.x_move, prize.x_target):
-            pass
-        elif not can_hit_target(a_rule.y_move, b_rule.y_move, prize.y_target):
-            pass
-        else:
-            possible_solutions = find_possible_solutions(a_rule, b_rule, prize)
-            if not possible_solutions:
-                continue
-
-            for solution in possible_solutions:
-                num_button_a_presses, num_button_b_presses = solution
-                if not is_in_button_press_range(num_button_a_presses, num_button_b_presses, with_max_check=False):
+        with span("part2"):
+            prize.x_target += PT2_OFFSET
+            prize.y_target += PT2_OFFSET
+            if not can_hit_target(a_rule.x_move, b_rule.x_move, prize.x_target):
+                pass
+            elif not can_hit_target(a_rule.y_move, b_rule.y_move, prize.y_target):
+                pass
+            else:
+                possible_solutions = find_possible_solutions(a_rule, b_rule, prize)
+                if not possible_solutions:
                     continue
-                total_token_cost_pt_2 += (
-                    num_button_a_presses * a_rule.push_cost + num_button_b_presses * b_rule.push_cost
-                )
+
+                for solution in possible_solutions:
+                    num_button_a_presses, num_button_b_presses = solution
+                    if not is_in_button_press_range(num_button_a_presses, num_button_b_presses, with_max_check=False):
+                        continue
+                    total_token_cost_pt_2 += (
+                        num_button_a_presses * a_rule.push_cost + num_button_b_presses * b_rule.push_cost
+                    )
 
     return (int(total_token_cost_pt_1), int(total_token_cost_pt_2))
 
@@ -24,8 +24,8 @@ from pathlib import Path
 from pprint import pprint
 from typing import Literal
 
-import numpy as np
-from matplotlib import pyplot as plt
+from input_util import extract_ints
+from trace_util import DEBUG, enabled
 
 TEST_CASE: Literal["small", "main"] = "main"
 NUM_TILES_WIDE = 101 if TEST_CASE == "main" else 11
@@ -45,16 +45,19 @@ class RobotInfo:
     y_vel_per_sec: int
 
 
-def parse_robot_line(line: str) -> RobotInfo:
-    position_info, velocity_info = line.split(" ")
-    x_pos, y_pos = position_info.split("=")[1].split(",")
-    x_vel, y_vel = velocity_info.split("=")[1].split(",")
-    return RobotInfo(uuid.uuid4(), int(x_pos), int(y_pos), int(x_vel), int(y_vel))
+def parse_robots(input_file: Path) -> list[RobotInfo]:
+    # `p=x,y v=dx,dy` is four ints a robot, the velocities can be negative
+    nums = extract_ints(input_file)
+    return [RobotInfo(uuid.uuid4(), *nums[i : i + 4]) for i in range(0, len(nums), 4)]
 
 
 def visualize_robot_map(
     robot_map: list[list[str]], step: int, robot_ids: dict[tuple[int, int], list[str]] | None = None
 ) -> None:
+    # numpy + matplotlib are most of this module's import time, and only the picture needs them
+    import numpy as np
+    from matplotlib import pyplot as plt
+
     print(f"Visualizing robot map at step {step}...")
     numeric_map = np.array([[int(cell) if cell != "." else 0 for cell in row] for row in robot_map])
 
@@ -169,14 +172,10 @@ class RobotMap:
 
     def simulate_all_robot_movements(self, num_seconds: int, show_map: bool = False) -> None:
         for curr_second in range(num_seconds):
-            is_christmas_tree = self.visualize_map_from_robot_info_mapping(curr_second)
-            self.simulate_all_robot_movements_one_second()
+            # the pictures (and numpy + matplotlib with them) only when asked for
             if show_map:
-                pass
-                # visualize_robot_map(self.robot_map)
-                # if is_christmas_tree:
-                #     print(f"Found christmas tree at second {curr_second}")
-                #     break
+                self.visualize_map_from_robot_info_mapping(curr_second)
+            self.simulate_all_robot_movements_one_second()
 
     def score(self) -> int:
         total_robot_map_score = 0
@@ -224,18 +223,15 @@ def soln(input_file: Path) -> tuple[int, int]:
 
     robot_map_pt1 = RobotMap(NUM_TILES_WIDE, NUM_TILES_TALL)
     all_robot_info = []
-    with open(input_file, "r") as file:
-        lines = [line.strip() for line in file.readlines() if line.strip()]
-        for line in lines:
-            robot_info = parse_robot_line(line)
-            all_robot_info.append(robot_info)
+    for robot_info in parse_robots(input_file):
+        all_robot_info.append(robot_info)
 
-            final_robot_x_pos, final_robot_y_pos = robot_map_pt1.simulate_robot_movement(
-                robot_info, NUM_SECONDS_TO_SIMULATE
-            )
-            robot_map_pt1.add_robot(final_robot_x_pos, final_robot_y_pos)
+        final_robot_x_pos, final_robot_y_pos = robot_map_pt1.simulate_robot_movement(
+            robot_info, NUM_SECONDS_TO_SIMULATE
+        )
+        robot_map_pt1.add_robot(final_robot_x_pos, final_robot_y_pos)
 
-        part1_robot_sum = robot_map_pt1.score()
+    part1_robot_sum = robot_map_pt1.score()
 
     # Ok now we can change our approach slightly for part 2
     # we are going to have to place all the robots initially and then tag them with some unique id
@@ -244,7 +240,7 @@ def soln(input_file: Path) -> tuple[int, int]:
     # let's instantiate a new robot map that has all of the robots locations in
     # the initializer
     robot_map_pt2 = RobotMap.init_with_robots(NUM_TILES_WIDE, NUM_TILES_TALL, all_robot_info)
-    robot_map_pt2.simulate_all_robot_movements(MAX_NUM_SECONDS_TO_SIMULATE, show_map=True)
+    robot_map_pt2.simulate_all_robot_movements(MAX_NUM_SECONDS_TO_SIMULATE, show_map=enabled(DEBUG))
     return (part1_robot_sum, part2_robot_sum)
 
 
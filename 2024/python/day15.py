@@ -4,6 +4,8 @@ from pprint import PrettyPrinter
 from typing import Literal
 
 from input_util import Coordinate, Matrix, MatrixStr, matrix_to_string, parse_input_as_matrix
+from timing_util import span
+from trace_util import Lazy, debug, info, trace
 
 printer = PrettyPrinter(width=200)
 
@@ -288,24 +290,27 @@ def soln(input_file: Path) -> tuple[int, int]:
     gps_coordinate_score_pt1 = 0
     gps_coordinate_score_pt2 = 0
 
-    robot_map, movements = parse_input(input_file)
-    translated_robot_map = transform_map(robot_map)
-    robot_starting_loc = find_robot_starting_coordinate(robot_map)
-
-    print("Part 1")
-    robot_curr_loc = robot_starting_loc
-    for _idx, movement in enumerate(movements):
-        robot_curr_loc = move_robot_with_instruction_pt1(robot_map, robot_curr_loc, movement)
-    gps_coordinate_score_pt1 = compute_box_gps_coordinate_score(robot_map)
-
-    print("Part 2")
-    robot_curr_loc = find_robot_starting_coordinate(translated_robot_map)
-    for idx, movement in enumerate(movements):
-        print(f"Step: {idx} with movement: {movement} with robot loc: {robot_curr_loc}")
-        robot_curr_loc = move_robot_with_instruction_pt2(translated_robot_map, robot_curr_loc, movement)
-
-    print(matrix_to_string(translated_robot_map))
-    gps_coordinate_score_pt2 = compute_box_gps_coordinate_score(translated_robot_map)
+    with span("parse"):
+        robot_map, movements = parse_input(input_file)
+        translated_robot_map = transform_map(robot_map)
+        robot_starting_loc = find_robot_starting_coordinate(robot_map)
+
+    info("Part 1")
+    with span("part1"):
+        robot_curr_loc = robot_starting_loc
+        for _idx, movement in enumerate(movements):
+            robot_curr_loc = move_robot_with_instruction_pt1(robot_map, robot_curr_loc, movement)
+        gps_coordinate_score_pt1 = compute_box_gps_coordinate_score(robot_map)
+
+    info("Part 2")
+    with span("part2"):
+        robot_curr_loc = find_robot_starting_coordinate(translated_robot_map)
+        for idx, movement in enumerate(movements):
+            trace("Step: %s with movement: %s with robot loc: %s", idx, movement, robot_curr_loc)
+            robot_curr_loc = move_robot_with_instruction_pt2(translated_robot_map, robot_curr_loc, movement)
+
+        debug("%s", Lazy(matrix_to_string, translated_robot_map))
+        gps_coordinate_score_pt2 = compute_box_gps_coordinate_score(translated_robot_map)
     return (gps_coordinate_score_pt1, gps_coordinate_score_pt2)
 
 
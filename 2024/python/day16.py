@@ -13,19 +13,29 @@ from collections import defaultdict, deque
 from pathlib import Path
 from typing import Literal
 
+from grid_search import UNREACHED, dijkstra
 from input_util import (
+    DIRECTION_INDEX,
+    DIRECTION_NAMES,
     Coordinate,
     DirectionType,
+    Grid,
     MatrixPoint,
     Point,
     PointWDirection,
+    PointWDirectionTuple,
     convert_to_point_matrix_old,
     matrix_to_string,
+    pack_state,
     parse_input_as_matrix,
 )
+from timing_util import span
+from trace_util import DEBUG, Lazy, debug, enabled, info
 
 
-def overlay_directions(matrix: list[list[Point]], directions: list[PointWDirection]) -> list[list[str]]:
+def overlay_directions(
+    matrix: list[list[Point]], directions: list[PointWDirection] | list[PointWDirectionTuple]
+) -> list[list[str]]:
     # Create a copy of the original matrix for overlaying
     result = [[point.value for point in row] for row in matrix]
 
@@ -192,22 +202,69 @@ def modified_dijkstras_exploration(
     return final_score, final_path, all_end_route_locations
 
 
+def modified_dijkstras_exploration_v2(
+    grid: Grid, start: int, end: int
+) -> tuple[float, list[PointWDirectionTuple] | None, set[int]]:
+    """
+    The same search on packed `index * 4 + direction` states through grid_search (directions
+    in `Grid.neighbours4` order, east first). Returns the seats as grid indices.
+
+    The score is the cheapest of the four ways to face on the end tile. The original keeps
+    whichever one it happened to pop last, which can be a more expensive one.
+    """
+    cells = grid.cells
+    offsets = grid.neighbours4
+    blocked = (ord("#"), grid.sentinel)
+    forward_cost = MOVE_COST_MAP["forward"]
+    turn_cost = MOVE_COST_MAP["turn-clockwise"]
+
+    def moves(state: int) -> list[tuple[int, int]]:
+        index, direction = divmod(state, 4)
+        facing = state - direction
+        next_moves = [(facing + (direction + 1) % 4, turn_cost), (facing + (direction + 3) % 4, turn_cost)]
+        ahead = index + offsets[direction]
+        if cells[ahead] not in blocked:
+            next_moves.append((ahead * 4 + direction, forward_cost))
+        return next_moves
+
+    end_states = [pack_state(end, direction) for direction in range(4)]
+    start_state = pack_state(start, DIRECTION_INDEX["east"])
+    result = dijkstra(len(cells) * 4, [start_state], moves, goals=set(end_states), track_preds=True)
+    if result.goal == UNREACHED:
+        return float("inf"), None, set()
+
+    final_score = result.dist[result.goal]
+    path = []
+    # like the original, the path leaves out the starting state
+    for state in result.path_to(result.goal)[1:]:
+        row, col = grid.coords(state // 4)
+        path.append(PointWDirectionTuple(col, row, DIRECTION_NAMES[state % 4]))
+    best_end_states = [state for state in end_states if result.dist[state] == final_score]
+    seats = {state // 4 for state in result.dag_states(best_end_states)}
+    return final_score, path, seats
+
+
 def soln(input_file: Path) -> tuple[int, int]:
     cheapest_path_score_pt1 = 0
     number_of_seats_pt2 = 0
-    reindeer_map_temp = parse_input_as_matrix(input_file.read_text(), "str")
-    print("Found reindeer map:")
-    print(matrix_to_string(reindeer_map_temp))
-    reindeer_map = convert_to_point_matrix_old(reindeer_map_temp)
-    start_loc, end_loc = find_starting_and_end_location(reindeer_map)
-    print(f"Start loc: {start_loc}")
-    print(f"End loc: {end_loc}")
-    cheapest_path_score_pt1, path, all_path_locations = modified_dijkstras_exploration(reindeer_map, start_loc, end_loc)
-    if path:
+    with span("parse"):
+        reindeer_map_temp = parse_input_as_matrix(input_file.read_text(), "str")
+        debug("Found reindeer map:\n%s", Lazy(matrix_to_string, reindeer_map_temp))
+        reindeer_map = convert_to_point_matrix_old(reindeer_map_temp)
+        start_loc, end_loc = find_starting_and_end_location(reindeer_map)
+        grid = Grid.from_matrix(reindeer_map_temp)
+    debug("Start loc: %s", start_loc)
+    debug("End loc: %s", end_loc)
+    # one dijkstra pass gives the cheapest score and every seat on a cheapest path
+    with span("dijkstra"):
+        cheapest_path_score_pt1, path, all_path_locations = modified_dijkstras_exploration_v2(
+            grid, grid.find("S"), grid.find("E")
+        )
+    # overlaying copies the whole map, only worth it when someone's looking
+    if path and enabled(DEBUG):
         reindeer_map_overlaid = overlay_directions(reindeer_map, path)
-        print("Found solution:")
-        print(matrix_to_string(reindeer_map_overlaid))
-    print(f"Cheapest path score: {cheapest_path_score_pt1}")
+        debug("Found solution:\n%s", matrix_to_string(reindeer_map_overlaid))
+    info("Cheapest path score: %s", cheapest_path_score_pt1)
     number_of_seats_pt2 = len(all_path_locations)
     return (int(cheapest_path_score_pt1), number_of_seats_pt2)
 
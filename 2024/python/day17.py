@@ -31,7 +31,7 @@ Ok yet another approach. we can basically distill this problem out into these st
 from pathlib import Path
 from typing import Callable, Literal
 
-from z3 import BitVec, Optimize, sat
+from timing_util import span
 
 RegisterKeyType = Literal["A", "B", "C"]
 RegisterType = dict[RegisterKeyType, int]
@@ -176,6 +176,9 @@ def process_instructions(register_map: RegisterType, program_instructions: list[
 
 
 def find_initial_value_for_quine_solve(program_instructions: list[int]) -> None:
+    # z3 takes a good while to import and only part 2 needs it
+    from z3 import BitVec, Optimize, sat
+
     a = BitVec("A", 51)
     opt = Optimize()
     for out in program_instructions:
@@ -206,18 +209,21 @@ def find_initial_value_for_quine_solve(program_instructions: list[int]) -> None:
 
 
 def soln(input_file: Path) -> tuple[str, int]:
-    register_map, program_instructions = parse_input(input_file)
-    original_program_instructions = program_instructions.copy()
+    with span("parse"):
+        register_map, program_instructions = parse_input(input_file)
+        original_program_instructions = program_instructions.copy()
     print(f"Register map: {register_map}")
     print(f"Program Instructions: {program_instructions}")
-    output = process_instructions(register_map, program_instructions)
+    with span("part1"):
+        output = process_instructions(register_map, program_instructions)
     print("Part 1:")
     answer_pt1 = ",".join(map(str, output))
     print(",".join(map(str, output)))
     print("Register map:")
     print(register_map)
     print("original_program_instructions", original_program_instructions)
-    find_initial_value_for_quine_solve(original_program_instructions)
+    with span("part2"):
+        find_initial_value_for_quine_solve(original_program_instructions)
     return (answer_pt1, 0)
 
 
@@ -14,7 +14,10 @@ ok cool but this just feels like true Dijsktras where you're trying to find the
 import heapq
 from pathlib import Path
 
-from input_util import MatrixStr, Point, matrix_to_string, overlay_points
+from grid_search import bfs, grid_moves
+from input_util import Grid, MatrixStr, Point, extract_ints, matrix_to_string, overlay_points
+from timing_util import span
+from trace_util import DEBUG, debug, enabled, trace
 
 MEMORY_RANGE = 70
 EXAMPLE_MEMORY_RANGE = 6
@@ -24,14 +27,11 @@ IS_TEST = False
 
 
 def populate_matrix_from_input(matrix: MatrixStr, input_file: Path) -> None:
-    with open(input_file) as f:
-        for idx, line in enumerate(f.readlines()):
-            if idx == NUMBER_BYTES_TO_SIMULATE:
-                break
-            x, y = map(int, line.strip().split(","))
-            matrix[y][x] = "#"
-            # print(f"Falling Byte Idx: {idx} with (x, y) = ({x}, {y})")
-            # print(matrix_to_string(matrix))
+    coords = extract_ints(input_file)[: 2 * NUMBER_BYTES_TO_SIMULATE]
+    for x, y in zip(coords[::2], coords[1::2]):
+        matrix[y][x] = "#"
+        # print(f"Falling Byte Idx: ({x}, {y})")
+        # print(matrix_to_string(matrix))
 
 
 def dijkstras(matrix: MatrixStr) -> tuple[int, list[Point]]:
@@ -90,28 +90,46 @@ def dijkstras(matrix: MatrixStr) -> tuple[int, list[Point]]:
     return final_distance, final_route
 
 
+def dijkstras_v2(grid: Grid, memory_range: int) -> tuple[int, list[int]]:
+    """
+    Same answer as `dijkstras`, but on `Grid` indices through grid_search. Every step costs
+    the same so it's really a BFS. The route is indices, destination first like the original.
+    """
+    start = grid.index(0, 0)
+    destination = grid.index(memory_range, memory_range)
+    result = bfs(len(grid.cells), [start], grid_moves(grid), goals={destination})
+    if not result.reached(destination):
+        return 0, []
+    return result.dist[destination], result.path_to(destination)[::-1]
+
+
+def route_to_points(grid: Grid, route: list[int]) -> list[Point]:
+    return [Point(col, row, ".") for row, col in map(grid.coords, route)]
+
+
 def soln(input_file: Path) -> tuple[int, str]:
     num_steps_out_pt1 = 0
     breaking_loc = ""
     memory_range = EXAMPLE_MEMORY_RANGE if IS_TEST else MEMORY_RANGE
-    memory_matrix = [["." for _ in range(memory_range + 1)] for _ in range(memory_range + 1)]
-    populate_matrix_from_input(memory_matrix, input_file)
-    num_steps_out_pt1, route = dijkstras(memory_matrix)
-    matrix = overlay_points(memory_matrix, route)
-    print("Part 1")
-    print("Found solution:")
-    print(matrix_to_string(matrix))
-    print("Part 2")
-
-    fresh_memory_matrix = [["." for _ in range(memory_range + 1)] for _ in range(memory_range + 1)]
-    with open(input_file) as f:
-        for idx, line in enumerate(f.readlines()):
-            x, y = map(int, line.strip().split(","))
-            fresh_memory_matrix[y][x] = "#"
-            print(f"Idx: {idx} with (x, y) = ({x}, {y})")
-            num_steps_out_pt2, route = dijkstras(fresh_memory_matrix)
+    with span("parse"):
+        memory_matrix = [["." for _ in range(memory_range + 1)] for _ in range(memory_range + 1)]
+        populate_matrix_from_input(memory_matrix, input_file)
+        grid = Grid.from_matrix(memory_matrix)
+    with span("part1"):
+        num_steps_out_pt1, route = dijkstras_v2(grid, memory_range)
+    if enabled(DEBUG):
+        matrix = overlay_points(memory_matrix, route_to_points(grid, route))
+        debug("Part 1\nFound solution:\n%s", matrix_to_string(matrix))
+
+    with span("part2"):
+        fresh_grid = Grid.from_matrix([["." for _ in range(memory_range + 1)] for _ in range(memory_range + 1)])
+        coords = extract_ints(input_file)
+        for idx, (x, y) in enumerate(zip(coords[::2], coords[1::2])):
+            fresh_grid[fresh_grid.index(y, x)] = ord("#")
+            trace("Idx: %s with (x, y) = (%s, %s)", idx, x, y)
+            num_steps_out_pt2, route = dijkstras_v2(fresh_grid, memory_range)
             if not route:
-                print("idx", idx)
+                debug("Part 2 path blocked at idx %s", idx)
                 breaking_loc = f"{x},{y}"
                 break
 
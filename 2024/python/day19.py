@@ -10,9 +10,13 @@ So we're going to use recursion and we're going to use lru_cache probably aaaaan
 yeah I think that's it
 """
 
-from functools import lru_cache
 from pathlib import Path
 
+from counter_util import count_cache
+from memo import memo, memo_scope
+from timing_util import span
+from trace_util import trace
+
 IS_TEST = False
 
 
@@ -32,9 +36,11 @@ def parse_input(input_file: Path) -> tuple[set[str], list[str]]:
     return building_blocks, designs
 
 
-@lru_cache(None)
+@memo(maxsize=1 << 13)
 def can_make_design(design: str, patterns: tuple[str, ...]) -> tuple[bool, int]:
-    @lru_cache(None)
+    # keyed on the index alone, so it only means anything for this design - it goes when
+    # this call returns, and it can't hold more than one entry per index
+    @memo(maxsize=len(design) + 1)
     def dfs(index: int) -> int:
         if index == len(design):
             return 1
@@ -46,23 +52,29 @@ def can_make_design(design: str, patterns: tuple[str, ...]) -> tuple[bool, int]:
         return total_ways
 
     num_ways_to_make = dfs(0)
+    count_cache("can_make_design.dfs", dfs)
     return num_ways_to_make > 0, num_ways_to_make
 
 
 def soln(input_file: Path) -> tuple[int, int]:
     num_possible_combinations_pt1 = 0
     total_num_ways_to_make_everything_pt2 = 0
-    building_blocks, designs = parse_input(input_file)
+    with span("parse"):
+        building_blocks, designs = parse_input(input_file)
     # print(f"Building blocks: {building_blocks}")
     # print(f"Designs: {designs}")
 
     building_blocks_tuple = tuple(building_blocks)
-    for design in designs:
-        can_make, soln_cnt = can_make_design(design, building_blocks_tuple)
-        print(f"Design: {design} can make: {can_make} with {soln_cnt} ways")
-        if can_make:
-            num_possible_combinations_pt1 += 1
-        total_num_ways_to_make_everything_pt2 += soln_cnt
+    # cleared on the way out, so repeat runs (aoc.py --bench) aren't just cache hits
+    with memo_scope(can_make_design):
+        for design in designs:
+            # the count of ways answers both parts
+            with span("count_ways"):
+                can_make, soln_cnt = can_make_design(design, building_blocks_tuple)
+            trace("Design: %s can make: %s with %s ways", design, can_make, soln_cnt)
+            if can_make:
+                num_possible_combinations_pt1 += 1
+            total_num_ways_to_make_everything_pt2 += soln_cnt
 
     return num_possible_combinations_pt1, total_num_ways_to_make_everything_pt2
 
@@ -3,8 +3,10 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
+from grid_search import UNREACHED, bfs, grid_moves
 from input_util import (
     Coordinate,
+    Grid,
     MatrixPoint,
     Point,
     convert_to_point_matrix,
@@ -13,6 +15,8 @@ from input_util import (
     parse_input_as_matrix,
     point_matrix_to_string,
 )
+from timing_util import span
+from trace_util import Lazy, debug, info
 
 ARE_TESTING = False
 TIME_SAVING_CUTOFF = 100
@@ -71,9 +75,9 @@ def print_grouped_savings(grouped_paths: dict[int, List[CheatInfo]]) -> None:
     for savings, paths in sorted(grouped_paths.items(), key=lambda x: -x[0]):
         num_paths = len(paths)
         if num_paths == 1:
-            print(f"  - There is one cheat that saves {savings} picoseconds.")
+            info("  - There is one cheat that saves %s picoseconds.", savings)
         else:
-            print(f"  - There are {num_paths} cheats that save {savings} picoseconds.")
+            info("  - There are %s cheats that save %s picoseconds.", num_paths, savings)
 
 
 def find_starting_and_end_location(reindeer_map: MatrixPoint) -> tuple[Point, Point]:
@@ -121,6 +125,21 @@ def bfs_without_cheats(matrix: MatrixPoint, start_loc: Point, end_loc: Point) ->
     return visited
 
 
+def bfs_without_cheats_v2(grid: Grid, start_loc: Point, end_loc: Point) -> dict[Coordinate, int]:
+    """`bfs_without_cheats` on `Grid` indices through grid_search, same (x, y) -> steps result."""
+    start = grid.index(start_loc.y, start_loc.x)
+    end = grid.index(end_loc.y, end_loc.x)
+    result = bfs(len(grid.cells), [start], grid_moves(grid), goals={end})
+    # like the original, nothing further out than the end
+    end_dist = result.dist[end]
+    visited: dict[Coordinate, int] = {}
+    for index, distance in enumerate(result.dist):
+        if distance != UNREACHED and (end_dist == UNREACHED or distance <= end_dist):
+            row, col = grid.coords(index)
+            visited[(col, row)] = distance
+    return visited
+
+
 def modified_bfs_explore(
     matrix: MatrixPoint, start_loc: Point, end_loc: Point, visited: dict[tuple[int, int], int]
 ) -> list[CheatInfo]:
@@ -137,12 +156,12 @@ def modified_bfs_explore(
             if is_in_matrix_bounds(matrix, (new_x, new_y)):
                 neighbor_point = (new_x, new_y)
                 if neighbor_point == (end_loc.x, end_loc.y):
-                    print(f"Found neighbor point at ({new_x}, {new_y}) leading to end location.")
-                    print(f"Distance: {distance}, Shortest path distance: {shortest_path_distance}")
-                    print("x, y:", x, y)
+                    debug("Found neighbor point at (%s, %s) leading to end location.", new_x, new_y)
+                    debug("Distance: %s, Shortest path distance: %s", distance, shortest_path_distance)
+                    debug("x, y: %s %s", x, y)
                 if neighbor_point in visited:
                     if neighbor_point == (end_loc.x, end_loc.y):
-                        print("then got here")
+                        debug("then got here")
                     if visited[neighbor_point] > distance:
                         # this means we could save some time
                         time_saving = visited[neighbor_point] - distance - 2
@@ -158,11 +177,19 @@ def modified_bfs_explore(
 
 
 def modified_bfs_explore_v2(
-    matrix: MatrixPoint, start_loc: Point, end_loc: Point, visited: dict[Coordinate, int]
+    matrix: MatrixPoint,
+    start_loc: Point,
+    end_loc: Point,
+    visited: dict[Coordinate, int],
+    max_cheat_time: int | None = None,
 ) -> list[CheatInfo]:
     """
     Create a list of CheatInfo by iterating over the visited dictionary.
+
+    `max_cheat_time` defaults to MAX_CHEAT_TIME, with 2 it's part 1 (see `variants`).
     """
+    if max_cheat_time is None:
+        max_cheat_time = MAX_CHEAT_TIME
     cheats = []
 
     sorted_path = sorted(visited, key=visited.get)  # type: ignore
@@ -175,7 +202,7 @@ def modified_bfs_explore_v2(
             # Calculate Manhattan distance!
             distance = abs(x1 - x2) + abs(y1 - y2)
 
-            if distance <= MAX_CHEAT_TIME:
+            if distance <= max_cheat_time:
                 time_saving = visited[coord2] - visited[coord1] - distance
                 if time_saving >= TIME_SAVING_CUTOFF:
                     cheat_info = CheatInfo(
@@ -393,27 +420,34 @@ def soln(input_file: Path) -> tuple[int, int]:
     pt1_ans = 0
     pt2_ans = 0
 
-    race_map_str = parse_input_as_matrix(input_file.read_text(), "str")
-    print(matrix_to_string(race_map_str))
-    race_map = convert_to_point_matrix(race_map_str)
-    start_loc, end_loc = find_starting_and_end_location(race_map)
+    with span("parse"):
+        race_map_str = parse_input_as_matrix(input_file.read_text(), "str")
+        debug("%s", Lazy(matrix_to_string, race_map_str))
+        race_map = convert_to_point_matrix(race_map_str)
+        race_grid = Grid.from_matrix(race_map_str)
+        start_loc, end_loc = find_starting_and_end_location(race_map)
     if ARE_TESTING:
         print("matrix")
         print(point_matrix_to_string(race_map))
         print(f"start_loc: {start_loc}")
         print(f"end_loc: {end_loc}")
-    visited = bfs_without_cheats(race_map, start_loc, end_loc)
-    print("visited", visited)
-    final_path_dests = modified_bfs_explore(matrix=race_map, start_loc=start_loc, end_loc=end_loc, visited=visited)
+    with span("bfs"):
+        visited = bfs_without_cheats_v2(race_grid, start_loc, end_loc)
+    debug("visited %s", visited)
+    with span("part1"):
+        final_path_dests = modified_bfs_explore(matrix=race_map, start_loc=start_loc, end_loc=end_loc, visited=visited)
     pt1_ans = len(final_path_dests)
     grouped_paths = group_paths_by_savings(final_path_dests)
-    print("\nPart 1\n")
+    info("\nPart 1\n")
     print_grouped_savings(grouped_paths)
 
-    final_path_dests = modified_bfs_explore_v2(matrix=race_map, start_loc=start_loc, end_loc=end_loc, visited=visited)
+    with span("part2"):
+        final_path_dests = modified_bfs_explore_v2(
+            matrix=race_map, start_loc=start_loc, end_loc=end_loc, visited=visited
+        )
     pt2_ans = len(final_path_dests)
     grouped_paths = group_paths_by_savings(final_path_dests)
-    print("\nPart 2\n")
+    info("\nPart 2\n")
     print_grouped_savings(grouped_paths)
 
     # print_grouped_savings(grouped_paths)
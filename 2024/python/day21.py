@@ -46,6 +46,8 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Literal, TypedDict
 
+from timing_util import span
+
 DirectionType = Literal["UP", "DOWN", "LEFT", "RIGHT"]
 MovementType = Literal["^", "v", "<", ">"]
 
@@ -592,21 +594,24 @@ def compute_main_robot_step_length_pt2(target_door_codes: list[str], debug: bool
 
 
 def soln(input_file: Path) -> tuple[int, int]:
-    target_door_codes = parse_target_door_codes(input_file)
+    with span("parse"):
+        target_door_codes = parse_target_door_codes(input_file)
     # top_level_movements = modified_bfs_explore(target_door_codes, debug=False)
-    top_level_movements = compute_main_robot_step_length(target_door_codes, debug=False)
-    # print("Mine:")
-    # print(top_level_movements)
-    pt1_score = calculate_complexities(top_level_movements)
+    with span("part1"):
+        top_level_movements = compute_main_robot_step_length(target_door_codes, debug=False)
+        # print("Mine:")
+        # print(top_level_movements)
+        pt1_score = calculate_complexities(top_level_movements)
     # print("compared to")
     # print(SMALL_ANSWER)
     # print(f"score: {calculate_complexities(SMALL_ANSWER)}")
 
     # part 2
-    top_level_movements = compute_main_robot_step_length_pt2(target_door_codes, debug=False)
-    # print("Mine:")
-    # print(top_level_movements)
-    pt2_score = calculate_compexities_pt2(top_level_movements)
+    with span("part2"):
+        top_level_movements = compute_main_robot_step_length_pt2(target_door_codes, debug=False)
+        # print("Mine:")
+        # print(top_level_movements)
+        pt2_score = calculate_compexities_pt2(top_level_movements)
     return pt1_score, pt2_score
 
 
@@ -11,10 +11,12 @@ and then w'ell just sort and find the max one.
 """
 
 from collections import Counter, defaultdict
-from functools import lru_cache
 from pathlib import Path
 from typing import Generator, NamedTuple
 
+from input_util import MappedInput
+from timing_util import span
+
 ARE_TESTING = False
 PRUNE_NUMBER = 16777216
 SIMS_TO_RUN = 2000
@@ -52,7 +54,8 @@ def prune(secret_number: int) -> int:
     return secret_number % PRUNE_NUMBER
 
 
-@lru_cache(maxsize=None)
+# not memoized: nearly every call is a new number out of 16M, so a cache only ever grew (by
+# millions of entries) and missed, and a lookup costs more than the three xor-shifts
 def evolve_secret_number(secret_number: int) -> int:
     """
     - Calculate the result of multiplying the secret number by 64.
@@ -145,15 +148,17 @@ def soln(input_file: Path) -> tuple[int, int]:
     pt2_ans = 0
     banana_optimization_dict: dict[Sequence, int] = defaultdict(int)
 
-    with open(input_file) as f:
-        for line in f:
-            secret_number = int(line.strip())
-            pt1_ans_partial = evolve_secret_number_n_times_opt(secret_number, SIMS_TO_RUN, banana_optimization_dict)
-            pt1_ans += pt1_ans_partial
+    # evolving the secrets also fills in the banana totals for part 2
+    with span("evolve"):
+        with MappedInput(input_file) as mapped:
+            for secret_number in mapped.ints():
+                pt1_ans_partial = evolve_secret_number_n_times_opt(secret_number, SIMS_TO_RUN, banana_optimization_dict)
+                pt1_ans += pt1_ans_partial
 
     # Now we do part 2 where we analyze our optimization dict and which sequence results in
     # the max
-    max_sequence, max_bananas_acquired = max(banana_optimization_dict.items(), key=lambda item: item[1])
+    with span("part2"):
+        max_sequence, max_bananas_acquired = max(banana_optimization_dict.items(), key=lambda item: item[1])
     pt2_ans = max_bananas_acquired
     print(f"The best banana sequence is {max_sequence} with {max_bananas_acquired} bananas acquired")
     return (pt1_ans, pt2_ans)
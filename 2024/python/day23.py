@@ -1,6 +1,8 @@
 from collections import defaultdict
 from pathlib import Path
 
+from timing_util import span
+
 ARE_TESTING = False
 
 NetworkType = dict[str, set[str]]
@@ -106,15 +108,18 @@ def any_node_starts_with_char(node_tuple: NodeTuple, char: str) -> bool:
 def soln(input_file: Path) -> tuple[int, str]:
     pt1_ans = 0
     pt2_ans = 0
-    network_graph = parse_and_build_network_map(input_file)
-    three_connected_nodes = find_three_connected_nodes_set(network_graph)
-    for node_tuple in three_connected_nodes:
-        if any_node_starts_with_char(node_tuple, "t"):
-            pt1_ans += 1
-
-    largest_component = largest_clique(network_graph)
-    sorted_largest_componet = sorted(largest_component)
-    pt2_ans = ",".join(sorted_largest_componet)
+    with span("parse"):
+        network_graph = parse_and_build_network_map(input_file)
+    with span("part1"):
+        three_connected_nodes = find_three_connected_nodes_set(network_graph)
+        for node_tuple in three_connected_nodes:
+            if any_node_starts_with_char(node_tuple, "t"):
+                pt1_ans += 1
+
+    with span("part2"):
+        largest_component = largest_clique(network_graph)
+        sorted_largest_componet = sorted(largest_component)
+        pt2_ans = ",".join(sorted_largest_componet)
     return (pt1_ans, pt2_ans)
 
 
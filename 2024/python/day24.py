@@ -34,9 +34,14 @@ from dataclasses import dataclass
 from enum import Enum, StrEnum, auto
 from itertools import combinations
 from pathlib import Path
-from typing import TypedDict
+from typing import TYPE_CHECKING, TypedDict
 
-from graphviz import Digraph
+from cache_util import disk_cached
+from timing_util import span
+
+if TYPE_CHECKING:
+    # graphviz is only needed for the (commented out) visualizations, so it's imported there
+    from graphviz import Digraph
 
 GateGraphType = dict[str, list[str]]
 NUM_SWAP_PAIRS = 4
@@ -102,6 +107,7 @@ class GateNode(TypedDict):
     operation: Operation
 
 
+@disk_cached
 def parse_input(input_file: Path) -> tuple[dict[str, bool], dict[str, WiringRule], GateGraphType, dict[str, int]]:
     initial_values: dict[str, bool] = {}
     wiring_rules: dict[str, WiringRule] = {}
@@ -146,7 +152,9 @@ def rebuild_gate_graph_and_indegree_mapping(
 
 def create_gate_visualization(
     initial_values: dict[str, bool], wiring_rules: dict[str, WiringRule], gate_graph_network: dict[str, list[str]]
-) -> Digraph:
+) -> "Digraph":
+    from graphviz import Digraph
+
     dot = Digraph(comment="Gate Network")
     dot.attr(size="14,10")
     dot.attr(dpi="1200")
@@ -228,7 +236,9 @@ def create_gate_visualization(
 
 def create_gate_visualization_take2(
     initial_values: dict[str, bool], wiring_rules: dict[str, WiringRule], gate_graph_network: dict[str, list[str]]
-) -> Digraph:
+) -> "Digraph":
+    from graphviz import Digraph
+
     dot = Digraph(comment="Gate Network")
     dot.attr(size="100,30")
     dot.attr(dpi="1200")
@@ -577,12 +587,14 @@ def test_adder_with_values(
 def soln(input_file: Path) -> tuple[int, str]:
     part1_soln = 0
     part2_soln = 0
-    initial_values, wiring_rules, gate_graph_network, indegree_mapping = parse_input(input_file)
+    with span("parse"):
+        initial_values, wiring_rules, gate_graph_network, indegree_mapping = parse_input(input_file)
 
     working_indegree_mapping = indegree_mapping.copy()
     # Part 1
-    resolved_values = solve_gate_logic(initial_values, wiring_rules, gate_graph_network, working_indegree_mapping)
-    _, part1_soln = get_binary_and_int_val(resolved_values, "z")
+    with span("part1"):
+        resolved_values = solve_gate_logic(initial_values, wiring_rules, gate_graph_network, working_indegree_mapping)
+        _, part1_soln = get_binary_and_int_val(resolved_values, "z")
     print(f"Part 1: {part1_soln}")
 
     # Part 2
@@ -604,7 +616,8 @@ def soln(input_file: Path) -> tuple[int, str]:
     # )
     # print("Gates to swap", gates_to_swap)
     # print("Result", result)
-    swaps = find_all_swaps(wiring_rules, initial_values, gate_graph_network, exp_z_val)
+    with span("part2"):
+        swaps = find_all_swaps(wiring_rules, initial_values, gate_graph_network, exp_z_val)
     flat_swaps = [gate for pair in swaps for gate in pair]
     part2_soln = ",".join(sorted(flat_swaps))
     print("swaps", swaps)
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Literal, Tuple
 
 from input_util import MatrixStr, matrix_to_string, parse_input_as_matrix
+from timing_util import span
 
 ARE_TESTING = False
 
@@ -114,8 +115,10 @@ def calculate_unique_lock_key_pairs(locks: list[Lock], keys: list[Key]) -> int:
 def soln(input_file: Path) -> tuple[int, int]:
     pt1_soln = 0
     pt2_soln = 0
-    locks, keys = parse_input(input_file)
-    pt1_soln = calculate_unique_lock_key_pairs(locks, keys)
+    with span("parse"):
+        locks, keys = parse_input(input_file)
+    with span("part1"):
+        pt1_soln = calculate_unique_lock_key_pairs(locks, keys)
     return (pt1_soln, pt2_soln)
 
 
@@ -0,0 +1,262 @@
+"""
+Shortest path searches over integer state ids.
+
+A state is just an int in `range(num_states)`: a `Grid` index, `pack_xy(x, y, width)`,
+or `pack_state(index, direction)` when facing matters (day16). `dist` and `prev` are flat
+lists indexed by state, so a search never hashes anything or builds an object per step.
+The day decides what a move is by passing a function that returns the next states:
+
+    result = bfs(len(grid.cells), [start], grid_moves(grid), goals={end})
+    result.dist[end], result.path_to(end)
+
+    # weighted: moves return (next_state, cost)
+    result = dijkstra(num_states, [start], moves, goals=end_states, track_preds=True)
+    seats = result.dag_states(end_states)
+
+With `track_preds` every predecessor on *some* shortest path is kept, not just the first
+one found, which is what "every tile on any best path" questions want. The search then
+keeps going until everything as cheap as the goal is settled.
+
+Each search hands its expanded / pushed / popped totals to `counter_util` when it's done.
+"""
+
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Collection, Iterable
+
+from counter_util import HEAP_POPS, HEAP_PUSHES, NODES_EXPANDED, QUEUE_PUSHES, REVISITS, count
+from input_util import Grid
+
+UNREACHED = -1
+
+Moves = Callable[[int], Iterable[int]]
+WeightedMoves = Callable[[int], Iterable[tuple[int, int]]]
+Heuristic = Callable[[int], int]
+
+
+@dataclass
+class SearchResult:
+    # distance from the nearest start, UNREACHED if the search never got there
+    dist: list[int]
+    # the state each one was first reached from, UNREACHED for starts and unreached states
+    prev: list[int]
+    # every predecessor on a shortest path, only filled in with track_preds
+    preds: dict[int, list[int]] = field(default_factory=dict)
+    # the first goal state settled, UNREACHED if there were no goals or none were reachable
+    goal: int = UNREACHED
+
+    def reached(self, state: int) -> bool:
+        return self.dist[state] != UNREACHED
+
+    def path_to(self, state: int) -> list[int]:
+        """Start to `state` inclusive, following `prev`. Empty if `state` was never reached."""
+        if self.dist[state] == UNREACHED:
+            return []
+        path = [state]
+        while self.prev[state] != UNREACHED:
+            state = self.prev[state]
+            path.append(state)
+        return path[::-1]
+
+    def dag_states(self, targets: Iterable[int]) -> set[int]:
+        """Every state on at least one shortest path to one of `targets` (needs `track_preds`)."""
+        seen: set[int] = set()
+        stack = [target for target in targets if self.dist[target] != UNREACHED]
+        while stack:
+            state = stack.pop()
+            if state in seen:
+                continue
+            seen.add(state)
+            stack.extend(self.preds.get(state, ()))
+        return seen
+
+
+def _new_result(num_states: int, starts: Iterable[int]) -> tuple[SearchResult, list[int]]:
+    result = SearchResult(dist=[UNREACHED] * num_states, prev=[UNREACHED] * num_states)
+    start_list = list(starts)
+    for start in start_list:
+        result.dist[start] = 0
+    return result, start_list
+
+
+def bfs(
+    num_states: int,
+    starts: Iterable[int],
+    moves: Moves,
+    goals: Collection[int] | None = None,
+    track_preds: bool = False,
+) -> SearchResult:
+    """Every move costs 1. Without `goals` this floods everything reachable."""
+    result, start_list = _new_result(num_states, starts)
+    dist, prev, preds = result.dist, result.prev, result.preds
+    queue = deque(start_list)
+    goal_dist = None
+    expanded = 0
+    pushes = 0
+    while queue:
+        state = queue.popleft()
+        state_dist = dist[state]
+        if goal_dist is not None and state_dist > goal_dist:
+            break
+        if goals is not None and goal_dist is None and state in goals:
+            result.goal = state
+            goal_dist = state_dist
+            if not track_preds:
+                break
+        expanded += 1
+        next_dist = state_dist + 1
+        for next_state in moves(state):
+            if dist[next_state] == UNREACHED:
+                dist[next_state] = next_dist
+                prev[next_state] = state
+                queue.append(next_state)
+                pushes += 1
+                if track_preds:
+                    preds[next_state] = [state]
+            elif track_preds and dist[next_state] == next_dist:
+                preds.setdefault(next_state, []).append(state)
+    count(NODES_EXPANDED, expanded)
+    count(QUEUE_PUSHES, pushes)
+    return result
+
+
+def zero_one_bfs(
+    num_states: int,
+    starts: Iterable[int],
+    moves: WeightedMoves,
+    goals: Collection[int] | None = None,
+    track_preds: bool = False,
+) -> SearchResult:
+    """Moves cost 0 or 1: free moves go on the front of the deque, so there's no heap."""
+    result, start_list = _new_result(num_states, starts)
+    dist, prev, preds = result.dist, result.prev, result.preds
+    queue = deque((0, start) for start in start_list)
+    goal_dist = None
+    expanded = 0
+    pushes = 0
+    revisits = 0
+    while queue:
+        state_dist, state = queue.popleft()
+        if state_dist > dist[state]:
+            # reached more cheaply since this was queued
+            revisits += 1
+            continue
+        if goal_dist is not None and state_dist > goal_dist:
+            break
+        if goals is not None and goal_dist is None and state in goals:
+            result.goal = state
+            goal_dist = state_dist
+            if not track_preds:
+                break
+        expanded += 1
+        for next_state, cost in moves(state):
+            next_dist = state_dist + cost
+            known = dist[next_state]
+            if known == UNREACHED or next_dist < known:
+                dist[next_state] = next_dist
+                prev[next_state] = state
+                if cost:
+                    queue.append((next_dist, next_state))
+                else:
+                    queue.appendleft((next_dist, next_state))
+                pushes += 1
+                if track_preds:
+                    preds[next_state] = [state]
+            elif track_preds and next_dist == known:
+                preds.setdefault(next_state, []).append(state)
+    count(NODES_EXPANDED, expanded)
+    count(QUEUE_PUSHES, pushes)
+    count(REVISITS, revisits)
+    return result
+
+
+def dijkstra(
+    num_states: int,
+    starts: Iterable[int],
+    moves: WeightedMoves,
+    goals: Collection[int] | None = None,
+    track_preds: bool = False,
+    heuristic: Heuristic | None = None,
+) -> SearchResult:
+    """
+    Non-negative integer costs. With a `heuristic` (a lower bound on the remaining cost, and
+    a consistent one if `track_preds` is on) this is A*, see `astar`.
+    """
+    result, start_list = _new_result(num_states, starts)
+    dist, prev, preds = result.dist, result.prev, result.preds
+    # (priority, dist, state) - the priority is just the dist for plain dijkstra
+    heap = [(heuristic(start) if heuristic else 0, 0, start) for start in start_list]
+    heapq.heapify(heap)
+    goal_dist = None
+    expanded = 0
+    pushes = 0
+    revisits = 0
+    while heap:
+        priority, state_dist, state = heapq.heappop(heap)
+        if state_dist > dist[state]:
+            revisits += 1
+            continue
+        # the heuristic is 0 at a goal, so nothing popped after this can be on a cheapest path
+        if goal_dist is not None and priority > goal_dist:
+            break
+        if goals is not None and goal_dist is None and state in goals:
+            result.goal = state
+            goal_dist = state_dist
+            if not track_preds:
+                break
+        expanded += 1
+        for next_state, cost in moves(state):
+            next_dist = state_dist + cost
+            known = dist[next_state]
+            if known == UNREACHED or next_dist < known:
+                dist[next_state] = next_dist
+                prev[next_state] = state
+                priority = next_dist + heuristic(next_state) if heuristic else next_dist
+                heapq.heappush(heap, (priority, next_dist, next_state))
+                pushes += 1
+                if track_preds:
+                    preds[next_state] = [state]
+            elif track_preds and next_dist == known:
+                preds.setdefault(next_state, []).append(state)
+    count(NODES_EXPANDED, expanded)
+    count(HEAP_PUSHES, pushes)
+    # whatever's left on the heap when the search stops early was never popped
+    count(HEAP_POPS, len(start_list) + pushes - len(heap))
+    count(REVISITS, revisits)
+    return result
+
+
+def astar(
+    num_states: int,
+    starts: Iterable[int],
+    moves: WeightedMoves,
+    goals: Collection[int],
+    heuristic: Heuristic,
+    track_preds: bool = False,
+) -> SearchResult:
+    return dijkstra(num_states, starts, moves, goals, track_preds, heuristic)
+
+
+def grid_moves(grid: Grid, walls: str = "#") -> Moves:
+    """Unit cost moves between the 4-neighbours of a `Grid` index that aren't walls (or off the map)."""
+    cells = grid.cells
+    offsets = grid.neighbours4
+    blocked = {ord(wall) for wall in walls} | {grid.sentinel}
+
+    def moves(index: int) -> list[int]:
+        return [index + offset for offset in offsets if cells[index + offset] not in blocked]
+
+    return moves
+
+
+def manhattan_heuristic(grid: Grid, target: int) -> Heuristic:
+    """Steps to `target` ignoring walls, for `astar` over `Grid` indices."""
+    target_row, target_col = divmod(target, grid.width)
+    width = grid.width
+
+    def heuristic(index: int) -> int:
+        row, col = divmod(index, width)
+        return abs(row - target_row) + abs(col - target_col)
+
+    return heuristic
@@ -1,5 +1,11 @@
+import mmap
+import re
 from dataclasses import dataclass
-from typing import Any, List, Literal, TypeVar, Union, overload
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, List, Literal, NamedTuple, TypeVar, Union, overload
+
+if TYPE_CHECKING:
+    import numpy as np
 
 Coordinate = tuple[int, int]
 T = TypeVar("T", str, int, "Point")
@@ -10,6 +16,10 @@ MatrixInt = Matrix[int]
 
 DIRECTION_VECS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
 
+INT_BYTES_PATTERN = re.compile(rb"-?\d+")
+# every byte that can't be part of an int becomes a space, so the ints are what `split()` leaves
+INT_BYTES_TABLE = bytes(byte if byte in b"-0123456789" else ord(" ") for byte in range(256))
+
 
 @overload
 def parse_input_as_matrix(input_str: str, int_or_str: Literal["int"]) -> MatrixInt: ...
@@ -25,6 +35,288 @@ def parse_input_as_matrix(input_str: str, int_or_str: Literal["int", "str"] = "s
     return [list(line) for line in input_str.split("\n") if line]
 
 
+def _ints_from_bytes(data: bytes) -> list[int]:
+    try:
+        return list(map(int, data.translate(INT_BYTES_TABLE).split()))
+    except ValueError:
+        # a `-` that isn't a sign ("a-b", "5-3"), the regex knows the difference
+        return list(map(int, INT_BYTES_PATTERN.findall(data)))
+
+
+def _as_bytes(input_source: Path | str | bytes) -> bytes:
+    if isinstance(input_source, Path):
+        return input_source.read_bytes()
+    if isinstance(input_source, str):
+        return input_source.encode()
+    return input_source
+
+
+def parse_input_as_ndarray(
+    input_source: Path | str | bytes, int_or_str: Literal["int", "str"] = "str"
+) -> "np.ndarray":
+    """
+    `parse_input_as_matrix` without a Python object per cell. A `Path` is read once (a `str`
+    is the text itself) and the result is a `(rows, cols)` view straight onto those bytes,
+    the newline column is just strided over. "str" gives the `uint8` character codes (compare against `ord("#")`),
+    "int" subtracts `ord("0")` in one vectorised pass, so anything that isn't a digit comes
+    out negative (`.` is -2).
+
+    The "str" view is read-only since it shares memory with the bytes, `.copy()` it to write.
+    """
+    import numpy as np
+
+    # example strings in the day modules start with a newline
+    data = _as_bytes(input_source).lstrip(b"\r\n")
+    if not data.endswith(b"\n"):
+        data += b"\n"
+    stride = data.index(b"\n") + 1
+    cols = stride - 2 if data[stride - 2 : stride - 1] == b"\r" else stride - 1
+    rows, remainder = divmod(len(data), stride)
+    if remainder or data[stride - 1 :: stride].count(b"\n") != rows:
+        raise ValueError(f"Input is not a rectangular grid ({len(data)} bytes, {stride} per row)")
+
+    grid = np.frombuffer(data, dtype=np.uint8).reshape(rows, stride)[:, :cols]
+    if int_or_str == "int":
+        return grid.view(np.int8) - ord("0")
+    return grid
+
+
+@overload
+def extract_ints(input_source: Path | str | bytes, per_line: Literal[False] = False) -> list[int]: ...
+
+
+@overload
+def extract_ints(input_source: Path | str | bytes, per_line: Literal[True]) -> list[list[int]]: ...
+
+
+def extract_ints(input_source: Path | str | bytes, per_line: bool = False) -> list[int] | list[list[int]]:
+    """
+    Every integer in a file (`Path`) or text, signs included, in one pass over the bytes
+    instead of a `map(int, line.split(...))` per line. `per_line` keeps the line structure
+    (ragged, blank lines skipped), for inputs like day02 where each line is its own list.
+
+    This is a `translate` + `split`, which is a couple of times quicker than running a regex,
+    so `"p=0,4 v=3,-3"` gives `[0, 4, 3, -3]` and `"Button A: X+94"` gives `[94]`.
+    """
+    data = _as_bytes(input_source)
+    if per_line:
+        return [_ints_from_bytes(line) for line in data.splitlines() if line.strip()]
+    return _ints_from_bytes(data)
+
+
+def extract_ints_ndarray(input_source: Path | str | bytes, columns: int | None = None) -> "np.ndarray":
+    """
+    `extract_ints` as a flat `int64` array, or `(-1, columns)` when every record has the
+    same number of fields (4 per day14 robot, 6 per day13 machine).
+    """
+    import numpy as np
+
+    values = np.array(extract_ints(input_source), dtype=np.int64)
+    if columns is None:
+        return values
+    if len(values) % columns:
+        raise ValueError(f"{len(values)} ints don't split into rows of {columns}")
+    return values.reshape(-1, columns)
+
+
+class MappedInput:
+    """
+    Reads an input through `mmap` instead of `read_text()`, for inputs too big to want in
+    memory twice (or at all). Only the pages being looked at get read in, and lines come
+    out as `memoryview` slices of the mapping rather than copies:
+
+        with MappedInput(input_file) as mapped:
+            for left, right in zip(*[mapped.ints()] * 2):
+                ...
+
+    Views handed out keep the mapping alive after `close()`, so either copy what you keep
+    (`bytes(line)`) or be done with it before the `with` block ends.
+    """
+
+    def __init__(self, input_file: Path | str) -> None:
+        self.path = Path(input_file)
+        with open(self.path, "rb") as f:
+            # mmap refuses zero length files, an empty input is just no bytes
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.path.stat().st_size else None
+        self._data: mmap.mmap | bytes = self._mmap if self._mmap is not None else b""
+        self.buffer = memoryview(self._data)
+
+    def __enter__(self) -> "MappedInput":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def close(self) -> None:
+        self.buffer.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # someone still holds a line, the mapping goes when they let go of it
+                pass
+
+    def lines(self) -> Iterator[memoryview]:
+        """Every line without its line ending, blank lines included."""
+        data = self._data
+        start = 0
+        end = len(data)
+        while start < end:
+            newline = data.find(b"\n", start)
+            if newline == -1:
+                newline = end
+            stop = newline - 1 if newline > start and data[newline - 1 : newline] == b"\r" else newline
+            yield self.buffer[start:stop]
+            start = newline + 1
+
+    def ints(self) -> Iterator[int]:
+        """
+        Every integer in the file, in order, signs included. Scanned a chunk at a time on
+        the raw bytes, so this never builds a `str` of the file or a list of its lines.
+        """
+        for chunk in self.int_chunks():
+            yield from chunk
+
+    def int_chunks(self, whitespace_separated: bool = False) -> Iterator[list[int]]:
+        """
+        `ints()` a chunk's worth at a time, which is a lot cheaper than a generator step per
+        number. With `whitespace_separated` (the file is nothing but numbers and whitespace,
+        like day01 or day22) it skips the `extract_ints` translate and just splits.
+        """
+        for chunk in self.chunks():
+            if whitespace_separated:
+                yield list(map(int, bytes(chunk).split()))
+            else:
+                yield _ints_from_bytes(bytes(chunk))
+
+    def finditer(self, pattern: "re.Pattern[bytes]") -> Iterator["re.Match[bytes]"]:
+        return pattern.finditer(self._data)
+
+    def chunks(self, chunk_size: int = 1 << 20) -> Iterator[memoryview]:
+        """
+        Roughly `chunk_size` bytes at a time, each ending on a line boundary so no line or
+        number is split between two chunks. A single line longer than `chunk_size` comes out
+        whole.
+        """
+        data = self._data
+        start = 0
+        end = len(data)
+        while start < end:
+            stop = min(start + chunk_size, end)
+            if stop < end:
+                newline = data.rfind(b"\n", start, stop)
+                stop = newline + 1 if newline != -1 else data.find(b"\n", stop) + 1 or end
+            yield self.buffer[start:stop]
+            start = stop
+
+
+class Grid:
+    """
+    A character grid stored as one flat `bytearray`, row-major, with a one cell border of
+    `sentinel` all the way round. Cells are addressed by a single int index, so moving is
+    `index + offset`, and walking off the map lands on the sentinel rather than needing a
+    bounds check:
+
+        grid = Grid.from_str(input_file.read_text())
+        for offset in grid.neighbours4:
+            if grid.cells[index + offset] == ord("#"):
+                ...
+
+    `clone()` is copy-on-write: clones share storage until one of them is written to
+    through `grid[index] = ...` or `writable()`.
+    """
+
+    __slots__ = ("num_rows", "num_cols", "width", "sentinel", "cells", "neighbours4", "neighbours8", "_shared")
+
+    def __init__(self, num_rows: int, num_cols: int, cells: bytearray, sentinel: int = 0) -> None:
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.width = num_cols + 2
+        self.sentinel = sentinel
+        self.cells = cells
+        # same order as DIRECTION_VECS: right, down, left, up
+        self.neighbours4 = (1, self.width, -1, -self.width)
+        self.neighbours8 = self.neighbours4 + (self.width + 1, self.width - 1, -self.width - 1, -self.width + 1)
+        self._shared = False
+
+    @classmethod
+    def from_str(cls, input_str: str, sentinel: int = 0) -> "Grid":
+        lines = [line for line in input_str.split("\n") if line]
+        num_cols = max(len(line) for line in lines)
+        width = num_cols + 2
+        border = bytes([sentinel]) * width
+        cells = bytearray(border)
+        for line in lines:
+            row = line.encode().ljust(num_cols, bytes([sentinel]))
+            cells += bytes([sentinel]) + row + bytes([sentinel])
+        cells += border
+        return cls(len(lines), num_cols, cells, sentinel)
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix, sentinel: int = 0) -> "Grid":
+        return cls.from_str(matrix_to_string(matrix), sentinel)
+
+    def index(self, row: int, col: int) -> int:
+        return (row + 1) * self.width + col + 1
+
+    def coords(self, index: int) -> Coordinate:
+        row, col = divmod(index, self.width)
+        return row - 1, col - 1
+
+    def in_bounds(self, index: int) -> bool:
+        return self.cells[index] != self.sentinel
+
+    def indices(self) -> range:
+        """Every index from the first real cell to the last, border columns included."""
+        return range(self.width + 1, len(self.cells) - self.width - 1)
+
+    def find(self, char: str) -> int:
+        return self.cells.index(ord(char))
+
+    def find_all(self, char: str) -> list[int]:
+        value = ord(char)
+        return [index for index, cell in enumerate(self.cells) if cell == value]
+
+    def char_at(self, index: int) -> str:
+        return chr(self.cells[index])
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        if self._shared:
+            self._unshare()
+        self.cells[index] = value
+
+    def _unshare(self) -> None:
+        self.cells = bytearray(self.cells)
+        self._shared = False
+
+    def writable(self) -> bytearray:
+        """The storage, copied first if it's shared with a clone, for hot loops that write to it directly."""
+        if self._shared:
+            self._unshare()
+        return self.cells
+
+    def clone(self) -> "Grid":
+        twin = Grid(self.num_rows, self.num_cols, self.cells, self.sentinel)
+        twin._shared = self._shared = True
+        return twin
+
+    def to_str(self) -> str:
+        rows = (
+            self.cells[self.index(row, 0) : self.index(row, 0) + self.num_cols].decode()
+            for row in range(self.num_rows)
+        )
+        return "\n".join(rows)
+
+    def __str__(self) -> str:
+        return self.to_str()
+
+
 def matrix_to_string(matrix: Matrix[T]) -> str:
     return "\n".join("".join(map(str, row)) for row in matrix)
 
@@ -70,6 +362,65 @@ class PointWDirection:
         return (self.x, self.y, self.direction) < (other.x, other.y, other.direction)
 
 
+# The frozen dataclasses above hash and compare in Python (a tuple gets built for every
+# `hash()` / `<`), which adds up when they're dict keys and heap entries in a search. These
+# are drop-in replacements (same fields, same ordering) that do both in C, and below them
+# the int packing for when even a tuple per state is too much.
+
+
+class PointTuple(NamedTuple):
+    x: int
+    y: int
+    value: Any
+
+
+class PointWDirectionTuple(NamedTuple):
+    x: int
+    y: int
+    direction: DirectionType
+
+    def __repr__(self):
+        return f"Point({self.x}, {self.y}, {self.direction})"
+
+
+# same order as DIRECTION_VECS, so a direction index is also an index into that
+DIRECTION_NAMES: tuple[DirectionType, ...] = ("east", "south", "west", "north")
+DIRECTION_INDEX: dict[DirectionType, int] = {name: idx for idx, name in enumerate(DIRECTION_NAMES)}
+
+
+def pack_xy(x: int, y: int, width: int) -> int:
+    return y * width + x
+
+
+def unpack_xy(index: int, width: int) -> Coordinate:
+    """Back to `(x, y)`, note that's the other way round from `Grid.coords`."""
+    y, x = divmod(index, width)
+    return x, y
+
+
+def pack_state(index: int, direction: int) -> int:
+    """A position + facing as one int, `index * 4 + direction`."""
+    return index * 4 + direction
+
+
+def unpack_state(state: int) -> tuple[int, int]:
+    return divmod(state, 4)
+
+
+def point_to_index(point: "Point | PointTuple", width: int) -> int:
+    return point.y * width + point.x
+
+
+def point_wdirection_to_state(point: "PointWDirection | PointWDirectionTuple", width: int) -> int:
+    return (point.y * width + point.x) * 4 + DIRECTION_INDEX[point.direction]
+
+
+def state_to_point_wdirection(state: int, width: int) -> PointWDirectionTuple:
+    index, direction = divmod(state, 4)
+    y, x = divmod(index, width)
+    return PointWDirectionTuple(x, y, DIRECTION_NAMES[direction])
+
+
 MatrixPoint = Matrix[Point]
 
 
@@ -0,0 +1,172 @@
+"""
+Synthetic puzzle inputs.
+
+The real inputs are git-ignored and are all roughly the same size, which makes it hard to
+see how a solution scales. Every `inputgen/dayNN.py` has a
+
+    generate(scale: int, rng: random.Random) -> str
+
+that produces a valid input for that day, where scale 1 is about the size of a real input
+and the main size parameter (lines, cells, nodes, bits...) grows linearly with `scale`.
+Everything is driven by the `rng` so a (day, scale, seed) triple is always the same input.
+
+    python -m inputgen --all --scales 1 10 100 --out-dir ../inputs/generated
+    python aoc.py 9 --inputs-dir ../inputs/generated/x10 --bench
+
+Each input gets a `dayNN.meta.json` stamp next to it (seed, scale and a hash of the
+generator), and `ensure_input` only reuses a file whose stamp still matches.
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import math
+import random
+import re
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+INPUTGEN_DIR = Path(__file__).parent
+DEFAULT_OUT_DIR = INPUTGEN_DIR.parent.parent / "inputs" / "generated"
+
+DEFAULT_SEED = 2024
+DEFAULT_SCALES = (1, 10, 100, 1000)
+
+GENERATOR_MODULE_PATTERN = re.compile(r"^day(\d{2})\.py$")
+
+GeneratorFunc = Callable[[int, random.Random], str]
+
+
+def discover_generators() -> list[str]:
+    return sorted(
+        f"day{match.group(1)}"
+        for path in INPUTGEN_DIR.iterdir()
+        if (match := GENERATOR_MODULE_PATTERN.match(path.name))
+    )
+
+
+def get_generator(day: str) -> GeneratorFunc:
+    if day not in discover_generators():
+        raise KeyError(f"No input generator for {day}")
+    return importlib.import_module(f"inputgen.{day}").generate
+
+
+def make_rng(day: str, scale: int, seed: int = DEFAULT_SEED) -> random.Random:
+    # str seeds are hashed deterministically, unlike hash() of a tuple
+    return random.Random(f"{day}:{scale}:{seed}")
+
+
+def generate(day: str, scale: int = 1, seed: int = DEFAULT_SEED) -> str:
+    if scale < 1:
+        raise ValueError(f"Scale has to be at least 1, got {scale}")
+    return get_generator(day)(scale, make_rng(day, scale, seed))
+
+
+def scale_arg(text: str) -> int:
+    """argparse `type` for `--scales`, so a bad scale is a usage error rather than a traceback out of `generate`."""
+    try:
+        scale = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a whole number: {text!r}") from None
+    if scale < 1:
+        raise argparse.ArgumentTypeError(f"has to be at least 1, got {scale}")
+    return scale
+
+
+def generator_version(day: str) -> str:
+    """Hash of the day's generator and the shared helpers here, so editing either one shows up."""
+    digest = hashlib.sha256()
+    for path in (INPUTGEN_DIR / "__init__.py", INPUTGEN_DIR / f"{day}.py"):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def input_stamp(day: str, scale: int, seed: int) -> dict[str, Any]:
+    return {"day": day, "scale": scale, "seed": seed, "generator": generator_version(day)}
+
+
+def stamp_path(input_path: Path) -> Path:
+    """`x10/day06.txt` -> `x10/day06.meta.json`, which `aoc.py --inputs-dir` doesn't look at."""
+    return input_path.with_suffix(".meta.json")
+
+
+def read_stamp(input_path: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(stamp_path(input_path).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def write_stamped(input_path: Path, text: str, stamp: dict[str, Any]) -> None:
+    input_path.parent.mkdir(parents=True, exist_ok=True)
+    input_path.write_text(text)
+    stamp_path(input_path).write_text(json.dumps(stamp, sort_keys=True) + "\n")
+
+
+def write_inputs(days: Sequence[str], scales: Sequence[int], seed: int, out_dir: Path) -> list[Path]:
+    """Writes `<out_dir>/x<scale>/<day>.txt`, so each scale directory works with `aoc.py --inputs-dir`."""
+    written = []
+    for scale in scales:
+        for day in days:
+            path = out_dir / f"x{scale}" / f"{day}.txt"
+            write_stamped(path, generate(day, scale, seed), input_stamp(day, scale, seed))
+            written.append(path)
+    return written
+
+
+def ensure_input(day: str, scale: int, seed: int = DEFAULT_SEED, out_dir: Path = DEFAULT_OUT_DIR) -> Path:
+    """
+    Same layout as `write_inputs`, but reuses what's already there if its stamp says it came
+    from this seed and this version of the generator. Anything else (another seed, an edited
+    generator, a file with no stamp) gets regenerated.
+    """
+    path = out_dir / f"x{scale}" / f"{day}.txt"
+    stamp = input_stamp(day, scale, seed)
+    if not path.exists() or read_stamp(path) != stamp:
+        write_stamped(path, generate(day, scale, seed), stamp)
+    return path
+
+
+# Shared helpers for the generators
+
+
+def scaled_side(base_side: int, scale: int) -> int:
+    """Grid side length such that the number of cells grows linearly with `scale`."""
+    return max(3, round(base_side * math.sqrt(scale)))
+
+
+def grid_to_str(grid: list[list[str]]) -> str:
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def carve_maze(num_rows: int, num_cols: int, rng: random.Random) -> list[list[str]]:
+    """
+    A perfect maze (exactly one route between any two cells) carved with an iterative
+    randomized DFS. Cells live on odd coordinates and the border is all wall, so the
+    dimensions should be odd.
+    """
+    grid = [["#"] * num_cols for _ in range(num_rows)]
+    start = (1, 1)
+    grid[1][1] = "."
+    stack = [start]
+    while stack:
+        row, col = stack[-1]
+        neighbours = [
+            (row + d_row, col + d_col)
+            for d_row, d_col in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < row + d_row < num_rows - 1 and 0 < col + d_col < num_cols - 1
+            and grid[row + d_row][col + d_col] == "#"
+        ]
+        if not neighbours:
+            stack.pop()
+            continue
+        next_row, next_col = rng.choice(neighbours)
+        grid[(row + next_row) // 2][(col + next_col) // 2] = "."
+        grid[next_row][next_col] = "."
+        stack.append((next_row, next_col))
+    return grid
+
+
+def odd(value: int) -> int:
+    return value if value % 2 else value + 1
@@ -0,0 +1,47 @@
+"""
+    python -m inputgen 6 9 22
+    python -m inputgen --all --scales 1 10 --seed 7 --out-dir /tmp/generated
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from inputgen import DEFAULT_OUT_DIR, DEFAULT_SCALES, DEFAULT_SEED, discover_generators, scale_arg, write_inputs
+from registry import normalize_day
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m inputgen", description="Generate synthetic, scaled Advent of Code 2024 inputs."
+    )
+    parser.add_argument("days", nargs="*", help="days to generate, e.g. `6` or `day06` (default: all)")
+    parser.add_argument("--all", action="store_true", help="generate every day that has a generator")
+    parser.add_argument(
+        "--scales", type=scale_arg, nargs="+", default=list(DEFAULT_SCALES), help="scale factors, 1 is real-input sized"
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    available = discover_generators()
+    try:
+        days = available if args.all or not args.days else [normalize_day(day) for day in args.days]
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    missing = [day for day in days if day not in available]
+    if missing:
+        print(f"error: no input generator for: {', '.join(missing)}", file=sys.stderr)
+        return 2
+
+    for path in write_inputs(days, args.scales, args.seed, args.out_dir):
+        print(f"{path} ({path.stat().st_size:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
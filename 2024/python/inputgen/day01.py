@@ -0,0 +1,16 @@
+"""Two columns of location ids, ~1000 lines in a real input."""
+
+import random
+
+BASE_LINES = 1000
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    num_lines = BASE_LINES * scale
+    # real inputs share plenty of ids between the lists, which is what makes part 2 interesting
+    shared_ids = [rng.randint(10_000, 99_999) for _ in range(max(1, num_lines // 4))]
+
+    def location_id() -> int:
+        return rng.choice(shared_ids) if rng.random() < 0.3 else rng.randint(10_000, 99_999)
+
+    return "".join(f"{location_id()}   {location_id()}\n" for _ in range(num_lines))
@@ -0,0 +1,22 @@
+"""Reports of 5-8 levels, mostly monotonic with steps of 1-3 and the odd bad level."""
+
+import random
+
+BASE_REPORTS = 1000
+
+
+def generate_report(rng: random.Random) -> list[int]:
+    length = rng.randint(5, 8)
+    direction = rng.choice((-1, 1))
+    levels = [rng.randint(10, 90)]
+    for _ in range(length - 1):
+        levels.append(levels[-1] + direction * rng.randint(1, 3))
+    # about half the reports get one or two levels knocked out of line
+    for _ in range(rng.choice((0, 0, 1, 2))):
+        idx = rng.randrange(length)
+        levels[idx] += rng.choice((-4, -1, 0, 1, 4))
+    return [max(1, level) for level in levels]
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "".join(" ".join(map(str, generate_report(rng))) + "\n" for _ in range(BASE_REPORTS * scale))
@@ -0,0 +1,41 @@
+"""Corrupted memory: junk with `mul(a,b)`, `do()` and `don't()` sprinkled through it."""
+
+import random
+
+BASE_LINES = 6
+LINE_LENGTH = 3000
+JUNK_CHARS = "abcdefghijklmnopqrstuvwxyz()[]{}<>,;:'!@#$%^&*-+ _?/~0123456789"
+
+
+def make_token(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.55:
+        return f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+    if roll < 0.7:
+        return "do()"
+    if roll < 0.85:
+        return "don't()"
+    # near misses the regex has to skip over
+    return rng.choice(
+        (
+            f"mul({rng.randint(1, 999)},{rng.randint(1, 999)}]",
+            f"mul[{rng.randint(1, 999)},{rng.randint(1, 999)})",
+            f"mul ( {rng.randint(1, 999)},{rng.randint(1, 999)})",
+            f"mul({rng.randint(1, 999)}, {rng.randint(1, 999)})",
+            "don't",
+            "do(",
+        )
+    )
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(BASE_LINES * scale):
+        parts = []
+        length = 0
+        while length < LINE_LENGTH:
+            part = "".join(rng.choices(JUNK_CHARS, k=rng.randint(0, 8))) + make_token(rng)
+            parts.append(part)
+            length += len(part)
+        lines.append("".join(parts))
+    return "\n".join(lines) + "\n"
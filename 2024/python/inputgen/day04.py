@@ -0,0 +1,12 @@
+"""Word search grid of X / M / A / S, 140x140 in a real input."""
+
+import random
+
+from inputgen import scaled_side
+
+BASE_SIDE = 140
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = scaled_side(BASE_SIDE, scale)
+    return "".join("".join(rng.choices("XMAS", k=side)) + "\n" for _ in range(side))
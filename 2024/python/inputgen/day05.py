@@ -0,0 +1,29 @@
+"""
+Page ordering rules followed by updates.
+
+Like the real inputs the rules cover every pair of pages from one hidden ordering, so any
+update can be put back in order, and updates have an odd number of pages.
+"""
+
+import random
+
+NUM_PAGES = 49
+BASE_UPDATES = 200
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    pages = rng.sample(range(10, 100), NUM_PAGES)
+    rules = [(pages[i], pages[j]) for i in range(NUM_PAGES) for j in range(i + 1, NUM_PAGES)]
+    rng.shuffle(rules)
+
+    rank = {page: idx for idx, page in enumerate(pages)}
+    updates = []
+    for _ in range(BASE_UPDATES * scale):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=rank.__getitem__)
+        updates.append(update)
+
+    rule_lines = "".join(f"{before}|{after}\n" for before, after in rules)
+    update_lines = "".join(",".join(map(str, update)) + "\n" for update in updates)
+    return f"{rule_lines}\n{update_lines}"
@@ -0,0 +1,41 @@
+"""
+Guard map with a `^` guard and `#` obstacles.
+
+The guard has to walk off the map in part 1, so maps where the guard loops are thrown
+away and re-rolled.
+"""
+
+import random
+
+from inputgen import grid_to_str, scaled_side
+
+BASE_SIDE = 130
+OBSTACLE_DENSITY = 0.05
+
+
+def guard_escapes(grid: list[list[str]], row: int, col: int) -> bool:
+    side = len(grid)
+    d_row, d_col = -1, 0
+    seen = set()
+    while True:
+        state = (row, col, d_row, d_col)
+        if state in seen:
+            return False
+        seen.add(state)
+        next_row, next_col = row + d_row, col + d_col
+        if not (0 <= next_row < side and 0 <= next_col < side):
+            return True
+        if grid[next_row][next_col] == "#":
+            d_row, d_col = d_col, -d_row
+        else:
+            row, col = next_row, next_col
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = scaled_side(BASE_SIDE, scale)
+    while True:
+        grid = [["#" if rng.random() < OBSTACLE_DENSITY else "." for _ in range(side)] for _ in range(side)]
+        row, col = rng.randrange(side // 4, 3 * side // 4), rng.randrange(side // 4, 3 * side // 4)
+        grid[row][col] = "^"
+        if guard_escapes(grid, row, col):
+            return grid_to_str(grid)
@@ -0,0 +1,29 @@
+"""Calibration equations, roughly two thirds of them solvable with `+`, `*` and `||`."""
+
+import random
+
+BASE_EQUATIONS = 850
+
+
+def apply_random_ops(nums: list[int], rng: random.Random) -> int:
+    total = nums[0]
+    for num in nums[1:]:
+        op = rng.choice("+*|")
+        if op == "+":
+            total += num
+        elif op == "*":
+            total *= num
+        else:
+            total = int(f"{total}{num}")
+    return total
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(BASE_EQUATIONS * scale):
+        nums = [rng.randint(1, 99) for _ in range(rng.randint(2, 12))]
+        target = apply_random_ops(nums, rng)
+        if rng.random() < 0.35:
+            target += rng.randint(1, 9)
+        lines.append(f"{target}: {' '.join(map(str, nums))}\n")
+    return "".join(lines)
@@ -0,0 +1,25 @@
+"""Antenna map, a few antennas per frequency (digits and letters)."""
+
+import random
+import string
+
+from inputgen import grid_to_str, scaled_side
+
+BASE_SIDE = 50
+FREQUENCIES = string.digits + string.ascii_letters
+ANTENNAS_PER_FREQUENCY = 4
+BASE_FREQUENCIES = 45
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = scaled_side(BASE_SIDE, scale)
+    grid = [["."] * side for _ in range(side)]
+    num_frequencies = min(len(FREQUENCIES), BASE_FREQUENCIES * scale)
+    # once we run out of symbols the bigger maps just get more antennas per frequency
+    antennas_per_frequency = max(
+        ANTENNAS_PER_FREQUENCY, ANTENNAS_PER_FREQUENCY * BASE_FREQUENCIES * scale // num_frequencies
+    )
+    cells = rng.sample(range(side * side), min(side * side, num_frequencies * antennas_per_frequency))
+    for idx, cell in enumerate(cells):
+        grid[cell // side][cell % side] = FREQUENCIES[idx % num_frequencies]
+    return grid_to_str(grid)
@@ -0,0 +1,15 @@
+"""Dense disk map, alternating file and free-space lengths and ending on a file."""
+
+import random
+
+BASE_FILES = 10_000
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    num_files = BASE_FILES * scale
+    digits = []
+    for file_idx in range(num_files):
+        digits.append(str(rng.randint(1, 9)))
+        if file_idx != num_files - 1:
+            digits.append(str(rng.randint(0, 9)))
+    return "".join(digits) + "\n"
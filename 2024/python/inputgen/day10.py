@@ -0,0 +1,39 @@
+"""
+Topographic map of digits.
+
+Random digits on their own hardly ever make a trail, so trails climbing 0 through 9 are
+walked into the noise afterwards.
+"""
+
+import random
+
+from inputgen import grid_to_str, scaled_side
+
+BASE_SIDE = 50
+TRAILS_PER_CELL = 1 / 12
+
+
+def walk_trail(grid: list[list[str]], rng: random.Random) -> None:
+    side = len(grid)
+    row, col = rng.randrange(side), rng.randrange(side)
+    path = [(row, col)]
+    while len(path) < 10:
+        options = [
+            (row + d_row, col + d_col)
+            for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1))
+            if 0 <= row + d_row < side and 0 <= col + d_col < side and (row + d_row, col + d_col) not in path
+        ]
+        if not options:
+            return
+        row, col = rng.choice(options)
+        path.append((row, col))
+    for height, (row, col) in enumerate(path):
+        grid[row][col] = str(height)
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = scaled_side(BASE_SIDE, scale)
+    grid = [rng.choices("0123456789", k=side) for _ in range(side)]
+    for _ in range(int(side * side * TRAILS_PER_CELL)):
+        walk_trail(grid, rng)
+    return grid_to_str(grid)
@@ -0,0 +1,10 @@
+"""A single line of stones."""
+
+import random
+
+BASE_STONES = 8
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    stones = [rng.choice((0, rng.randint(1, 9), rng.randint(10, 9_999_999))) for _ in range(BASE_STONES * scale)]
+    return " ".join(map(str, stones)) + "\n"
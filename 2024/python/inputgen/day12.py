@@ -0,0 +1,35 @@
+"""
+Garden plots.
+
+Regions grow out from random seeds with a multi-source BFS, so they come out as blobby,
+non-convex shapes and the same plant letter shows up in several separate regions.
+"""
+
+import random
+import string
+from collections import deque
+
+from inputgen import grid_to_str, scaled_side
+
+BASE_SIDE = 140
+CELLS_PER_REGION = 30
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = scaled_side(BASE_SIDE, scale)
+    grid = [[""] * side for _ in range(side)]
+    frontier: deque[tuple[int, int]] = deque()
+    for cell in rng.sample(range(side * side), max(1, side * side // CELLS_PER_REGION)):
+        row, col = divmod(cell, side)
+        grid[row][col] = rng.choice(string.ascii_uppercase)
+        frontier.append((row, col))
+
+    while frontier:
+        # popping from a random end keeps the borders from being too straight
+        row, col = frontier.popleft() if rng.random() < 0.5 else frontier.pop()
+        for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            next_row, next_col = row + d_row, col + d_col
+            if 0 <= next_row < side and 0 <= next_col < side and not grid[next_row][next_col]:
+                grid[next_row][next_col] = grid[row][col]
+                frontier.append((next_row, next_col))
+    return grid_to_str(grid)
@@ -0,0 +1,22 @@
+"""Claw machines, some winnable within 100 presses and some not at all."""
+
+import random
+
+BASE_MACHINES = 320
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    blocks = []
+    for _ in range(BASE_MACHINES * scale):
+        while True:
+            a_x, a_y, b_x, b_y = (rng.randint(10, 99) for _ in range(4))
+            # parallel buttons make the system singular
+            if a_x * b_y != a_y * b_x:
+                break
+        if rng.random() < 0.6:
+            a_presses, b_presses = rng.randint(0, 100), rng.randint(0, 100)
+            prize_x, prize_y = a_presses * a_x + b_presses * b_x, a_presses * a_y + b_presses * b_y
+        else:
+            prize_x, prize_y = rng.randint(1_000, 20_000), rng.randint(1_000, 20_000)
+        blocks.append(f"Button A: X+{a_x}, Y+{a_y}\nButton B: X+{b_x}, Y+{b_y}\nPrize: X={prize_x}, Y={prize_y}\n")
+    return "\n".join(blocks)
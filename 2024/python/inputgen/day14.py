@@ -0,0 +1,20 @@
+"""
+Robots on the bathroom floor.
+
+day14 hardcodes the 101x103 floor, so scaling adds robots rather than floor.
+"""
+
+import random
+
+NUM_TILES_WIDE = 101
+NUM_TILES_TALL = 103
+BASE_ROBOTS = 500
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(BASE_ROBOTS * scale):
+        x, y = rng.randrange(NUM_TILES_WIDE), rng.randrange(NUM_TILES_TALL)
+        v_x, v_y = rng.randint(-99, 99), rng.randint(-99, 99)
+        lines.append(f"p={x},{y} v={v_x},{v_y}\n")
+    return "".join(lines)
@@ -0,0 +1,25 @@
+"""Warehouse map (walls, `O` boxes and the `@` robot) followed by lines of moves."""
+
+import random
+
+from inputgen import scaled_side
+
+BASE_SIDE = 50
+BASE_MOVES = 20_000
+MOVES_PER_LINE = 1000
+WALL_DENSITY = 0.05
+BOX_DENSITY = 0.3
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = scaled_side(BASE_SIDE, scale)
+    grid = [["#"] * side for _ in range(side)]
+    for row in range(1, side - 1):
+        for col in range(1, side - 1):
+            roll = rng.random()
+            grid[row][col] = "#" if roll < WALL_DENSITY else "O" if roll < WALL_DENSITY + BOX_DENSITY else "."
+    grid[side // 2][side // 2] = "@"
+
+    moves = "".join(rng.choices("<>^v", k=BASE_MOVES * scale))
+    move_lines = [moves[idx : idx + MOVES_PER_LINE] for idx in range(0, len(moves), MOVES_PER_LINE)]
+    return "\n".join("".join(row) for row in grid) + "\n\n" + "\n".join(move_lines) + "\n"
@@ -0,0 +1,26 @@
+"""
+Reindeer maze with `S` bottom left and `E` top right.
+
+A perfect maze with a slice of the walls knocked out afterwards, so there are loops and
+more than one best path.
+"""
+
+import random
+
+from inputgen import carve_maze, grid_to_str, odd, scaled_side
+
+BASE_SIDE = 141
+OPEN_WALL_FRACTION = 0.05
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = odd(scaled_side(BASE_SIDE, scale))
+    grid = carve_maze(side, side, rng)
+    for row in range(1, side - 1):
+        for col in range(1, side - 1):
+            # only walls between two open cells, so we don't open up 2x2 rooms
+            if grid[row][col] == "#" and (row % 2) != (col % 2) and rng.random() < OPEN_WALL_FRACTION:
+                grid[row][col] = "."
+    grid[side - 2][1] = "S"
+    grid[1][side - 2] = "E"
+    return grid_to_str(grid)
@@ -0,0 +1,20 @@
+"""
+Chronospatial computer program.
+
+day17's part 2 z3 model is written for one specific program shape
+(`2,4,1,2,7,5,4,_,1,3,5,5,0,3,3,0`), so that's what gets generated. The program outputs
+one digit per 3 bits of A, so scaling A's width scales the part 1 output.
+"""
+
+import random
+
+BASE_A_BITS = 48
+PROGRAM = [2, 4, 1, 2, 7, 5, 4, 0, 1, 3, 5, 5, 0, 3, 3, 0]
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    register_a = rng.getrandbits(BASE_A_BITS * scale) | (1 << (BASE_A_BITS * scale - 1))
+    program = PROGRAM.copy()
+    # bxc ignores its operand
+    program[7] = rng.randint(0, 7)
+    return f"Register A: {register_a}\nRegister B: 0\nRegister C: 0\n\nProgram: {','.join(map(str, program))}\n"
@@ -0,0 +1,48 @@
+"""
+Falling bytes.
+
+day18 hardcodes the 71x71 memory space, so the grid can't grow - what scales is how many
+bytes fall, up to every cell but the two corners. The first 1024 bytes always leave a way
+out and the whole list always closes it off, so both parts have an answer.
+"""
+
+import random
+from collections import deque
+
+MEMORY_RANGE = 70
+NUMBER_BYTES_TO_SIMULATE = 1024
+BASE_BYTES = 3450
+
+
+def has_path(blocked: set[tuple[int, int]]) -> bool:
+    start, end = (0, 0), (MEMORY_RANGE, MEMORY_RANGE)
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == end:
+            return True
+        for next_loc in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if (
+                0 <= next_loc[0] <= MEMORY_RANGE
+                and 0 <= next_loc[1] <= MEMORY_RANGE
+                and next_loc not in blocked
+                and next_loc not in seen
+            ):
+                seen.add(next_loc)
+                queue.append(next_loc)
+    return False
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    cells = [
+        (x, y)
+        for x in range(MEMORY_RANGE + 1)
+        for y in range(MEMORY_RANGE + 1)
+        if (x, y) not in ((0, 0), (MEMORY_RANGE, MEMORY_RANGE))
+    ]
+    num_bytes = min(len(cells), BASE_BYTES * scale)
+    while True:
+        falling = rng.sample(cells, num_bytes)
+        if has_path(set(falling[:NUMBER_BYTES_TO_SIMULATE])) and not has_path(set(falling)):
+            return "".join(f"{x},{y}\n" for x, y in falling)
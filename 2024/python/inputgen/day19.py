@@ -0,0 +1,37 @@
+"""
+Towel patterns and designs.
+
+One colour never appears as a single-stripe towel, which is what makes some of the
+designs impossible.
+"""
+
+import itertools
+import random
+
+COLOURS = "wubrg"
+BASE_PATTERNS = 447
+BASE_DESIGNS = 400
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    missing_colour = rng.choice(COLOURS)
+    patterns = {colour for colour in COLOURS if colour != missing_colour}
+    short_patterns = ["".join(combo) for combo in itertools.product(COLOURS, repeat=2)]
+    rng.shuffle(short_patterns)
+    patterns.update(short_patterns[:12])
+    while len(patterns) < BASE_PATTERNS:
+        patterns.add("".join(rng.choices(COLOURS, k=rng.randint(3, 8))))
+    pattern_list = sorted(patterns)
+    rng.shuffle(pattern_list)
+
+    designs = []
+    for _ in range(BASE_DESIGNS * scale):
+        length = rng.randint(20, 60)
+        if rng.random() < 0.6:
+            design = ""
+            while len(design) < length:
+                design += rng.choice(pattern_list)
+        else:
+            design = "".join(rng.choices(COLOURS, k=length))
+        designs.append(design)
+    return ", ".join(pattern_list) + "\n\n" + "\n".join(designs) + "\n"
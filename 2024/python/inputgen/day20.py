@@ -0,0 +1,39 @@
+"""
+Race track: one single-width track from `S` to `E` with walls everywhere else.
+
+The track is the route between two corners of a perfect maze, so it winds back on itself
+with one-thick walls between the straights, which is where the cheats come from.
+"""
+
+import random
+from collections import deque
+
+from inputgen import carve_maze, grid_to_str, odd, scaled_side
+
+BASE_SIDE = 141
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = odd(scaled_side(BASE_SIDE, scale))
+    maze = carve_maze(side, side, rng)
+    start, end = (side - 2, 1), (1, side - 2)
+
+    parents: dict[tuple[int, int], tuple[int, int] | None] = {start: None}
+    queue = deque([start])
+    while queue:
+        row, col = queue.popleft()
+        if (row, col) == end:
+            break
+        for next_loc in ((row + 1, col), (row - 1, col), (row, col + 1), (row, col - 1)):
+            if maze[next_loc[0]][next_loc[1]] == "." and next_loc not in parents:
+                parents[next_loc] = (row, col)
+                queue.append(next_loc)
+
+    grid = [["#"] * side for _ in range(side)]
+    loc: tuple[int, int] | None = end
+    while loc is not None:
+        grid[loc[0]][loc[1]] = "."
+        loc = parents[loc]
+    grid[start[0]][start[1]] = "S"
+    grid[end[0]][end[1]] = "E"
+    return grid_to_str(grid)
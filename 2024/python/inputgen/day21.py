@@ -0,0 +1,9 @@
+"""Door codes: three digits followed by `A`."""
+
+import random
+
+BASE_CODES = 5
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "".join(f"{rng.randint(0, 999):03d}A\n" for _ in range(BASE_CODES * scale))
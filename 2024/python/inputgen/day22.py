@@ -0,0 +1,10 @@
+"""Initial secret numbers, one per buyer."""
+
+import random
+
+BASE_BUYERS = 2000
+PRUNE_NUMBER = 16777216
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "".join(f"{rng.randrange(1, PRUNE_NUMBER)}\n" for _ in range(BASE_BUYERS * scale))
@@ -0,0 +1,48 @@
+"""
+LAN party network.
+
+A sparse random graph (every computer has ~13 links, like the real input) with one planted
+13-computer clique, so there is a single largest party and plenty of `t` triangles.
+Names are two letters like the real input, and grow a letter once those run out.
+"""
+
+import random
+import string
+
+BASE_COMPUTERS = 520
+LINKS_PER_COMPUTER = 13
+PARTY_SIZE = 13
+
+
+def computer_names(count: int, rng: random.Random) -> list[str]:
+    width = 2
+    while len(string.ascii_lowercase) ** width < count:
+        width += 1
+    names: set[str] = set()
+    while len(names) < count:
+        names.add("".join(rng.choices(string.ascii_lowercase, k=width)))
+    return sorted(names)
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    names = computer_names(BASE_COMPUTERS * scale, rng)
+    rng.shuffle(names)
+    edges: set[tuple[str, str]] = set()
+
+    def link(a: str, b: str) -> None:
+        if a != b:
+            edges.add((a, b) if a < b else (b, a))
+
+    party = names[:PARTY_SIZE]
+    for idx, a in enumerate(party):
+        for b in party[idx + 1 :]:
+            link(a, b)
+    # about half of each computer's links are random, the rest already exist from the other end
+    for name in names:
+        for _ in range(LINKS_PER_COMPUTER // 2):
+            link(name, rng.choice(names))
+
+    # sorted first so the output doesn't depend on set ordering
+    lines = [f"{a}-{b}" if rng.random() < 0.5 else f"{b}-{a}" for a, b in sorted(edges)]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
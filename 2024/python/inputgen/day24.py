@@ -0,0 +1,77 @@
+"""
+Crossed wires: a ripple-carry adder with four pairs of gate outputs swapped.
+
+Like the real input three of the swaps put a `z` output on the wrong gate and the fourth
+swaps the XOR / AND of one bit's inputs. Scaling widens the adder (45 bits at scale 1).
+Note that day24's part 2 checks assume 45-bit numbers, so only part 1 is meaningful on
+wider adders until that's generalised.
+"""
+
+import random
+import string
+
+BASE_BITS = 45
+NUM_SWAPS = 4
+
+
+def wire_names(count: int, rng: random.Random) -> list[str]:
+    first_letters = [letter for letter in string.ascii_lowercase if letter not in "xyz"]
+    width = 3
+    while len(first_letters) * 26 ** (width - 1) < count * 2:
+        width += 1
+    names: set[str] = set()
+    while len(names) < count:
+        names.add(rng.choice(first_letters) + "".join(rng.choices(string.ascii_lowercase, k=width - 1)))
+    names_list = sorted(names)
+    rng.shuffle(names_list)
+    return names_list
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    num_bits = BASE_BITS * scale
+    digits = max(2, len(str(num_bits)))
+
+    def x(i: int) -> str:
+        return f"x{i:0{digits}d}"
+
+    def y(i: int) -> str:
+        return f"y{i:0{digits}d}"
+
+    def z(i: int) -> str:
+        return f"z{i:0{digits}d}"
+
+    names = iter(wire_names(5 * num_bits, rng))
+
+    # dst -> (gate1, op, gate2), and which wire plays which role in each bit
+    gates: dict[str, tuple[str, str, str]] = {z(0): (x(0), "XOR", y(0))}
+    carry = next(names)
+    gates[carry] = (x(0), "AND", y(0))
+    roles: dict[int, dict[str, str]] = {}
+    for i in range(1, num_bits):
+        half_sum, half_carry, carry_through = next(names), next(names), next(names)
+        next_carry = z(num_bits) if i == num_bits - 1 else next(names)
+        gates[half_sum] = (x(i), "XOR", y(i))
+        gates[half_carry] = (x(i), "AND", y(i))
+        gates[z(i)] = (half_sum, "XOR", carry)
+        gates[carry_through] = (half_sum, "AND", carry)
+        gates[next_carry] = (half_carry, "OR", carry_through)
+        roles[i] = {"half_sum": half_sum, "half_carry": half_carry, "carry_through": carry_through, "carry": next_carry}
+        carry = next_carry
+
+    # spread the broken bits out so the swaps don't interact
+    spacing = (num_bits - 2) // NUM_SWAPS
+    broken_bits = [1 + idx * spacing + rng.randrange(max(1, spacing - 2)) for idx in range(NUM_SWAPS)]
+    swaps = [(roles[bit]["half_sum"], roles[bit]["half_carry"]) for bit in broken_bits[:1]]
+    swaps += [(z(bit), roles[bit][rng.choice(("carry_through", "carry"))]) for bit in broken_bits[1:]]
+    for a, b in swaps:
+        gates[a], gates[b] = gates[b], gates[a]
+
+    initial = [f"{x(i)}: {rng.randint(0, 1)}\n" for i in range(num_bits)]
+    initial += [f"{y(i)}: {rng.randint(0, 1)}\n" for i in range(num_bits)]
+    rules = []
+    for dst, (gate1, op, gate2) in gates.items():
+        if rng.random() < 0.5:
+            gate1, gate2 = gate2, gate1
+        rules.append(f"{gate1} {op} {gate2} -> {dst}\n")
+    rng.shuffle(rules)
+    return "".join(initial) + "\n" + "".join(rules)
@@ -0,0 +1,24 @@
+"""Lock and key schematics, 5 pins by 7 rows, about half of each."""
+
+import random
+
+BASE_SCHEMATICS = 500
+NUM_PINS = 5
+MAX_HEIGHT = 5
+
+
+def schematic(heights: list[int], is_lock: bool) -> str:
+    rows = []
+    for row in range(MAX_HEIGHT + 2):
+        # locks fill down from the top row, keys fill up from the bottom row
+        depth = row if is_lock else MAX_HEIGHT + 1 - row
+        rows.append("".join("#" if depth <= height else "." for height in heights))
+    return "\n".join(rows) + "\n"
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    schematics = [
+        schematic([rng.randint(0, MAX_HEIGHT) for _ in range(NUM_PINS)], is_lock=rng.random() < 0.5)
+        for _ in range(BASE_SCHEMATICS * scale)
+    ]
+    return "\n".join(schematics)
@@ -0,0 +1,317 @@
+"""
+Memoization with a bound on it, in place of `lru_cache(maxsize=None)`.
+
+    from memo import memo, memo_scope
+
+    @memo(maxsize=1 << 16)
+    def count_stones(stone: int, blinks: int) -> int: ...
+
+    @memo(max_bytes=64 << 20, policy="lfu")
+    def expensive(key: str) -> list[int]: ...
+
+    with memo_scope(expensive):
+        ...  # everything `expensive` cached in here is dropped on the way out (unless `set_keep_warm`)
+
+A limit is either a number of entries (`maxsize`), an estimate of the memory the keys and
+values take (`max_bytes`), or both. Once it's reached the `policy` decides what happens to
+the next result:
+
+    lru   drop the least recently used entry (the default)
+    lfu   drop the least frequently used entry, oldest first among equals
+    none  keep what's there and just don't cache the new one
+
+`lru` with only a `maxsize` is `functools.lru_cache` underneath, so it's as cheap as the
+decorator it replaces. The others are plain python and cost a bit more per call.
+
+The byte estimate is `sys.getsizeof` of the key and the value, so it doesn't follow
+references: good enough for the ints / strs / short tuples the days cache, an undercount
+for anything nested.
+
+Every memo keeps `cache_info()` (hits, misses, evictions, size) across `cache_clear()` calls,
+so `counter_util` picks them up like any other `lru_cache`, and `memo_stats()` has all of
+the live ones.
+"""
+
+import functools
+import sys
+import weakref
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterator, Literal, NamedTuple, TypeVar
+
+Policy = Literal["lru", "lfu", "none"]
+POLICIES: tuple[Policy, ...] = ("lru", "lfu", "none")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_MISSING = object()
+# separates positional args from keyword args in a key, same trick as functools
+_KWARGS_MARK = object()
+
+
+class MemoInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    evictions: int
+    # only tracked with a `max_bytes`
+    nbytes: int | None
+    max_bytes: int | None
+    policy: Policy
+
+
+def _make_key(args: tuple, kwargs: dict[str, Any]) -> Hashable:
+    if kwargs:
+        return (*args, _KWARGS_MARK, *kwargs.items())
+    if len(args) == 1 and type(args[0]) in (int, str):
+        return args[0]
+    return args
+
+
+def _entry_bytes(key: Hashable, value: Any) -> int:
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class _Store:
+    """Entries plus the bookkeeping for the limits, `put` decides what (if anything) goes."""
+
+    def __init__(self, maxsize: int | None, max_bytes: int | None) -> None:
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.entries: dict[Hashable, Any] = {}
+        self.sizes: dict[Hashable, int] = {}
+        self.nbytes = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable) -> Any:
+        return self.entries.get(key, _MISSING)
+
+    def fits(self, extra_bytes: int) -> bool:
+        if self.maxsize is not None and len(self.entries) >= self.maxsize:
+            return False
+        return self.max_bytes is None or self.nbytes + extra_bytes <= self.max_bytes
+
+    def add(self, key: Hashable, value: Any, size: int) -> None:
+        self.entries[key] = value
+        if self.max_bytes is not None:
+            self.sizes[key] = size
+            self.nbytes += size
+
+    def remove(self, key: Hashable) -> None:
+        del self.entries[key]
+        if self.max_bytes is not None:
+            self.nbytes -= self.sizes.pop(key)
+        self.evictions += 1
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = _entry_bytes(key, value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            # would push everything else out and still not fit
+            return
+        if self.maxsize == 0:
+            return
+        while not self.fits(size):
+            victim = self.victim()
+            if victim is _MISSING:
+                return
+            self.remove(victim)
+        self.add(key, value, size)
+
+    def victim(self) -> Any:
+        # policy "none": nothing gets evicted, the new entry just isn't kept
+        return _MISSING
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.sizes.clear()
+        self.nbytes = 0
+
+
+class _LRUStore(_Store):
+    def __init__(self, maxsize: int | None, max_bytes: int | None) -> None:
+        super().__init__(maxsize, max_bytes)
+        self.entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        value = self.entries.get(key, _MISSING)
+        if value is not _MISSING:
+            self.entries.move_to_end(key)
+        return value
+
+    def victim(self) -> Any:
+        return next(iter(self.entries), _MISSING)
+
+
+class _LFUStore(_Store):
+    """Frequency buckets, each in insertion order, so picking a victim never scans."""
+
+    def __init__(self, maxsize: int | None, max_bytes: int | None) -> None:
+        super().__init__(maxsize, max_bytes)
+        self.frequency: dict[Hashable, int] = {}
+        self.buckets: defaultdict[int, OrderedDict[Hashable, None]] = defaultdict(OrderedDict)
+        self.min_frequency = 0
+
+    def get(self, key: Hashable) -> Any:
+        value = self.entries.get(key, _MISSING)
+        if value is not _MISSING:
+            frequency = self.frequency[key]
+            bucket = self.buckets[frequency]
+            del bucket[key]
+            if not bucket:
+                del self.buckets[frequency]
+                if self.min_frequency == frequency:
+                    self.min_frequency = frequency + 1
+            self.frequency[key] = frequency + 1
+            self.buckets[frequency + 1][key] = None
+        return value
+
+    def add(self, key: Hashable, value: Any, size: int) -> None:
+        super().add(key, value, size)
+        self.frequency[key] = 1
+        self.buckets[1][key] = None
+        self.min_frequency = 1
+
+    def remove(self, key: Hashable) -> None:
+        super().remove(key)
+        frequency = self.frequency.pop(key)
+        bucket = self.buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[frequency]
+
+    def victim(self) -> Any:
+        if not self.entries:
+            return _MISSING
+        if self.min_frequency not in self.buckets:
+            self.min_frequency = min(self.buckets)
+        return next(iter(self.buckets[self.min_frequency]))
+
+    def clear(self) -> None:
+        super().clear()
+        self.frequency.clear()
+        self.buckets.clear()
+        self.min_frequency = 0
+
+
+_STORES: dict[Policy, type[_Store]] = {"lru": _LRUStore, "lfu": _LFUStore, "none": _Store}
+
+# every memo that's still alive, for `memo_stats` / `clear_memos`
+_memos: "weakref.WeakSet[Callable[..., Any]]" = weakref.WeakSet()
+# see `set_keep_warm`
+_keep_warm = False
+
+
+def _lru_cache_backed(func: Callable[..., Any], maxsize: int | None, policy: Policy) -> Callable[..., Any]:
+    cached = functools.lru_cache(maxsize)(func)
+    lru_cache_info = cached.cache_info
+    lru_cache_clear = cached.cache_clear
+    # lru_cache zeroes its stats on clear, these carry them over: hits, misses, evictions
+    carried = [0, 0, 0]
+
+    def cache_info() -> MemoInfo:
+        info = lru_cache_info()
+        # every miss adds an entry, so whatever was added and isn't there anymore got evicted
+        evictions = carried[2] + info.misses - info.currsize
+        return MemoInfo(
+            carried[0] + info.hits, carried[1] + info.misses, maxsize, info.currsize, evictions, None, None, policy
+        )
+
+    def cache_clear() -> None:
+        info = lru_cache_info()
+        carried[0] += info.hits
+        carried[1] += info.misses
+        carried[2] += info.misses - info.currsize
+        lru_cache_clear()
+
+    # the lru_cache wrapper itself is what gets called, shadowing its methods keeps it that cheap
+    cached.cache_info = cache_info
+    cached.cache_clear = cache_clear
+    return cached
+
+
+def _store_backed(
+    func: Callable[..., Any], maxsize: int | None, max_bytes: int | None, policy: Policy
+) -> Callable[..., Any]:
+    store = _STORES[policy](maxsize, max_bytes)
+    store_get = store.get
+    store_put = store.put
+    stats = [0, 0]  # hits, misses
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = _make_key(args, kwargs)
+        value = store_get(key)
+        if value is not _MISSING:
+            stats[0] += 1
+            return value
+        stats[1] += 1
+        value = func(*args, **kwargs)
+        store_put(key, value)
+        return value
+
+    def cache_info() -> MemoInfo:
+        nbytes = store.nbytes if max_bytes is not None else None
+        return MemoInfo(stats[0], stats[1], maxsize, len(store), store.evictions, nbytes, max_bytes, policy)
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = store.clear
+    return wrapper
+
+
+def memo(
+    maxsize: int | None = None, *, max_bytes: int | None = None, policy: Policy = "lru"
+) -> Callable[[F], F]:
+    """
+    Decorator, `maxsize` / `max_bytes` of None means no limit of that kind. Arguments have to
+    be hashable, same as `lru_cache`.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown memo policy {policy!r}, expected one of {', '.join(POLICIES)}")
+    if maxsize is not None and maxsize < 0:
+        raise ValueError(f"maxsize has to be >= 0, got {maxsize}")
+    if max_bytes is not None and max_bytes < 0:
+        raise ValueError(f"max_bytes has to be >= 0, got {max_bytes}")
+
+    def decorator(func: F) -> F:
+        if policy == "lru" and max_bytes is None and maxsize != 0:
+            wrapper = _lru_cache_backed(func, maxsize, policy)
+        else:
+            wrapper = _store_backed(func, maxsize, max_bytes, policy)
+        _memos.add(wrapper)
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def memo_stats() -> dict[str, MemoInfo]:
+    """`cache_info()` of every live memo, keyed by `module.qualname`."""
+    return {f"{func.__module__}.{func.__qualname__}": func.cache_info() for func in list(_memos)}
+
+
+def clear_memos() -> None:
+    for func in list(_memos):
+        func.cache_clear()
+
+
+def set_keep_warm(keep_warm: bool) -> None:
+    """
+    Makes `memo_scope` leave its memos alone, for a long-lived process (worker.py) that wants
+    the tables carried over from one call to the next. Everything else gets them cold.
+    """
+    global _keep_warm
+    _keep_warm = keep_warm
+
+
+@contextmanager
+def memo_scope(*funcs: Callable[..., Any]) -> Iterator[None]:
+    """Clears `funcs` (every memo, if none are given) on the way out, so nothing cached inside outlives the block."""
+    try:
+        yield
+    finally:
+        if not _keep_warm:
+            for func in funcs or list(_memos):
+                func.cache_clear()
@@ -0,0 +1,181 @@
+"""
+Runs days across several processes, so a full pass takes about as long as the slowest day
+rather than the sum of all of them.
+
+Every day gets a process of its own, at most `jobs` of them at a time. Each day also gets a
+time budget: inside its process an interval timer interrupts the day with `DayTimeout` once
+it runs over. That doesn't work for a day stuck in C code (z3), so the parent kills the
+process a few seconds later and starts the next day in its place. Ctrl-C cancels whatever
+hasn't finished yet and still reports the rest.
+
+With `pin_cpus` every slot has its own CPU and the process running in it sits on that CPU,
+which keeps concurrent benchmarks from trading cores mid-measurement.
+"""
+
+import contextlib
+import multiprocessing
+import os
+import signal
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.connection import wait as wait_for_any
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Any
+
+from registry import DayResult, get_day, run_day
+
+# how long past its budget a day that ignores the timer gets before its process is killed
+HARD_TIMEOUT_GRACE_SECONDS = 5.0
+# how long a killed process gets to go on SIGTERM before it gets SIGKILL
+TERMINATE_SECONDS = 1.0
+
+
+class DayTimeout(Exception):
+    pass
+
+
+def available_cpus() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _run_day_in_worker(day: str, input_file: Path | None, timeout: float | None, run_kwargs: dict) -> DayResult:
+    use_timer = timeout is not None and hasattr(signal, "setitimer")
+    if use_timer:
+
+        def on_timeout(signum: int, frame: Any) -> None:
+            raise DayTimeout(f"took longer than {timeout:g}s")
+
+        signal.signal(signal.SIGALRM, on_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        # output from several days at once is just noise
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            return run_day(day, input_file, **run_kwargs)
+    finally:
+        if use_timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _worker_main(
+    conn: Connection, cpu: int | None, day: str, input_file: Path | None, timeout: float | None, run_kwargs: dict
+) -> None:
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpu})
+    # Ctrl-C goes to the whole process group, the parent decides what happens next
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        outcome = (True, _run_day_in_worker(day, input_file, timeout, run_kwargs))
+    except Exception as e:  # noqa: BLE001 - includes a timer that fired just after run_day returned
+        outcome = (False, f"{type(e).__name__}: {e}")
+    conn.send(outcome)
+    conn.close()
+
+
+@dataclass
+class _Task:
+    day: str
+    process: BaseProcess
+    conn: Connection
+    start: float
+    cpu: int | None
+
+
+def _stop(process: BaseProcess) -> None:
+    process.terminate()
+    process.join(TERMINATE_SECONDS)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def _error_result(day: str, input_file: Path | None, error: str) -> DayResult:
+    return DayResult(day=day, input_file=input_file or get_day(day).default_input, error=error)
+
+
+def run_days_parallel(
+    days: list[str],
+    input_overrides: dict[str, Path] | None = None,
+    jobs: int | None = None,
+    timeout: float | None = None,
+    pin_cpus: bool = False,
+    day_kwargs: dict[str, dict[str, Any]] | None = None,
+    **run_kwargs: Any,
+) -> list[DayResult]:
+    """
+    `run_day` for every day, `jobs` processes at a time (default: one per available CPU).
+    `run_kwargs` go straight through to `run_day`, with `day_kwargs[day]` on top for anything
+    that differs per day. Results come back in the order of `days`.
+    """
+    input_overrides = input_overrides or {}
+    day_kwargs = day_kwargs or {}
+    cpus = available_cpus()
+    jobs = max(1, min(jobs or len(cpus), len(days)))
+    context = multiprocessing.get_context()
+    # one entry per slot, a day takes one to start and gives it back when it's done (or killed)
+    free_slots: list[int | None] = [cpus[i % len(cpus)] if pin_cpus else None for i in range(jobs)]
+
+    results: dict[str, DayResult] = {}
+    queued = list(days)
+    running: list[_Task] = []
+
+    def finish(task: _Task, result: DayResult) -> None:
+        running.remove(task)
+        task.conn.close()
+        free_slots.append(task.cpu)
+        results[task.day] = result
+
+    try:
+        while queued or running:
+            while queued and free_slots:
+                day = queued.pop(0)
+                cpu = free_slots.pop(0)
+                kwargs = {**run_kwargs, **day_kwargs.get(day, {})}
+                recv_conn, send_conn = context.Pipe(duplex=False)
+                process = context.Process(
+                    target=_worker_main,
+                    args=(send_conn, cpu, day, input_overrides.get(day), timeout, kwargs),
+                    name=f"aoc-{day}",
+                    daemon=True,
+                )
+                process.start()
+                # only the child holds the sending end now, so its exit is an EOF here
+                send_conn.close()
+                running.append(_Task(day, process, recv_conn, time.monotonic(), cpu))
+
+            wait_seconds = None
+            if timeout is not None:
+                hard_limit = timeout + HARD_TIMEOUT_GRACE_SECONDS
+                next_deadline = min(task.start + hard_limit for task in running)
+                wait_seconds = max(0.0, next_deadline - time.monotonic())
+            ready = wait_for_any([task.conn for task in running], timeout=wait_seconds)
+
+            for task in [task for task in running if task.conn in ready]:
+                try:
+                    ok, value = task.conn.recv()
+                except EOFError:
+                    # died before it could send anything back (segfault, OOM killer, ...)
+                    task.process.join()
+                    ok, value = False, f"worker exited with code {task.process.exitcode}"
+                task.process.join()
+                result = value if ok else _error_result(task.day, input_overrides.get(task.day), value)
+                finish(task, result)
+
+            if timeout is not None:
+                now = time.monotonic()
+                for task in [task for task in running if now - task.start > timeout + HARD_TIMEOUT_GRACE_SECONDS]:
+                    _stop(task.process)
+                    error = f"DayTimeout: took longer than {timeout:g}s (killed)"
+                    finish(task, _error_result(task.day, input_overrides.get(task.day), error))
+    except KeyboardInterrupt:
+        for day in queued + [task.day for task in running]:
+            results[day] = _error_result(day, input_overrides.get(day), "cancelled")
+    finally:
+        for task in running:
+            _stop(task.process)
+            task.conn.close()
+
+    return [results[day] for day in days]
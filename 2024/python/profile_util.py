@@ -0,0 +1,285 @@
+"""
+Profiling helpers for the day solutions.
+
+`profile_function` runs a function under cProfile and pulls out the top functions by
+cumulative and by self time. It can also write collapsed stacks (`a;b;c <weight>` per line)
+which flamegraph.pl, inferno or speedscope can all read directly.
+
+`profile_imports` is the import-time side of things: it imports a module in a fresh
+interpreter under `-X importtime` and reports what it dragged in.
+"""
+
+import cProfile
+import pstats
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable
+
+from timing_util import TimeUnit, convert_ns
+
+# `import time:       self |  cumulative | <indent>module`, both times in microseconds
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ProfileConfig:
+    top_n: int = 20
+    # where to write the collapsed stacks, nothing gets written if None
+    collapsed_path: Path | None = None
+
+
+@dataclass
+class FunctionStats:
+    function: str
+    calls: int
+    primitive_calls: int
+    self_ns: float
+    cumulative_ns: float
+
+
+@dataclass
+class ProfileResult:
+    name: str
+    elapsed_ns: int
+    top_cumulative: list[FunctionStats]
+    top_self: list[FunctionStats]
+    collapsed_path: Path | None = None
+    return_value: Any = field(default=None, repr=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "elapsed_ns": self.elapsed_ns,
+            "top_cumulative": [vars(stats) for stats in self.top_cumulative],
+            "top_self": [vars(stats) for stats in self.top_self],
+            "collapsed_path": str(self.collapsed_path) if self.collapsed_path else None,
+        }
+
+
+def function_label(filename: str, lineno: int, func_name: str) -> str:
+    # same shape as pstats' output, minus the directories
+    if filename == "~":
+        return func_name
+    return f"{Path(filename).name}:{lineno}({func_name})"
+
+
+class StackCollector:
+    """
+    `sys.setprofile` hook that totals self time per full call stack.
+
+    cProfile only keeps caller -> callee edges, so the flamegraph stacks need their own run.
+    """
+
+    def __init__(self) -> None:
+        self.self_ns: dict[str, int] = defaultdict(int)
+        # [stack path, start ns, ns spent in children]
+        self._stack: list[list[Any]] = []
+
+    def _push(self, label: str) -> None:
+        path = f"{self._stack[-1][0]};{label}" if self._stack else label
+        self._stack.append([path, time.perf_counter_ns(), 0])
+
+    def _pop(self) -> None:
+        if not self._stack:
+            # returns from frames that were already running when we started
+            return
+        path, start_ns, child_ns = self._stack.pop()
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        self.self_ns[path] += elapsed_ns - child_ns
+        if self._stack:
+            self._stack[-1][2] += elapsed_ns
+
+    def __call__(self, frame: FrameType, event: str, arg: Any) -> None:
+        if event == "call":
+            code = frame.f_code
+            self._push(function_label(code.co_filename, code.co_firstlineno, code.co_name))
+        elif event == "c_call":
+            self._push(f"<built-in {getattr(arg, '__qualname__', arg)}>")
+        elif event in ("return", "c_return", "c_exception"):
+            self._pop()
+
+    def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        sys.setprofile(self)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            sys.setprofile(None)
+            # the only thing still open is the setprofile call itself
+            self._stack.clear()
+
+
+def write_collapsed(self_ns: dict[str, int], path: Path) -> None:
+    """Weights are self time in microseconds, stacks that round down to 0 are dropped."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        for stack, ns in sorted(self_ns.items()):
+            weight = round(ns / 1000)
+            if weight > 0:
+                f.write(f"{stack} {weight}\n")
+
+
+def _top_functions(stats: pstats.Stats, sort_key: str, top_n: int) -> list[FunctionStats]:
+    # pstats reports seconds, everything else in here is ns
+    rows = [
+        FunctionStats(
+            function=function_label(*func),
+            calls=nc,
+            primitive_calls=cc,
+            self_ns=tt * 1e9,
+            cumulative_ns=ct * 1e9,
+        )
+        for func, (cc, nc, tt, ct, _callers) in stats.stats.items()
+    ]
+    rows.sort(key=lambda row: getattr(row, sort_key), reverse=True)
+    return rows[:top_n]
+
+
+def profile_function(
+    func: Callable[..., Any],
+    *args,
+    name: str | None = None,
+    config: ProfileConfig | None = None,
+    **kwargs,
+) -> ProfileResult:
+    """
+    Runs `func` once under cProfile, and once more under the stack collector if the
+    config asks for collapsed stacks. Anything cached at module level will be warm for
+    that second run.
+    """
+    config = config or ProfileConfig()
+    profiler = cProfile.Profile()
+    start = time.perf_counter_ns()
+    rez = profiler.runcall(func, *args, **kwargs)
+    elapsed_ns = time.perf_counter_ns() - start
+
+    stats = pstats.Stats(profiler)
+    result = ProfileResult(
+        name=name or getattr(func, "__name__", "func"),
+        elapsed_ns=elapsed_ns,
+        top_cumulative=_top_functions(stats, "cumulative_ns", config.top_n),
+        top_self=_top_functions(stats, "self_ns", config.top_n),
+        return_value=rez,
+    )
+
+    if config.collapsed_path is not None:
+        collector = StackCollector()
+        collector.run(func, *args, **kwargs)
+        write_collapsed(collector.self_ns, config.collapsed_path)
+        result.collapsed_path = config.collapsed_path
+    return result
+
+
+def format_profile(result: ProfileResult, unit: TimeUnit = TimeUnit.MILLISECONDS) -> list[str]:
+    def table(title: str, rows: list[FunctionStats]) -> list[str]:
+        lines = [title, f"{'calls':>12} {'self':>12} {'cumulative':>12}  function"]
+        for row in rows:
+            calls = str(row.calls) if row.calls == row.primitive_calls else f"{row.calls}/{row.primitive_calls}"
+            lines.append(
+                f"{calls:>12} {convert_ns(row.self_ns, unit):>12.3f} "
+                f"{convert_ns(row.cumulative_ns, unit):>12.3f}  {row.function}"
+            )
+        return lines
+
+    lines = [f"{result.name}: {convert_ns(result.elapsed_ns, unit):.3f} {unit.value} under cProfile"]
+    lines += table(f"top {len(result.top_cumulative)} by cumulative time ({unit.value}):", result.top_cumulative)
+    lines += table(f"top {len(result.top_self)} by self time ({unit.value}):", result.top_self)
+    if result.collapsed_path:
+        lines.append(f"collapsed stacks written to {result.collapsed_path}")
+    return lines
+
+
+def profile_solution(
+    day: str,
+    func: Callable[..., Any],
+    *args,
+    unit: TimeUnit = TimeUnit.MILLISECONDS,
+    config: ProfileConfig | None = None,
+    **kwargs,
+) -> ProfileResult:
+    """Drop-in for `time_solution` in a day's `__main__` block when hunting for a hotspot."""
+    result = profile_function(func, *args, name=day, config=config, **kwargs)
+    print("\n".join(format_profile(result, unit)))
+    return result
+
+
+@dataclass
+class ImportStats:
+    module: str
+    self_ns: int
+    cumulative_ns: int
+
+
+@dataclass
+class ImportProfile:
+    module: str
+    # the module itself plus everything it imported that wasn't already loaded at startup
+    cumulative_ns: int | None
+    # the direct imports of `module`, slowest first
+    top_imports: list[ImportStats] = field(default_factory=list)
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "module": self.module,
+            "cumulative_ns": self.cumulative_ns,
+            "top_imports": [vars(stats) for stats in self.top_imports],
+            "error": self.error,
+        }
+
+
+def parse_importtime(stderr: str, module: str) -> tuple[int | None, list[ImportStats]]:
+    """Picks `module` and its direct children out of `-X importtime` output."""
+    # children are printed before their parent, one indent level deeper
+    pending: list[tuple[int, ImportStats]] = []
+    for line in stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        stats = ImportStats(name, int(self_us) * 1000, int(cumulative_us) * 1000)
+        depth = (len(indent) - 1) // 2
+        if depth == 0 and name == module:
+            children = [child for child_depth, child in pending if child_depth == 1]
+            children.sort(key=lambda child: child.cumulative_ns, reverse=True)
+            return stats.cumulative_ns, children
+        if depth == 0:
+            pending.clear()
+        else:
+            pending.append((depth, stats))
+    return None, []
+
+
+def profile_imports(module: str, cwd: Path | None = None, top_n: int = 5) -> ImportProfile:
+    """
+    Imports `module` in a fresh interpreter, since anything already imported in this process
+    would come back for free.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    cumulative_ns, children = parse_importtime(completed.stderr, module)
+    error = None
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "import failed"
+    return ImportProfile(module=module, cumulative_ns=cumulative_ns, top_imports=children[:top_n], error=error)
+
+
+def format_import_profile(profile: ImportProfile, unit: TimeUnit = TimeUnit.MILLISECONDS) -> str:
+    if profile.error:
+        return f"imports: ERROR {profile.error}"
+    if profile.cumulative_ns is None:
+        return "imports: n/a"
+    heaviest = ", ".join(
+        f"{stats.module} {convert_ns(stats.cumulative_ns, unit):.1f} {unit.value}" for stats in profile.top_imports
+    )
+    line = f"imports: {convert_ns(profile.cumulative_ns, unit):.3f} {unit.value} cold"
+    return f"{line} ({heaviest})" if heaviest else line
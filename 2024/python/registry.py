@@ -0,0 +1,200 @@
+"""
+Registry of the day solutions.
+
+Every `dayNN.py` module exposes a `soln(input_file: Path)` function, so rather than
+shelling out to `python dayNN.py` (and paying for interpreter startup every time)
+we discover the modules here and call `soln` directly in the current process.
+
+Modules are only imported when a day is actually loaded, so discovering the days
+doesn't drag in numpy / z3 / graphviz.
+"""
+
+import importlib
+import re
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+import cache_util
+import counter_util
+from profile_util import ImportProfile, ProfileConfig, ProfileResult, profile_function, profile_imports
+from timing_util import BenchmarkConfig, BenchmarkResult, MemoryStats, benchmark, measure_memory
+
+PYTHON_DIR = Path(__file__).parent
+INPUTS_DIR = PYTHON_DIR.parent / "inputs"
+
+DAY_MODULE_PATTERN = re.compile(r"^day(\d{2})\.py$")
+SOLUTION_FUNC_NAME = "soln"
+
+SolutionFunc = Callable[[Path], Any]
+
+
+@dataclass(frozen=True)
+class DayEntry:
+    day: str
+    module_name: str
+    module_path: Path
+
+    @property
+    def day_number(self) -> int:
+        return int(self.day[3:])
+
+    @property
+    def default_input(self) -> Path:
+        return INPUTS_DIR / f"{self.day}.txt"
+
+    def load(self) -> ModuleType:
+        return importlib.import_module(self.module_name)
+
+    def soln(self) -> SolutionFunc:
+        module = self.load()
+        func = getattr(module, SOLUTION_FUNC_NAME, None)
+        if not callable(func):
+            raise AttributeError(f"{self.module_name} does not define a `{SOLUTION_FUNC_NAME}(input_file)` function")
+        return func
+
+
+@dataclass
+class DayResult:
+    day: str
+    input_file: Path
+    answers: Any = None
+    elapsed_ns: int | None = None
+    error: str | None = None
+    benchmark: BenchmarkResult | None = None
+    memory: MemoryStats | None = None
+    profile: ProfileResult | None = None
+    imports: ImportProfile | None = None
+    # answers came out of the on-disk cache rather than a run
+    cached: bool = False
+    # `counter_util` counts from a single run (a benchmark keeps its own per call averages)
+    counters: dict[str, int] | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "day": self.day,
+            "input_file": str(self.input_file),
+            "answers": to_jsonable(self.answers),
+            "elapsed_ns": self.elapsed_ns,
+            "error": self.error,
+            "benchmark": self.benchmark.to_dict() if self.benchmark else None,
+            "memory": asdict(self.memory) if self.memory else None,
+            "profile": self.profile.to_dict() if self.profile else None,
+            "imports": self.imports.to_dict() if self.imports else None,
+            "cached": self.cached,
+            "counters": self.counters,
+        }
+
+
+def to_jsonable(value: Any) -> Any:
+    """Answers are mostly tuples of ints / strs, but some days hand back floats or numpy ints."""
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, "item"):
+        # numpy scalars
+        return value.item()
+    return str(value)
+
+
+def normalize_day(day: str | int) -> str:
+    """Accepts `1`, `"1"`, `"01"`, `"day01"` or `"day01.py"` and returns `"day01"`."""
+    day_str = str(day).strip().lower()
+    day_str = day_str.removesuffix(".py").removeprefix("day")
+    if not day_str.isdigit():
+        raise ValueError(f"Not a valid day: {day!r}")
+    return f"day{int(day_str):02d}"
+
+
+def discover_days(python_dir: Path = PYTHON_DIR) -> dict[str, DayEntry]:
+    days: dict[str, DayEntry] = {}
+    for path in sorted(python_dir.iterdir()):
+        match = DAY_MODULE_PATTERN.match(path.name)
+        if not match:
+            continue
+        day = f"day{match.group(1)}"
+        days[day] = DayEntry(day=day, module_name=path.stem, module_path=path)
+    return days
+
+
+def get_day(day: str | int) -> DayEntry:
+    day_key = normalize_day(day)
+    days = discover_days()
+    if day_key not in days:
+        raise KeyError(f"No solution module found for {day_key}")
+    return days[day_key]
+
+
+def run_day(
+    day: str | int,
+    input_file: Path | None = None,
+    bench_config: BenchmarkConfig | None = None,
+    track_memory: bool = False,
+    profile_config: ProfileConfig | None = None,
+    measure_imports: bool = False,
+) -> DayResult:
+    """
+    Runs a day once, or through the benchmark engine when a `bench_config` is given, or
+    under cProfile when a `profile_config` is given.
+
+    `track_memory` only matters for the single run - the benchmark engine goes by its config.
+    `measure_imports` times importing the module in a fresh interpreter, on top of whichever
+    of the above ran.
+
+    With `cache_util` caching on, a single run's answers are cached on disk and reused until
+    the input or the day's source changes.
+
+    The day's module level `lru_cache`s are watched by `counter_util`, so their hits / misses
+    end up in the counters along with whatever the day counts itself.
+    """
+    entry = get_day(day)
+    input_path = Path(input_file) if input_file is not None else entry.default_input
+    result = DayResult(day=entry.day, input_file=input_path)
+    if not input_path.exists():
+        result.error = f"Input file not found: {input_path}"
+        return result
+
+    if measure_imports:
+        result.imports = profile_imports(entry.module_name, cwd=PYTHON_DIR)
+
+    try:
+        soln = entry.soln()
+        counter_util.watch_caches(counter_util.find_caches(entry.load()))
+        if profile_config is not None:
+            result.profile = profile_function(soln, input_path, name=entry.day, config=profile_config)
+            result.answers = result.profile.return_value
+            result.elapsed_ns = result.profile.elapsed_ns
+        elif bench_config is None:
+            if track_memory:
+                result.memory, _ = measure_memory(soln, input_path)
+            start = time.perf_counter_ns()
+            if cache_util.is_enabled():
+                key = cache_util.cache_key("answers", entry.module_name, input_path)
+                result.cached, result.answers = cache_util.load(key)
+                if not result.cached:
+                    with counter_util.record_counters() as counters:
+                        result.answers = soln(input_path)
+                    result.counters = dict(counters.counts)
+                    cache_util.store(key, result.answers)
+            else:
+                with counter_util.record_counters() as counters:
+                    result.answers = soln(input_path)
+                result.counters = dict(counters.counts)
+            result.elapsed_ns = time.perf_counter_ns() - start
+        else:
+            result.benchmark = benchmark(soln, input_path, name=entry.day, config=bench_config)
+            result.answers = result.benchmark.return_value
+            result.elapsed_ns = round(result.benchmark.median_ns)
+            result.memory = result.benchmark.memory
+    except Exception as e:  # noqa: BLE001 - one broken day shouldn't take the whole run down
+        result.error = f"{type(e).__name__}: {e}"
+    return result
@@ -0,0 +1,261 @@
+"""
+Empirical complexity check.
+
+Runs each day over a ladder of generated inputs (see `inputgen`), fits the slope of
+log(runtime) against log(input size) and compares it with the hand-written `complexity`
+field in `analysis/results.json`. A linear solution should come out with a slope near 1,
+a quadratic one near 2, so a day whose slope is well above its documented class gets
+flagged before the real inputs get big enough to hurt.
+
+    python scaling.py 1 2 3
+    python scaling.py --all --scales 1 2 4 8 16 --max-seconds 5
+    python scaling.py 9 --json
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import re
+import statistics
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from inputgen import DEFAULT_OUT_DIR, DEFAULT_SEED, discover_generators, ensure_input, scale_arg
+from registry import PYTHON_DIR, normalize_day, run_day
+from timing_util import BenchmarkConfig, format_bytes
+
+RESULTS_JSON = PYTHON_DIR.parent / "analysis" / "results.json"
+
+DEFAULT_LADDER = (1, 2, 4, 8)
+# slope we allow above the claimed exponent before calling it out
+DEFAULT_TOLERANCE = 0.2
+# a log factor adds roughly 1 / ln(n) to the slope over the sizes we can afford to run
+LOG_FACTOR_ALLOWANCE = 0.15
+
+BIG_O_PATTERN = re.compile(r"O\((.*)\)")
+LOG_TERM_PATTERN = re.compile(r"log\s*\(?\s*\w+\s*\)?")
+N_TERM_PATTERN = re.compile(r"\bn\b(?:\s*\^\s*(\d+(?:\.\d+)?))?")
+
+
+@dataclass(frozen=True)
+class ComplexityClaim:
+    text: str
+    exponent: float
+    has_log: bool
+
+    def allowed_slope(self, tolerance: float = DEFAULT_TOLERANCE) -> float:
+        return self.exponent + tolerance + (LOG_FACTOR_ALLOWANCE if self.has_log else 0.0)
+
+
+def parse_complexity(text: str) -> ComplexityClaim | None:
+    """
+    Reads the power of `n` out of claims like "O(n log n)" or "O(n * k^2) where k is ...".
+
+    `n` is taken to be the size of the input. Any other variable is assumed to be either
+    bounded (ints per line) or to multiply out to the input size together with `n`
+    (lines * line length), so it doesn't add to the exponent.
+    """
+    big_o = BIG_O_PATTERN.search(text.split(" where ")[0])
+    if not big_o:
+        return None
+    body = big_o.group(1)
+    has_log = bool(LOG_TERM_PATTERN.search(body))
+    body = LOG_TERM_PATTERN.sub("", body)
+    exponent = sum(float(power) if power else 1.0 for power in N_TERM_PATTERN.findall(body))
+    return ComplexityClaim(text=text, exponent=exponent, has_log=has_log)
+
+
+def load_complexity_claims(results_json: Path = RESULTS_JSON) -> dict[str, ComplexityClaim]:
+    if not results_json.exists():
+        return {}
+    with open(results_json) as f:
+        results = json.load(f)
+    claims = {}
+    for day, entry in results.items():
+        text = entry.get("complexity")
+        if text and (claim := parse_complexity(text)):
+            claims[day] = claim
+    return claims
+
+
+@dataclass
+class ScalingPoint:
+    scale: int
+    input_bytes: int
+    median_ns: float | None = None
+    error: str | None = None
+
+
+@dataclass
+class ScalingResult:
+    day: str
+    points: list[ScalingPoint] = field(default_factory=list)
+    claim: ComplexityClaim | None = None
+    tolerance: float = DEFAULT_TOLERANCE
+    slope: float | None = None
+    r_squared: float | None = None
+
+    @property
+    def measured(self) -> list[ScalingPoint]:
+        return [point for point in self.points if point.median_ns is not None]
+
+    @property
+    def exceeds_claim(self) -> bool:
+        if self.claim is None or self.slope is None:
+            return False
+        return self.slope > self.claim.allowed_slope(self.tolerance)
+
+    @property
+    def verdict(self) -> str:
+        if self.slope is None:
+            return "not enough points"
+        if self.claim is None:
+            return "no documented complexity"
+        if self.exceeds_claim:
+            return f"EXCEEDS {self.claim.text}"
+        return f"ok for {self.claim.text}"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "day": self.day,
+            "points": [vars(point) for point in self.points],
+            "claim": self.claim.text if self.claim else None,
+            "allowed_slope": self.claim.allowed_slope(self.tolerance) if self.claim else None,
+            "slope": self.slope,
+            "r_squared": self.r_squared,
+            "exceeds_claim": self.exceeds_claim,
+        }
+
+
+def fit_loglog(sizes: list[float], times: list[float]) -> tuple[float, float]:
+    """Least squares slope of log(time) vs log(size), plus the r^2 of that fit."""
+    log_sizes = [math.log(size) for size in sizes]
+    log_times = [math.log(t) for t in times]
+    slope, _intercept = statistics.linear_regression(log_sizes, log_times)
+    if len(set(log_times)) == 1:
+        return slope, 1.0
+    return slope, statistics.correlation(log_sizes, log_times) ** 2
+
+
+def generated_input(day: str, scale: int, seed: int, out_dir: Path) -> Path:
+    """Same layout as `python -m inputgen`, regenerated unless it's from this seed and generator."""
+    return ensure_input(day, scale, seed, out_dir)
+
+
+def measure_scaling(
+    day: str,
+    scales: list[int],
+    bench_config: BenchmarkConfig,
+    claim: ComplexityClaim | None = None,
+    seed: int = DEFAULT_SEED,
+    out_dir: Path = DEFAULT_OUT_DIR,
+    max_seconds: float | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> ScalingResult:
+    """
+    Climbs the ladder from the smallest scale up. Stops early once a single run takes more
+    than `max_seconds`, since the next rung is going to be at least that slow again.
+    """
+    result = ScalingResult(day=day, claim=claim, tolerance=tolerance)
+    for scale in sorted(scales):
+        input_path = generated_input(day, scale, seed, out_dir)
+        point = ScalingPoint(scale=scale, input_bytes=input_path.stat().st_size)
+        result.points.append(point)
+        # the solutions print their answers (and sometimes a lot more), none of which we want here
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            day_result = run_day(day, input_path, bench_config)
+        if not day_result.ok:
+            point.error = day_result.error
+            break
+        assert day_result.benchmark is not None
+        point.median_ns = day_result.benchmark.median_ns
+        if max_seconds is not None and point.median_ns > max_seconds * 1e9:
+            break
+
+    measured = result.measured
+    if len(measured) >= 2:
+        result.slope, result.r_squared = fit_loglog(
+            [point.input_bytes for point in measured], [point.median_ns for point in measured]
+        )
+    return result
+
+
+def format_scaling(result: ScalingResult) -> str:
+    if result.slope is None:
+        line = f"{result.day}: {result.verdict}"
+    else:
+        line = f"{result.day}: slope {result.slope:.2f} (r² {result.r_squared:.3f}), {result.verdict}"
+        if result.claim:
+            line += f" (allowed up to {result.claim.allowed_slope(result.tolerance):.2f})"
+    for point in result.points:
+        timing = f"{point.median_ns / 1_000_000:>12.3f} ms" if point.median_ns is not None else f"ERROR {point.error}"
+        line += f"\n    x{point.scale:<6} {format_bytes(point.input_bytes):>10}  {timing}"
+    return line
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Fit runtime growth over generated inputs and check it against the documented complexity."
+    )
+    parser.add_argument("days", nargs="*", help="days to check, e.g. `1`, `01` or `day01` (default: all)")
+    parser.add_argument("--all", action="store_true", help="check every day that has an input generator")
+    parser.add_argument(
+        "--scales", type=scale_arg, nargs="+", default=list(DEFAULT_LADDER), help="input scales to run"
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR, help="where generated inputs are kept")
+    parser.add_argument(
+        "--max-seconds", type=float, default=10.0, help="stop climbing once a single run takes longer than this"
+    )
+    parser.add_argument("--bench-time", type=float, default=0.5, help="seconds of measurement per rung")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE, help="slope allowed above the claimed exponent"
+    )
+    parser.add_argument("--results-json", type=Path, default=RESULTS_JSON, help="where the complexity claims live")
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON to stdout")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    available = discover_generators()
+    try:
+        days = available if args.all or not args.days else [normalize_day(day) for day in args.days]
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    missing = [day for day in days if day not in available]
+    if missing:
+        print(f"error: no input generator for: {', '.join(missing)}", file=sys.stderr)
+        return 2
+
+    claims = load_complexity_claims(args.results_json)
+    bench_config = BenchmarkConfig(warmup_rounds=1, min_rounds=3, target_time=args.bench_time, track_memory=False)
+    results = []
+    for day in days:
+        result = measure_scaling(
+            day,
+            args.scales,
+            bench_config,
+            claim=claims.get(day),
+            seed=args.seed,
+            out_dir=args.out_dir,
+            max_seconds=args.max_seconds,
+            tolerance=args.tolerance,
+        )
+        results.append(result)
+        if not args.json:
+            print(format_scaling(result))
+
+    if args.json:
+        print(json.dumps({"days": [result.to_dict() for result in results]}, indent=2))
+
+    return 1 if any(result.exceeds_claim for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
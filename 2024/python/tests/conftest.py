@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# the day modules import each other as top level modules, same as when they're run directly
+PYTHON_DIR = Path(__file__).resolve().parent.parent
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
@@ -0,0 +1,111 @@
+"""
+What every day should get on its fixture in `tests/fixtures`, shared by the correctness
+and the benchmark tests.
+
+The fixtures are the examples from the puzzle text, except day24, which needs a full
+45-bit adder and so is `python -m inputgen day24` at scale 1 (seed 2024). A few days
+hardcode the real input's dimensions, so the example ones get patched in for the run.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from registry import get_day
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@dataclass(frozen=True)
+class DayCase:
+    day: str
+    expected: Any
+    # about 20x what the day takes on a laptop (5ms at least), so they catch a real slowdown
+    # rather than a noisy run
+    budget_ms: float
+    # module level constants to swap for the example's, e.g. a smaller grid
+    patches: dict[str, Any] = field(default_factory=dict)
+    # third party modules the day can't run without
+    requires: tuple[str, ...] = ()
+    # why the day is known to get its fixture wrong
+    known_bad: str | None = None
+    # slow enough that it's only benchmarked with `-m manual_test`
+    slow: bool = False
+
+    @property
+    def fixture(self) -> Path:
+        return FIXTURES_DIR / f"{self.day}.txt"
+
+    def load(self, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+        for requirement in self.requires:
+            pytest.importorskip(requirement)
+        module = get_day(self.day).load()
+        for name, value in self.patches.items():
+            monkeypatch.setattr(module, name, value)
+        return module
+
+
+CASES = [
+    DayCase("day01", (11, 31), budget_ms=5),
+    DayCase("day02", (2, 4), budget_ms=5),
+    # soln only returns part 2, which has its own example
+    DayCase("day03", 48, budget_ms=5),
+    DayCase("day04", (18, 9), budget_ms=5),
+    DayCase("day05", (143, 123), budget_ms=5),
+    DayCase("day06", (41, 6), budget_ms=10),
+    # soln only returns part 2, in the first slot
+    DayCase("day07", (11387, 0), budget_ms=5),
+    DayCase("day08", (14, 34), budget_ms=5),
+    DayCase("day09", (1928, 2858), budget_ms=5),
+    DayCase("day10", (36, 81), budget_ms=5),
+    DayCase("day11", (0, 65601038650482), budget_ms=60),
+    DayCase("day12", (1930, 1206), budget_ms=15),
+    DayCase("day13", (480, 875318608908), budget_ms=10, requires=("numpy",)),
+    DayCase(
+        "day14",
+        (12, 0),
+        budget_ms=15,
+        patches={
+            "NUM_TILES_WIDE": 11,
+            "NUM_TILES_TALL": 7,
+            "NUM_SECONDS_TO_SIMULATE": 100,
+            "MAX_NUM_SECONDS_TO_SIMULATE": 100,
+        },
+    ),
+    DayCase("day15", (10092, 9021), budget_ms=40),
+    DayCase("day16", (7036, 45), budget_ms=20),
+    DayCase("day17", ("4,6,3,5,6,3,5,2,1,0", 0), budget_ms=500, requires=("z3",)),
+    DayCase("day18", (22, "6,1"), budget_ms=20, patches={"IS_TEST": True, "NUMBER_BYTES_TO_SIMULATE": 12}),
+    DayCase("day19", (6, 16), budget_ms=5),
+    # the example's cheats save at most 84ps, so 100 would leave nothing to count
+    DayCase("day20", (1, 285), budget_ms=40, patches={"TIME_SAVING_CUTOFF": 50}),
+    DayCase("day21", (126384, 154115708116294), budget_ms=60),
+    DayCase(
+        "day22",
+        (37990510, 23),
+        budget_ms=300,
+        known_bad=(
+            "evolve_secret_number_n_times_opt returns the starting secret, and its banana totals use the "
+            "starting price, count repeats of a sequence and overwrite the other monkeys' totals"
+        ),
+    ),
+    DayCase("day23", (7, "co,de,ka,ta"), budget_ms=5),
+    DayCase("day24", (39913509973694, "huc,jbd,nct,rnp,wvd,z16,z23,z32"), budget_ms=30_000, slow=True),
+    DayCase("day25", (3, 0), budget_ms=5),
+]
+
+
+def case_params(benchmarks: bool = False) -> list[Any]:
+    """The cases as `pytest.param`s, with the known bad days xfailed (only their answers are wrong, not their speed)."""
+    params = []
+    for case in CASES:
+        marks = []
+        if case.known_bad and not benchmarks:
+            marks.append(pytest.mark.xfail(reason=case.known_bad, strict=True))
+        if case.slow and benchmarks:
+            marks.append(pytest.mark.manual_test)
+        params.append(pytest.param(case, id=case.day, marks=marks))
+    return params
@@ -0,0 +1,162 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# the analysis scripts are run from their own directory, same as there
+ANALYSIS_DIR = Path(__file__).resolve().parent.parent.parent / "analysis"
+if str(ANALYSIS_DIR) not in sys.path:
+    sys.path.insert(0, str(ANALYSIS_DIR))
+
+import history  # noqa: E402
+import results_schema  # noqa: E402
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("201.845µs", 201845),
+        ("201.845us", 201845),
+        ("6.682449s", 6682449000),
+        (" 1.5 ms ", 1500000),
+        ("12ns", 12),
+        ("0.5ns", 0.5),
+        ("1e-3s", 1000000),
+    ],
+)
+def test_parse_duration_ns(text: str, expected: int | float) -> None:
+    parsed = results_schema.parse_duration_ns(text)
+    assert parsed == expected
+    assert type(parsed) is type(expected)
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize("text", ["", "12", "fast", "-3ms", "1.5 min"])
+def test_parse_duration_ns_rejects_what_is_not_a_duration(text: str) -> None:
+    with pytest.raises(ValueError):
+        results_schema.parse_duration_ns(text)
+
+
+@pytest.mark.unit_test
+def test_legacy_results_are_migrated_to_ns() -> None:
+    legacy = {
+        "day01": {
+            "python": {"avg_time": "201.845µs", "notes": "heap"},
+            "rust": {"avg_time": {"pt1": "20µs", "pt2": "1.5ms"}},
+        },
+        "day02": {
+            "python": {
+                "avg_time": "1s",
+                "measured": {
+                    "solve_time": {"mean": 0.25, "median": 0.5, "stdev": 0.001, "min": 0.125, "max": 1.0, "runs": 5},
+                    "phases_ns": {"parse": 100},
+                },
+            },
+        },
+    }
+    migrated = results_schema.normalize_results(legacy)
+
+    assert migrated["day01"]["python"] == {"avg_time_ns": 201845, "notes": "heap"}
+    assert migrated["day01"]["rust"] == {"avg_time_ns": {"pt1": 20000, "pt2": 1500000}}
+    solve_time = migrated["day02"]["python"]["measured"]["solve_time"]
+    assert solve_time == {
+        "mean_ns": 250000000,
+        "median_ns": 500000000,
+        "stdev_ns": 1000000,
+        "min_ns": 125000000,
+        "max_ns": 1000000000,
+        "runs": 5,
+    }
+    assert results_schema.headline_ns(migrated["day02"]["python"]) == 500000000
+    # already current, so a second pass changes nothing, and the input is left alone
+    assert results_schema.normalize_results(migrated) == migrated
+    assert legacy["day01"]["python"]["avg_time"] == "201.845µs"
+
+
+def _record(day: str, samples_ns: list[int], input_digest: str | None = "abc") -> dict:
+    return {
+        "day": day,
+        "variant": "python",
+        "method": "in-process",
+        "input_digest": input_digest,
+        "samples_ns": samples_ns,
+    }
+
+
+@pytest.mark.unit_test
+def test_mann_whitney_greater() -> None:
+    baseline = [100 + n for n in range(10)]
+    slower = [150 + n for n in range(10)]
+    assert history.mann_whitney_greater(slower, baseline) < 0.001
+    assert history.mann_whitney_greater(baseline, slower) > 0.999
+    # all ties: no evidence either way
+    assert history.mann_whitney_greater([5] * 8, [5] * 8) == 1.0
+    assert 0.3 < history.mann_whitney_greater(baseline, list(reversed(baseline))) < 0.7
+
+
+@pytest.mark.unit_test
+def test_compare_records_needs_significance_and_size() -> None:
+    baseline_samples = [100 + n for n in range(10)]
+    baseline = {
+        history.record_key(record): record
+        for record in [
+            _record("day01", baseline_samples),
+            _record("day02", baseline_samples),
+            _record("day03", baseline_samples),
+            _record("day04", baseline_samples),
+        ]
+    }
+    candidate = {
+        history.record_key(record): record
+        for record in [
+            _record("day01", [150 + n for n in range(10)]),
+            _record("day02", [60 + n for n in range(10)]),
+            # consistently slower, but by less than the threshold
+            _record("day03", [103 + n for n in range(10)]),
+            # same day on another input never gets compared
+            _record("day04", [300 + n for n in range(10)], input_digest="def"),
+        ]
+    }
+    comparisons = history.compare_records(baseline, candidate)
+    assert [(comparison.day, comparison.status) for comparison in comparisons] == [
+        ("day01", "slower"),
+        ("day02", "faster"),
+        ("day03", "same"),
+    ]
+    assert comparisons[0].input_digest == "abc"
+
+
+@pytest.mark.unit_test
+def test_collect_metrics_keeps_going_when_a_day_fails(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import collect_metrics
+
+    traceback = "Traceback (most recent call last):\nModuleNotFoundError: No module named 'numpy'"
+
+    def time_python_import(day: str, iterations: int = 10) -> list[int]:
+        if day == "day13":
+            raise subprocess.CalledProcessError(1, ["python"], stderr=traceback + "\n")
+        return [100, 200]
+
+    def time_python_solutions(days: list[str]) -> dict:
+        raise RuntimeError("aoc.py exited with 1 without a JSON report: SyntaxError: invalid syntax")
+
+    appended = []
+    monkeypatch.setattr(collect_metrics, "RESULTS_FILE", tmp_path / "results.json")
+    monkeypatch.setattr(collect_metrics, "git_commit", lambda: ("abc123", False))
+    monkeypatch.setattr(collect_metrics, "time_python_startup", lambda iterations: [10, 20])
+    monkeypatch.setattr(collect_metrics, "time_python_import", time_python_import)
+    monkeypatch.setattr(collect_metrics, "time_python_solutions", time_python_solutions)
+    monkeypatch.setattr(collect_metrics, "append_records", appended.extend)
+
+    assert collect_metrics.main(["day01", "day13", "--skip-rust"]) == 0
+
+    results = results_schema.load_results(tmp_path / "results.json")
+    day01 = results["day01"]["python"]["measured"]
+    assert day01["import_time"]["median_ns"] == 150
+    assert day01["error"].startswith("aoc.py exited with 1 without a JSON report")
+    day13 = results["day13"]["python"]["measured"]
+    assert day13["error"] == f"import exited with 1: {traceback}"
+    assert "import_time" not in day13
+    assert [(record["day"], record["method"]) for record in appended] == [("day01", "import")]
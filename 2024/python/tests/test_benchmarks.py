@@ -0,0 +1,40 @@
+"""
+Latency budgets for each day on its fixture, through the same benchmark engine as
+`aoc.py --bench`. A slow machine (or a debugger) can stretch every budget with
+`AOC_BUDGET_SCALE=3`, and `-m "not benchmark_test"` skips them altogether.
+
+Every memo (and any plain `lru_cache` the day module keeps, like day21's) is cleared before
+each round, so the days that cache across calls (day11, day19) are timed cold and a slowdown
+in filling the cache still shows up against the budget.
+"""
+
+import os
+
+import pytest
+
+import memo
+from counter_util import find_caches
+from day_cases import DayCase, case_params
+from timing_util import BenchmarkConfig, TimeUnit, benchmark, format_benchmark_details
+
+BUDGET_SCALE = float(os.environ.get("AOC_BUDGET_SCALE", "1"))
+CONFIG = BenchmarkConfig(warmup_rounds=1, loops=1, min_rounds=3, max_rounds=10, target_time=0.1, track_memory=False)
+
+
+@pytest.mark.benchmark_test
+@pytest.mark.parametrize("case", case_params(benchmarks=True))
+def test_soln_within_budget(case: DayCase, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = case.load(monkeypatch)
+    caches = find_caches(module).values()
+
+    def cold_soln(input_file):
+        memo.clear_memos()
+        for cache in caches:
+            cache.cache_clear()
+        return module.soln(input_file)
+
+    result = benchmark(cold_soln, case.fixture, name=case.day, config=CONFIG)
+    budget_ms = case.budget_ms * BUDGET_SCALE
+    assert result.median_ns <= budget_ms * 1e6, (
+        f"{case.day} is over its {budget_ms:g} ms budget: {format_benchmark_details(result, TimeUnit.MILLISECONDS)}"
+    )
@@ -0,0 +1,82 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+import cache_util
+
+# a day module that gets to `leaf` only through `middle`
+MODULES = {
+    "cachetest_leaf": "def scale(n):\n    return n * 2\n",
+    "cachetest_middle": "from cachetest_leaf import scale\n\n\ndef parse_line(line):\n    return scale(int(line))\n",
+    "cachetest_day": (
+        "from cache_util import disk_cached\n"
+        "from cachetest_middle import parse_line\n"
+        "CALLS = []\n\n\n"
+        "@disk_cached\n"
+        "def parse(input_file):\n"
+        "    CALLS.append(input_file)\n"
+        "    return [parse_line(line) for line in input_file.read_text().split()]\n"
+    ),
+}
+
+
+@pytest.fixture
+def local_modules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """The modules above written out as if they lived next to the days, with a fresh cache dir."""
+    module_dir = tmp_path / "modules"
+    module_dir.mkdir()
+    for name, source in MODULES.items():
+        (module_dir / f"{name}.py").write_text(source)
+    monkeypatch.syspath_prepend(str(module_dir))
+    monkeypatch.setattr(cache_util, "PYTHON_DIR", module_dir)
+    monkeypatch.setattr(cache_util, "CACHE_DIR", tmp_path / "cache")
+    cache_util.forget_source_digests()
+    yield module_dir
+    for name in MODULES:
+        sys.modules.pop(name, None)
+    cache_util.forget_source_digests()
+
+
+@pytest.mark.unit_test
+def test_local_dependencies_are_followed_through_other_modules(local_modules: Path) -> None:
+    day = importlib.import_module("cachetest_day")
+    names = [module.__name__ for module in cache_util.local_dependencies(day)]
+    assert names == ["cachetest_day", "cachetest_leaf", "cachetest_middle"]
+    assert [module.__name__ for module in cache_util.local_imports(day)] == ["cachetest_middle"]
+
+
+@pytest.mark.unit_test
+def test_editing_the_input_is_a_miss(local_modules: Path, tmp_path: Path) -> None:
+    day = importlib.import_module("cachetest_day")
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1\n2\n")
+
+    with cache_util.caching():
+        assert day.parse(input_file) == [2, 4]
+        assert day.parse(input_file) == [2, 4]
+        assert len(day.CALLS) == 1
+
+        input_file.write_text("1\n2\n3\n")
+        assert day.parse(input_file) == [2, 4, 6]
+        assert len(day.CALLS) == 2
+
+    # off again: a plain call every time
+    day.parse(input_file)
+    assert len(day.CALLS) == 3
+
+
+@pytest.mark.unit_test
+def test_editing_a_module_it_reaches_changes_the_key(local_modules: Path, tmp_path: Path) -> None:
+    importlib.import_module("cachetest_day")
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1\n")
+    key = cache_util.cache_key("parse", "cachetest_day", input_file)
+
+    # remembered for the process, the code that's running hasn't changed
+    (local_modules / "cachetest_leaf.py").write_text("def scale(n):\n    return n * 30\n")
+    assert cache_util.cache_key("parse", "cachetest_day", input_file) == key
+
+    cache_util.forget_source_digests()
+    assert cache_util.cache_key("parse", "cachetest_day", input_file) != key
@@ -0,0 +1,79 @@
+import pytest
+
+from grid_search import UNREACHED, astar, bfs, dijkstra, grid_moves, manhattan_heuristic
+from input_util import Grid
+
+# two shortest routes from 0 to 3 (through 1 or 2) and a longer one through 4 and 5
+DIAMOND = {0: [1, 2, 4], 1: [3], 2: [3], 3: [], 4: [5], 5: [3], 6: []}
+
+OPEN_GRID = """
+.......
+.......
+.......
+.......
+.......
+"""
+
+
+@pytest.mark.unit_test
+def test_bfs_preds_cover_every_shortest_path() -> None:
+    result = bfs(len(DIAMOND), [0], DIAMOND.__getitem__, goals={3}, track_preds=True)
+    assert result.goal == 3
+    assert result.dist[3] == 2
+    assert sorted(result.preds[3]) == [1, 2]
+    assert result.dag_states([3]) == {0, 1, 2, 3}
+    assert result.path_to(3) in ([0, 1, 3], [0, 2, 3])
+    assert result.dist[6] == UNREACHED and result.path_to(6) == []
+
+
+@pytest.mark.unit_test
+def test_dijkstra_preds_keep_equal_cost_routes_only() -> None:
+    edges = {0: [(1, 1), (2, 2), (3, 2)], 1: [(3, 1)], 2: [(3, 1)], 3: []}
+    result = dijkstra(len(edges), [0], edges.__getitem__, goals={3}, track_preds=True)
+    assert result.dist[3] == 2
+    # the direct edge ties the route through 1, the one through 2 is a step too long
+    assert sorted(result.preds[3]) == [0, 1]
+    assert result.dag_states([3]) == {0, 1, 3}
+
+
+@pytest.mark.unit_test
+def test_astar_stops_once_nothing_left_can_tie_the_goal() -> None:
+    grid = Grid.from_str(OPEN_GRID)
+    start = grid.index(2, 0)
+    goal = grid.index(2, 3)
+    step = grid_moves(grid)
+    heuristic = manhattan_heuristic(grid, goal)
+    expanded = []
+
+    def moves(index: int) -> list[tuple[int, int]]:
+        expanded.append(index)
+        return [(next_index, 1) for next_index in step(index)]
+
+    result = astar(len(grid.cells), [start], moves, {goal}, heuristic, track_preds=True)
+    assert result.dist[goal] == 3
+    # only the straight line along the row can be as cheap as the goal
+    assert result.dag_states([goal]) == {grid.index(2, col) for col in range(4)}
+    assert all(result.dist[index] + heuristic(index) <= 3 for index in expanded)
+
+    expanded.clear()
+    plain = dijkstra(len(grid.cells), [start], moves, {goal}, track_preds=True)
+    assert plain.dag_states([goal]) == result.dag_states([goal])
+    assert len(expanded) > len(result.dag_states([goal]))
+
+
+@pytest.mark.unit_test
+def test_search_without_track_preds_stops_at_the_first_goal() -> None:
+    grid = Grid.from_str(OPEN_GRID)
+    start = grid.index(0, 0)
+    goal = grid.index(0, 1)
+    expanded = []
+    step = grid_moves(grid)
+
+    def moves(index: int) -> list[int]:
+        expanded.append(index)
+        return step(index)
+
+    result = bfs(len(grid.cells), [start], moves, goals={goal})
+    assert result.goal == goal
+    assert result.path_to(goal) == [start, goal]
+    assert goal not in expanded
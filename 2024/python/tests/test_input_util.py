@@ -0,0 +1,108 @@
+from pathlib import Path
+
+import pytest
+
+from input_util import Grid, MappedInput, extract_ints, parse_input_as_ndarray
+
+
+@pytest.mark.unit_test
+def test_extract_ints_keeps_signs() -> None:
+    assert extract_ints("p=0,4 v=3,-3\np=-10,2 v=-1,+7\n") == [0, 4, 3, -3, -10, 2, -1, 7]
+    assert extract_ints(b"Button A: X+94, Y+34") == [94, 34]
+    assert extract_ints("7 6 4\n\n1 -2\n", per_line=True) == [[7, 6, 4], [1, -2]]
+
+
+@pytest.mark.unit_test
+def test_extract_ints_falls_back_for_a_dash_that_is_not_a_sign(tmp_path: Path) -> None:
+    assert extract_ints("5-3") == [5, -3]
+    assert extract_ints("a-b 12-7 x") == [12, -7]
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1-2\n3 4\n")
+    assert extract_ints(input_file, per_line=True) == [[1, -2], [3, 4]]
+
+
+@pytest.mark.unit_test
+def test_chunks_never_split_a_line(tmp_path: Path) -> None:
+    lines = [f"{n * 7919} {-n}" for n in range(200)]
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("\n".join(lines) + "\n")
+
+    with MappedInput(input_file) as mapped:
+        # 64 lands in the middle of a line every time
+        chunks = [bytes(chunk) for chunk in mapped.chunks(chunk_size=64)]
+        ints = [n for chunk in mapped.int_chunks() for n in chunk]
+
+    assert len(chunks) > 1
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    assert b"".join(chunks) == input_file.read_bytes()
+    assert [n for chunk in chunks for n in extract_ints(chunk)] == extract_ints(input_file)
+    assert ints == extract_ints(input_file)
+
+
+@pytest.mark.unit_test
+def test_chunks_hand_out_a_long_line_whole(tmp_path: Path) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"1 2\n" + b"3" * 100 + b"\n4")
+
+    with MappedInput(input_file) as mapped:
+        chunks = [bytes(chunk) for chunk in mapped.chunks(chunk_size=8)]
+
+    assert chunks == [b"1 2\n", b"3" * 100 + b"\n", b"4"]
+
+
+@pytest.mark.unit_test
+def test_grid_clones_share_until_written() -> None:
+    grid = Grid.from_str("..#\n#..\n")
+    twin = grid.clone()
+    assert twin.cells is grid.cells
+
+    index = grid.index(0, 0)
+    twin[index] = ord("O")
+    assert twin.cells is not grid.cells
+    assert grid.to_str() == "..#\n#.."
+    assert twin.to_str() == "O.#\n#.."
+
+    # the original was shared too, so its first write copies as well
+    other = grid.clone()
+    cells = grid.writable()
+    assert cells is not other.cells
+    cells[index] = ord("X")
+    assert other.to_str() == "..#\n#.."
+    assert grid.char_at(index) == "X"
+
+
+@pytest.mark.unit_test
+def test_parse_input_as_ndarray_str_is_a_view_over_the_bytes(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"#.#\n..#\n")
+
+    grid = parse_input_as_ndarray(input_file)
+    assert grid.shape == (2, 3)
+    assert grid.dtype == np.uint8
+    assert grid.tolist() == [[35, 46, 35], [46, 46, 35]]
+    # rows are 4 bytes apart, the newline column is strided over rather than copied out
+    assert grid.strides == (4, 1)
+    assert not grid.flags.writeable
+
+    # \r\n endings, and the leading newline the example strings have
+    assert parse_input_as_ndarray(b"#.#\r\n..#\r\n").strides == (5, 1)
+    assert parse_input_as_ndarray("\n#.#\n..#").tolist() == grid.tolist()
+
+
+@pytest.mark.unit_test
+def test_parse_input_as_ndarray_int(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("0123\n45.9\n")
+
+    grid = parse_input_as_ndarray(input_file, "int")
+    assert grid.tolist() == [[0, 1, 2, 3], [4, 5, -2, 9]]
+    assert grid.shape == (2, 4)
+
+
+@pytest.mark.unit_test
+def test_parse_input_as_ndarray_rejects_ragged_rows() -> None:
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        parse_input_as_ndarray("###\n##\n")
@@ -0,0 +1,99 @@
+import pytest
+
+import memo
+from memo import memo_scope
+
+
+@pytest.mark.unit_test
+def test_lfu_evicts_the_least_used_entry() -> None:
+    calls = []
+
+    @memo.memo(maxsize=2, policy="lfu")
+    def double(n: int) -> int:
+        calls.append(n)
+        return n * 2
+
+    double(1)
+    double(1)
+    double(2)
+    # 2 has been used once to 1's twice, so it's the one that goes
+    double(3)
+    double(1)
+    double(2)
+    assert calls == [1, 2, 3, 2]
+    assert double.cache_info().evictions == 2
+
+
+@pytest.mark.unit_test
+def test_lfu_evicts_the_oldest_among_equals() -> None:
+    calls = []
+
+    @memo.memo(maxsize=2, policy="lfu")
+    def double(n: int) -> int:
+        calls.append(n)
+        return n * 2
+
+    double(1)
+    double(2)
+    double(3)
+    double(2)
+    double(1)
+    assert calls == [1, 2, 3, 1]
+
+
+@pytest.mark.unit_test
+def test_max_bytes_keeps_the_estimate_under_the_limit() -> None:
+    entry_bytes = memo._entry_bytes(1, 10)
+    max_bytes = 3 * entry_bytes
+
+    @memo.memo(max_bytes=max_bytes)
+    def tenfold(n: int) -> int | str:
+        return "x" * max_bytes if n < 0 else n * 10
+
+    for n in range(1, 6):
+        tenfold(n)
+    info = tenfold.cache_info()
+    assert (info.currsize, info.nbytes, info.evictions) == (3, max_bytes, 2)
+
+    # bigger than the whole budget on its own, so it isn't kept and nothing is pushed out for it
+    tenfold(-1)
+    assert (tenfold.cache_info().currsize, tenfold.cache_info().nbytes) == (3, max_bytes)
+
+    tenfold.cache_clear()
+    assert (tenfold.cache_info().currsize, tenfold.cache_info().nbytes) == (0, 0)
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize("options", [{}, {"maxsize": 1}, {"policy": "lfu"}, {"max_bytes": 1 << 10}])
+def test_stats_survive_cache_clear(options: dict) -> None:
+    @memo.memo(**options)
+    def square(n: int) -> int:
+        return n * n
+
+    square(3)
+    square(3)
+    square(4)
+    square.cache_clear()
+    square(3)
+    info = square.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 3, 1)
+
+
+@pytest.mark.unit_test
+def test_memo_scope_clears_on_the_way_out() -> None:
+    @memo.memo()
+    def square(n: int) -> int:
+        return n * n
+
+    with memo_scope(square):
+        square(3)
+        assert square.cache_info().currsize == 1
+    assert square.cache_info().currsize == 0
+
+    memo.set_keep_warm(True)
+    try:
+        with memo_scope(square):
+            square(3)
+    finally:
+        memo.set_keep_warm(False)
+    assert square.cache_info().currsize == 1
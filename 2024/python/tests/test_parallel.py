@@ -0,0 +1,53 @@
+import multiprocessing
+import signal
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import parallel
+from registry import DayResult
+
+pytestmark = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="the stand-in days only reach the workers through fork"
+)
+
+
+def _fake_day(day: str, input_file: Path | None, timeout: float | None, run_kwargs: dict) -> DayResult:
+    if day == "day17":
+        # no interval timer in here, so like a day stuck in C code nothing interrupts this
+        time.sleep(60)
+    if day == "day13":
+        raise RuntimeError("boom")
+    return DayResult(day=day, input_file=Path(f"{day}.txt"), answers=(day, run_kwargs))
+
+
+@pytest.mark.integration_test
+def test_a_stuck_day_is_killed_and_its_slot_reused(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(parallel, "_run_day_in_worker", _fake_day)
+    monkeypatch.setattr(parallel, "HARD_TIMEOUT_GRACE_SECONDS", 0.2)
+
+    started = time.monotonic()
+    results = parallel.run_days_parallel(
+        ["day17", "day01", "day13", "day02"], jobs=1, timeout=0.1, day_kwargs={"day02": {"extra": 1}}, rounds=3
+    )
+
+    assert time.monotonic() - started < 10
+    assert [result.day for result in results] == ["day17", "day01", "day13", "day02"]
+    assert results[0].error == "DayTimeout: took longer than 0.1s (killed)"
+    # only one slot, so these only ran because the stuck one gave it back
+    assert results[1].answers == ("day01", {"rounds": 3})
+    assert results[2].error == "RuntimeError: boom"
+    assert results[3].answers == ("day02", {"rounds": 3, "extra": 1})
+
+
+@pytest.mark.integration_test
+def test_a_worker_that_dies_is_reported(monkeypatch: pytest.MonkeyPatch) -> None:
+    def crash(*args: Any) -> DayResult:
+        signal.raise_signal(signal.SIGKILL)
+        raise AssertionError("unreachable")
+
+    monkeypatch.setattr(parallel, "_run_day_in_worker", crash)
+    [result] = parallel.run_days_parallel(["day01"], jobs=1)
+    assert result.error == f"worker exited with code {-signal.SIGKILL}"
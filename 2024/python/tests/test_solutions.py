@@ -0,0 +1,24 @@
+import pytest
+
+from day_cases import CASES, DayCase, case_params
+from registry import discover_days
+
+
+@pytest.mark.unit_test
+def test_every_day_has_a_case() -> None:
+    assert [case.day for case in CASES] == list(discover_days())
+
+
+@pytest.mark.end_to_end_test
+@pytest.mark.parametrize("case", case_params())
+def test_soln_on_fixture(case: DayCase, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = case.load(monkeypatch)
+    assert module.soln(case.fixture) == case.expected
+
+
+@pytest.mark.end_to_end_test
+def test_day04_ndarray_matches_soln(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    case = next(case for case in CASES if case.day == "day04")
+    module = case.load(monkeypatch)
+    assert module.soln_ndarray(case.fixture) == case.expected
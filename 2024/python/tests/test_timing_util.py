@@ -0,0 +1,33 @@
+import pytest
+
+from timing_util import median_confidence_interval, time_function_with_timeit
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize(
+    ("n", "confidence", "ranks"),
+    [
+        # 0-based ranks of the binomial(n, 1/2) interval, as in the usual tables
+        (5, 0.95, (0, 4)),
+        (6, 0.95, (0, 5)),
+        (10, 0.95, (1, 8)),
+        (10, 0.99, (0, 9)),
+        (20, 0.95, (5, 14)),
+        (100, 0.95, (39, 60)),
+        (100, 0.99, (36, 63)),
+    ],
+)
+def test_median_confidence_interval_ranks(n: int, confidence: float, ranks: tuple[int, int]) -> None:
+    ordered = list(range(n))
+    assert median_confidence_interval(ordered, confidence) == ranks
+
+
+@pytest.mark.unit_test
+def test_time_function_with_timeit_passes_number_through() -> None:
+    calls = []
+
+    def record(a: int, number: int = 0) -> None:
+        calls.append((a, number))
+
+    assert time_function_with_timeit(record, (1,), {"number": 7}, number=3) >= 0
+    assert calls == [(1, 7)] * 3
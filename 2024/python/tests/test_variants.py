@@ -0,0 +1,49 @@
+import pytest
+
+import variants
+from day_cases import CASES
+
+CASES_BY_DAY = {case.day: case for case in CASES}
+
+
+def _choices(key: str, *points: tuple[int, str]) -> dict:
+    record = {"machine": variants.machine(), "tuned_at": "", "default": "heap"}
+    record["points"] = [{"input_bytes": size, "winner": winner, "medians_ns": {}} for size, winner in points]
+    return {key: record}
+
+
+@pytest.mark.unit_test
+def test_choose_picks_the_closest_tuned_size() -> None:
+    choices = _choices("day01/soln", (1_000, "heap"), (100_000, "sort"))
+    assert variants.choose("day01/soln", 2_000, choices) == "heap"
+    assert variants.choose("1/soln", 50_000, choices) == "sort"
+
+
+@pytest.mark.unit_test
+def test_choose_falls_back_to_the_default() -> None:
+    assert variants.choose("day01/soln", 1_000, {}) == "heap"
+    # tuned somewhere else
+    choices = _choices("day01/soln", (1_000, "sort"))
+    choices["day01/soln"]["machine"] = {"arch": "elsewhere"}
+    assert variants.choose("day01/soln", 1_000, choices) == "heap"
+    # a variant that isn't there anymore
+    assert variants.choose("day01/soln", 1_000, _choices("day01/soln", (1_000, "gone"))) == "heap"
+
+
+@pytest.mark.unit_test
+def test_unknown_sets_are_rejected() -> None:
+    with pytest.raises(KeyError):
+        variants.get_variant_set("day01/nope")
+    with pytest.raises(ValueError):
+        variants.register_variants(variants.get_variant_set("day01/soln"))
+
+
+@pytest.mark.end_to_end_test
+@pytest.mark.parametrize("key", list(variants.variant_sets()))
+def test_variants_agree_on_fixture(key: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    variant_set = variants.get_variant_set(key)
+    case = CASES_BY_DAY[variant_set.day]
+    case.load(monkeypatch)
+    prepared = variant_set.prepare(case.fixture)
+    answers = {name: variant_set.normalize(func(prepared)) for name, func in variant_set.variants.items()}
+    assert all(answer == answers[variant_set.default] for answer in answers.values()), answers
@@ -1,13 +1,30 @@
+import gc
+import math
+import statistics
+import sys
 import time
 import timeit
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Any, Callable
+from functools import wraps
+from typing import Any, Callable, Iterator
+
+from counter_util import CounterRecorder, format_counters, record_counters
+
+try:
+    import resource
+except ImportError:  # windows
+    resource = None
 
 
 class TimingOptions(str, Enum):
     PERF_COUNTER = "perf_counter"
     TIMEIT = "timeit"
     AVERAGE = "average"
+    BENCHMARK = "benchmark"
 
 
 class TimeUnit(str, Enum):
@@ -17,10 +34,467 @@ class TimeUnit(str, Enum):
     NANOSECONDS = "ns"
 
 
+def max_rss_bytes() -> int | None:
+    """High-water mark of the process' resident set size."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports KiB, macOS reports bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+@dataclass
+class PhaseMemory:
+    peak_bytes: int
+    allocated_blocks: int
+    max_rss_growth_bytes: int | None
+
+
+class SpanRecorder:
+    """
+    Accumulates time spent inside `span`s, keyed by the slash-joined path of nested span names.
+
+    With `track_memory` (and tracemalloc running) it also keeps, per span, the traced peak
+    above what was allocated when the span was entered, the net change in allocated blocks
+    and how much the max RSS grew.
+    """
+
+    def __init__(self, track_memory: bool = False) -> None:
+        self.totals_ns: dict[str, int] = defaultdict(int)
+        self.counts: dict[str, int] = defaultdict(int)
+        self.track_memory = track_memory
+        self.memory: dict[str, PhaseMemory] = {}
+        self._stack: list[str] = []
+        # [current bytes on entry, highest peak seen so far, blocks on entry, max rss on entry]
+        self._memory_frames: list[list[Any]] = []
+
+    def enter(self, name: str) -> str:
+        self._stack.append(name)
+        path = "/".join(self._stack)
+        # claim the slot on the way in so parents come before their children
+        self.totals_ns.setdefault(path, 0)
+        if self.track_memory:
+            self.push_memory_frame()
+        return path
+
+    def exit(self, path: str, elapsed_ns: int) -> None:
+        self._stack.pop()
+        self.totals_ns[path] += elapsed_ns
+        self.counts[path] += 1
+        if self.track_memory:
+            phase = self.pop_memory_frame()
+            if path in self.memory:
+                previous = self.memory[path]
+                phase.peak_bytes = max(phase.peak_bytes, previous.peak_bytes)
+                phase.allocated_blocks += previous.allocated_blocks
+                if phase.max_rss_growth_bytes is not None and previous.max_rss_growth_bytes is not None:
+                    phase.max_rss_growth_bytes += previous.max_rss_growth_bytes
+            self.memory[path] = phase
+
+    def push_memory_frame(self) -> None:
+        # tracemalloc only has the one peak, so a nested frame resets it and hands
+        # whatever the parent had seen so far back up when it's popped
+        current, peak = tracemalloc.get_traced_memory()
+        if self._memory_frames:
+            parent = self._memory_frames[-1]
+            parent[1] = max(parent[1], peak)
+        tracemalloc.reset_peak()
+        self._memory_frames.append([current, current, sys.getallocatedblocks(), max_rss_bytes()])
+
+    def pop_memory_frame(self) -> PhaseMemory:
+        start_bytes, carried_peak, start_blocks, start_rss = self._memory_frames.pop()
+        peak = max(tracemalloc.get_traced_memory()[1], carried_peak)
+        if self._memory_frames:
+            parent = self._memory_frames[-1]
+            parent[1] = max(parent[1], peak)
+        end_rss = max_rss_bytes()
+        return PhaseMemory(
+            peak_bytes=peak - start_bytes,
+            allocated_blocks=sys.getallocatedblocks() - start_blocks,
+            max_rss_growth_bytes=None if start_rss is None or end_rss is None else end_rss - start_rss,
+        )
+
+
+_active_recorder: SpanRecorder | None = None
+
+
+class Span:
+    """
+    Marks a phase of a solution, e.g.
+
+        with span("parse"):
+            ...
+
+    When nothing is recording (the normal `python dayNN.py` case) entering and exiting
+    is just a global lookup, so it's fine to leave these in the day modules.
+    """
+
+    __slots__ = ("name", "_recorder", "_path", "_start_ns")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._recorder: SpanRecorder | None = None
+        self._path = ""
+        self._start_ns = 0
+
+    def __enter__(self) -> "Span":
+        recorder = _active_recorder
+        self._recorder = recorder
+        if recorder is not None:
+            self._path = recorder.enter(self.name)
+            self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        recorder = self._recorder
+        if recorder is not None:
+            recorder.exit(self._path, time.perf_counter_ns() - self._start_ns)
+            self._recorder = None
+        return False
+
+
+def span(name: str) -> Span:
+    return Span(name)
+
+
+def timed_span(name: str | None = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator version of `span`, defaults to the function's name."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        span_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with Span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def record_spans(recorder: SpanRecorder | None = None) -> Iterator[SpanRecorder]:
+    global _active_recorder
+    recorder = recorder or SpanRecorder()
+    previous = _active_recorder
+    _active_recorder = recorder
+    try:
+        yield recorder
+    finally:
+        _active_recorder = previous
+
+
+@dataclass
+class MemoryStats:
+    """
+    Memory used by one call.
+
+    `peak_bytes` is the tracemalloc peak above what was already allocated, `allocated_blocks`
+    the net change in live blocks (i.e. what the call left behind, caches included) and
+    the RSS numbers come from `ru_maxrss`, so they're None where `resource` doesn't exist.
+    """
+
+    peak_bytes: int
+    allocated_blocks: int
+    max_rss_bytes: int | None
+    max_rss_growth_bytes: int | None
+    phases: dict[str, PhaseMemory] = field(default_factory=dict)
+
+
+def measure_memory(func: Callable[..., Any], *args, **kwargs) -> tuple[MemoryStats, Any]:
+    """
+    Runs `func` once under tracemalloc.
+
+    tracemalloc slows everything down a lot, so this is its own run rather than something
+    folded into the timed rounds.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    recorder = SpanRecorder(track_memory=True)
+    try:
+        recorder.push_memory_frame()
+        with record_spans(recorder):
+            rez = func(*args, **kwargs)
+        total = recorder.pop_memory_frame()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    stats = MemoryStats(
+        peak_bytes=total.peak_bytes,
+        allocated_blocks=total.allocated_blocks,
+        max_rss_bytes=max_rss_bytes(),
+        max_rss_growth_bytes=total.max_rss_growth_bytes,
+        phases=recorder.memory,
+    )
+    return stats, rez
+
+
+@dataclass(frozen=True)
+class BenchmarkConfig:
+    """
+    Knobs for `benchmark`.
+
+    Each round calls the function `loops` times back to back and records the mean of
+    that round as one sample. If `loops` is None it's calibrated so that one round takes
+    at least `min_round_time` (this is what keeps the sub-millisecond days out of timer
+    noise), and if `rounds` is None we take as many rounds as fit in `target_time`,
+    clamped to [`min_rounds`, `max_rounds`].
+
+    `track_memory` adds one extra call under tracemalloc before the warmup, so module
+    level caches are measured cold.
+    """
+
+    warmup_rounds: int = 2
+    loops: int | None = None
+    rounds: int | None = None
+    min_rounds: int = 5
+    max_rounds: int = 200
+    min_round_time: float = 0.01
+    target_time: float = 1.0
+    disable_gc: bool = True
+    confidence: float = 0.95
+    track_memory: bool = True
+
+
+@dataclass
+class PhaseStats:
+    """Per-call time spent in one span, one sample per benchmark round."""
+
+    name: str
+    samples_ns: list[float]
+    calls_per_run: float
+    median_ns: float = 0.0
+    mean_ns: float = 0.0
+    min_ns: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.median_ns = statistics.median(self.samples_ns)
+        self.mean_ns = statistics.fmean(self.samples_ns)
+        self.min_ns = min(self.samples_ns)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    samples_ns: list[float]
+    loops: int
+    warmup_rounds: int
+    gc_disabled: bool
+    confidence: float
+    min_ns: float = 0.0
+    max_ns: float = 0.0
+    mean_ns: float = 0.0
+    median_ns: float = 0.0
+    stdev_ns: float = 0.0
+    p95_ns: float = 0.0
+    mad_ns: float = 0.0
+    ci_low_ns: float = 0.0
+    ci_high_ns: float = 0.0
+    phases: dict[str, PhaseStats] = field(default_factory=dict)
+    memory: MemoryStats | None = None
+    # `counter_util` counts per call, averaged over the timed rounds
+    counters: dict[str, float] = field(default_factory=dict)
+    return_value: Any = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self.samples_ns:
+            raise ValueError("A benchmark needs at least one sample")
+        ordered = sorted(self.samples_ns)
+        self.min_ns = ordered[0]
+        self.max_ns = ordered[-1]
+        self.mean_ns = statistics.fmean(ordered)
+        self.median_ns = statistics.median(ordered)
+        self.stdev_ns = statistics.stdev(ordered) if len(ordered) > 1 else 0.0
+        self.p95_ns = percentile(ordered, 95)
+        self.mad_ns = statistics.median(abs(sample - self.median_ns) for sample in ordered)
+        self.ci_low_ns, self.ci_high_ns = median_confidence_interval(ordered, self.confidence)
+
+    @property
+    def rounds(self) -> int:
+        return len(self.samples_ns)
+
+    def to_dict(self, include_samples: bool = True) -> dict[str, Any]:
+        data = asdict(self)
+        data.pop("return_value")
+        data["rounds"] = self.rounds
+        if not include_samples:
+            data.pop("samples_ns")
+            for phase in data["phases"].values():
+                phase.pop("samples_ns")
+        return data
+
+
+def percentile(ordered: list[float], pct: float) -> float:
+    """Linear interpolation between closest ranks, same as numpy's default."""
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def median_confidence_interval(ordered: list[float], confidence: float = 0.95) -> tuple[float, float]:
+    """
+    Distribution-free confidence interval for the median.
+
+    Timings are skewed (there's a hard floor and a long tail), so rather than assume
+    normality we use order statistics: the r-th smallest to the r-th largest sample, with
+    r the largest rank where P(binomial(n, 1/2) < r) is still within (1 - confidence) / 2.
+    That covers the median at least `confidence` of the time, exactly rather than by a
+    normal approximation that comes out too narrow. Too few samples for any r to do that
+    gives the full range.
+    """
+    n = len(ordered)
+    tail = (1 - confidence) / 2
+    total = 2**n
+    # `below` is P(binomial <= k) * 2**n, built up one comb(n, k) at a time
+    rank = 0
+    below = 0
+    term = 1
+    for k in range(n + 1):
+        below += term
+        if below / total > tail:
+            break
+        rank += 1
+        term = term * (n - k) // (k + 1)
+    if rank == 0:
+        return ordered[0], ordered[-1]
+    return ordered[rank - 1], ordered[n - rank]
+
+
+def _time_loops_ns(func: Callable[..., Any], loops: int, args: tuple, kwargs: dict) -> tuple[int, Any]:
+    rez = None
+    start = time.perf_counter_ns()
+    for _ in range(loops):
+        rez = func(*args, **kwargs)
+    return time.perf_counter_ns() - start, rez
+
+
+def _collect_phase_stats(phase_rounds: list[SpanRecorder], loops: int) -> dict[str, PhaseStats]:
+    # first-seen order, which is the order the phases run in
+    phase_names = dict.fromkeys(name for recorder in phase_rounds for name in recorder.totals_ns)
+    return {
+        name: PhaseStats(
+            name=name,
+            samples_ns=[recorder.totals_ns.get(name, 0) / loops for recorder in phase_rounds],
+            calls_per_run=statistics.fmean(recorder.counts.get(name, 0) for recorder in phase_rounds) / loops,
+        )
+        for name in phase_names
+    }
+
+
+def _calibrate_loops(
+    func: Callable[..., Any], min_round_time_ns: float, args: tuple, kwargs: dict
+) -> tuple[int, int, Any]:
+    """Same idea as timeit.Timer.autorange: try 1, 2, 5, 10, 20, 50, ... loops until a round is long enough.
+
+    Returns the loop count along with the accepted round's time, which doubles as the first sample.
+    """
+    loops = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            candidate = loops * multiplier
+            elapsed_ns, rez = _time_loops_ns(func, candidate, args, kwargs)
+            if elapsed_ns >= min_round_time_ns:
+                return candidate, elapsed_ns, rez
+        loops *= 10
+
+
+def benchmark(
+    func: Callable[..., Any],
+    *args,
+    name: str | None = None,
+    config: BenchmarkConfig | None = None,
+    **kwargs,
+) -> BenchmarkResult:
+    """
+    Benchmarks `func(*args, **kwargs)`.
+
+    Runs warmup rounds, picks the loop / round counts adaptively (unless the config pins
+    them), optionally turns the GC off while measuring, and returns the per-call samples
+    along with min / median / p95 / MAD and a confidence interval for the median.
+    """
+    config = config or BenchmarkConfig()
+    rez = None
+    memory = None
+    if config.track_memory:
+        memory, rez = measure_memory(func, *args, **kwargs)
+    for _ in range(config.warmup_rounds):
+        rez = func(*args, **kwargs)
+
+    gc_was_enabled = gc.isenabled()
+    if config.disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        # any `span`s inside func get totalled per round, which costs a couple of perf_counter
+        # calls per span - small next to a solution, but keep spans out of tight inner loops
+        phase_rounds: list[SpanRecorder] = []
+        counter_recorder = CounterRecorder()
+        if config.loops is None:
+            loops, first_round_ns, rez = _calibrate_loops(func, config.min_round_time * 1e9, args, kwargs)
+        else:
+            loops = config.loops
+            with record_spans() as recorder, record_counters(counter_recorder):
+                first_round_ns, rez = _time_loops_ns(func, loops, args, kwargs)
+            phase_rounds.append(recorder)
+        samples_ns = [first_round_ns / loops]
+
+        rounds = config.rounds
+        if rounds is None:
+            estimated_rounds = int(config.target_time * 1e9 / max(first_round_ns, 1))
+            rounds = min(max(estimated_rounds, config.min_rounds), config.max_rounds)
+
+        while len(samples_ns) < rounds:
+            with record_spans() as recorder, record_counters(counter_recorder):
+                elapsed_ns, rez = _time_loops_ns(func, loops, args, kwargs)
+            samples_ns.append(elapsed_ns / loops)
+            phase_rounds.append(recorder)
+    finally:
+        if config.disable_gc and gc_was_enabled:
+            gc.enable()
+
+    # the calibration calls aren't recorded, so only count the rounds that were
+    recorded_calls = len(phase_rounds) * loops
+    counters = {}
+    if recorded_calls:
+        counters = {name: total / recorded_calls for name, total in counter_recorder.counts.items()}
+    return BenchmarkResult(
+        name=name or getattr(func, "__name__", "func"),
+        samples_ns=samples_ns,
+        loops=loops,
+        warmup_rounds=config.warmup_rounds,
+        gc_disabled=config.disable_gc,
+        confidence=config.confidence,
+        phases=_collect_phase_stats(phase_rounds, loops),
+        memory=memory,
+        counters=counters,
+        return_value=rez,
+    )
+
+
+def config_for_method(method: TimingOptions, iterations: int = 10) -> BenchmarkConfig:
+    """The legacy timing options expressed as benchmark configs."""
+    if method == TimingOptions.PERF_COUNTER:
+        # a single cold call - the memory pass would warm any caches up first
+        return BenchmarkConfig(warmup_rounds=0, loops=1, rounds=1, disable_gc=False, track_memory=False)
+    elif method == TimingOptions.TIMEIT:
+        # timeit turns the GC off too
+        return BenchmarkConfig(warmup_rounds=0, loops=iterations, rounds=1, disable_gc=True)
+    elif method == TimingOptions.AVERAGE:
+        return BenchmarkConfig(warmup_rounds=0, loops=1, rounds=iterations, disable_gc=False)
+    elif method == TimingOptions.BENCHMARK:
+        return BenchmarkConfig()
+    raise ValueError(f"Unsupported timing method: {method}")
+
+
 def time_function(func: Callable[..., Any], *args, **kwargs) -> float:
     start_time = time.perf_counter()
-    rez = func(*args, **kwargs)
-    print("rez", rez)
+    func(*args, **kwargs)
     end_time = time.perf_counter()
     return end_time - start_time
 
@@ -32,11 +506,16 @@ def time_function_multiple(func: Callable[..., Any], *args, iterations: int = 10
     return total_time / iterations
 
 
-def time_function_with_timeit(func: Callable[..., Any], *args, **kwargs) -> float:
+def time_function_with_timeit(
+    func: Callable[..., Any], args: tuple = (), kwargs: dict | None = None, *, number: int = 10
+) -> float:
+    """Mean seconds per call of `func(*args, **kwargs)` over `number` calls, `func` can have a `number` of its own."""
+    kwargs = kwargs or {}
+
     def wrapped():
         func(*args, **kwargs)
 
-    return timeit.timeit(wrapped, number=10) / 10
+    return timeit.timeit(wrapped, number=number) / number
 
 
 def convert_time(time_in_seconds: float, unit: TimeUnit) -> float:
@@ -52,34 +531,101 @@ def convert_time(time_in_seconds: float, unit: TimeUnit) -> float:
         raise ValueError(f"Unsupported time unit: {unit}")
 
 
+def convert_ns(time_in_ns: float, unit: TimeUnit) -> float:
+    return convert_time(time_in_ns / 1_000_000_000, unit)
+
+
+def headline_ns(result: BenchmarkResult, method: TimingOptions) -> float:
+    # the legacy methods always reported a mean, the benchmark reports the median
+    return result.median_ns if method == TimingOptions.BENCHMARK else result.mean_ns
+
+
+def format_benchmark_details(result: BenchmarkResult, unit: TimeUnit) -> str:
+    def fmt(ns: float) -> str:
+        return f"{convert_ns(ns, unit):.6f}"
+
+    return (
+        f"median {fmt(result.median_ns)} {unit.value} "
+        f"[{result.confidence:.0%} CI {fmt(result.ci_low_ns)}-{fmt(result.ci_high_ns)}], "
+        f"min {fmt(result.min_ns)}, p95 {fmt(result.p95_ns)}, MAD {fmt(result.mad_ns)} "
+        f"({result.rounds} rounds x {result.loops} loops, gc {'off' if result.gc_disabled else 'on'})"
+    )
+
+
+def format_bytes(num_bytes: float | None) -> str:
+    if num_bytes is None:
+        return "n/a"
+    if abs(num_bytes) < 1024:
+        return f"{num_bytes:.0f} B"
+    for suffix in ("KiB", "MiB", "GiB"):
+        num_bytes /= 1024
+        if abs(num_bytes) < 1024:
+            break
+    return f"{num_bytes:.1f} {suffix}"
+
+
+def format_memory_details(memory: MemoryStats) -> str:
+    details = f"memory: peak {format_bytes(memory.peak_bytes)}, {memory.allocated_blocks:+,} blocks"
+    if memory.max_rss_bytes is not None:
+        details += f", max RSS {format_bytes(memory.max_rss_bytes)} (+{format_bytes(memory.max_rss_growth_bytes)})"
+    return details
+
+
+def format_phase_breakdown(
+    phases: dict[str, PhaseStats], total_ns: float, memory: MemoryStats | None, unit: TimeUnit
+) -> list[str]:
+    """One line per span, nested spans indented under their parent."""
+    memory_phases = memory.phases if memory else {}
+    lines = []
+    for path in dict.fromkeys([*phases, *memory_phases]):
+        *parents, leaf = path.split("/")
+        label = f"{'  ' * len(parents)}{leaf}"
+        details = []
+        phase = phases.get(path)
+        if phase is not None:
+            share = phase.median_ns / total_ns if total_ns else 0.0
+            if phase.calls_per_run != 1:
+                label += f" x{phase.calls_per_run:g}"
+            details.append(f"{convert_ns(phase.median_ns, unit):.6f} {unit.value} ({share:.1%})")
+        phase_memory = memory_phases.get(path)
+        if phase_memory is not None:
+            details.append(f"peak {format_bytes(phase_memory.peak_bytes)}")
+        lines.append(f"{label}: {', '.join(details)}")
+    return lines
+
+
 def compare_functions(
     functions: list[tuple[str, Callable[..., Any]]],
     *args,
-    method: TimingOptions = TimingOptions.PERF_COUNTER,
+    method: TimingOptions = TimingOptions.BENCHMARK,
     unit: TimeUnit = TimeUnit.SECONDS,
     iterations: int = 10,
+    config: BenchmarkConfig | None = None,
     **kwargs,
-) -> None:
+) -> list[BenchmarkResult]:
     """
     Compares the execution time of multiple functions using the specified timing method and unit.
 
     Args:
         functions: A list of tuples containing function names and function references.
         *args: Positional arguments to pass to the functions.
-        method: The timing method to use (perf_counter, timeit, or average).
+        method: The timing method to use (perf_counter, timeit, average or benchmark).
         unit: The desired time unit for the output (seconds, milliseconds, nanoseconds).
-        iterations: The number of iterations for the "average" timing method.
+        iterations: The number of iterations for the "timeit" and "average" timing methods.
+        config: Overrides the benchmark config that `method` maps to.
+
+    Returns:
+        The structured benchmark result for each function, in order.
     """
+    results = []
     for name, func in functions:
-        if method == TimingOptions.PERF_COUNTER:
-            execution_time = time_function(func, *args, **kwargs)
-        elif method == TimingOptions.TIMEIT:
-            execution_time = time_function_with_timeit(func, *args, **kwargs)
-        elif method == TimingOptions.AVERAGE:
-            execution_time = time_function_multiple(func, *args, iterations=iterations, **kwargs)
-
-        converted_time = convert_time(execution_time, unit)
+        result = benchmark(func, *args, name=name, config=config or config_for_method(method, iterations), **kwargs)
+        converted_time = convert_ns(headline_ns(result, method), unit)
         print(f"{name} execution time ({method.value}): {converted_time:.6f} {unit.value}")
+        if method == TimingOptions.BENCHMARK:
+            print(f"    {format_benchmark_details(result, unit)}")
+        results.append(result)
+    return results
 
 
 def time_solution(
@@ -89,14 +635,22 @@ def time_solution(
     method: TimingOptions = TimingOptions.PERF_COUNTER,
     unit: TimeUnit = TimeUnit.SECONDS,
     iterations: int = 10,
+    config: BenchmarkConfig | None = None,
     **kwargs,
-) -> None:
-    if method == TimingOptions.PERF_COUNTER:
-        execution_time = time_function(func, *args, **kwargs)
-    elif method == TimingOptions.TIMEIT:
-        execution_time = time_function_with_timeit(func, *args, **kwargs)
-    elif method == TimingOptions.AVERAGE:
-        execution_time = time_function_multiple(func, *args, iterations=iterations, **kwargs)
-
-    converted_time = convert_time(execution_time, unit)
+) -> BenchmarkResult:
+    """
+    One cold call by default, same as it always was. Pass `method=TimingOptions.BENCHMARK`
+    (as day01-05 do) for the adaptive engine, which takes a lot longer on the slow days.
+    """
+    result = benchmark(func, *args, name=day, config=config or config_for_method(method, iterations), **kwargs)
+    converted_time = convert_ns(headline_ns(result, method), unit)
     print(f"{day}: {converted_time:.6f} {unit.value}")
+    if method == TimingOptions.BENCHMARK:
+        print(f"    {format_benchmark_details(result, unit)}")
+    if result.memory:
+        print(f"    {format_memory_details(result.memory)}")
+    if result.counters:
+        print(f"    {format_counters(result.counters)}")
+    for line in format_phase_breakdown(result.phases, result.median_ns, result.memory, unit):
+        print(f"    {line}")
+    return result
@@ -0,0 +1,119 @@
+"""
+Leveled debug output for the day modules, in place of bare `print` / `pprint` in loops.
+
+    from trace_util import DEBUG, debug, enabled, pretty
+
+    debug("Exploring region: %s", region_key)
+    debug("Region edges:\n%s", pretty(region_edges))
+    if enabled(DEBUG):
+        debug(matrix_to_string(matrix))
+
+Nothing is shown unless asked for, with `AOC_TRACE=debug` (or `info` / `trace`) in the
+environment, `aoc.py --trace debug`, or `set_level(...)` / `with tracing(...)` from code.
+Messages go to stderr, so they never end up mixed into a `--json` report.
+
+While it's off a call is one comparison against the threshold: the message is only
+%-formatted (and `pretty` / `Lazy` arguments only rendered) once something is listening.
+Arguments are still evaluated though, so an f-string or a `matrix_to_string(...)` call is
+paid for regardless - pass the pieces as arguments, or put an `enabled(...)` guard around
+anything expensive to build.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from pprint import pformat
+from typing import Any, Callable, Iterator, TextIO
+
+# same numbers as `logging`, plus a noisier level below DEBUG for per-step output
+INFO = 20
+DEBUG = 10
+TRACE = 5
+OFF = 100
+
+LEVEL_NAMES = {"off": OFF, "info": INFO, "debug": DEBUG, "trace": TRACE}
+
+
+def parse_level(level: int | str) -> int:
+    if isinstance(level, int):
+        return level
+    if level.isdigit():
+        return int(level)
+    try:
+        return LEVEL_NAMES[level.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown trace level {level!r}, expected one of {', '.join(LEVEL_NAMES)}") from None
+
+
+_threshold = parse_level(os.environ.get("AOC_TRACE", "") or "off")
+_stream: TextIO | None = None
+
+
+def enabled(level: int) -> bool:
+    return level >= _threshold
+
+
+def get_level() -> int:
+    return _threshold
+
+
+def set_level(level: int | str) -> None:
+    global _threshold
+    _threshold = parse_level(level)
+
+
+def set_stream(stream: TextIO | None) -> None:
+    """Where messages go, `None` for whatever `sys.stderr` is at the time."""
+    global _stream
+    _stream = stream
+
+
+@contextmanager
+def tracing(level: int | str = DEBUG, stream: TextIO | None = None) -> Iterator[None]:
+    previous_threshold, previous_stream = _threshold, _stream
+    set_level(level)
+    if stream is not None:
+        set_stream(stream)
+    try:
+        yield
+    finally:
+        set_level(previous_threshold)
+        set_stream(previous_stream)
+
+
+def emit(msg: Any, args: tuple) -> None:
+    text = str(msg) % args if args else str(msg)
+    print(text, file=_stream or sys.stderr)
+
+
+def info(msg: Any, *args: Any) -> None:
+    if INFO >= _threshold:
+        emit(msg, args)
+
+
+def debug(msg: Any, *args: Any) -> None:
+    if DEBUG >= _threshold:
+        emit(msg, args)
+
+
+def trace(msg: Any, *args: Any) -> None:
+    if TRACE >= _threshold:
+        emit(msg, args)
+
+
+class Lazy:
+    """An argument that's only worked out if the message is actually shown: `Lazy(f, x)`."""
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any) -> None:
+        self.func = func
+        self.args = args
+
+    def __str__(self) -> str:
+        return str(self.func(*self.args))
+
+
+def pretty(obj: Any) -> Lazy:
+    """`pprint` formatting, but only if the message is shown."""
+    return Lazy(pformat, obj)
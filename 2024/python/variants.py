@@ -0,0 +1,428 @@
+"""
+Alternative implementations of the same step, and which one to use for a given input size.
+
+A few days kept more than one way of doing something (a heap vs a sort, a regex vs a scan
+by hand, ...). Each of those is a named variant in a `VariantSet`, along with how to get
+from an input file to what the variants take. The tuner runs every variant over a ladder
+of generated inputs, checks they all come up with the same answer and records the fastest
+one at each input size. `choose` / `run_variant` dispatch on those records.
+
+    python variants.py list
+    python variants.py tune day01/soln day20/part1 --scales 1 2 4
+    python variants.py show
+    python variants.py run day03/part2 ../inputs/day03.txt
+
+Only the variant is timed: `prepare` (parsing, mostly) runs once per input, up front.
+A set without a tuning record from this machine gets its `default`, which is what the day's
+`soln` uses.
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import platform
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from inputgen import DEFAULT_OUT_DIR, DEFAULT_SEED, read_stamp, scale_arg, write_stamped
+from registry import PYTHON_DIR, normalize_day
+from scaling import generated_input
+from timing_util import BenchmarkConfig, benchmark
+
+CHOICES_FILE = PYTHON_DIR.parent / "analysis" / "variant_choices.json"
+
+DEFAULT_LADDER = (1, 2, 4, 8)
+# a rung where the slowest variant takes longer than this is the last one
+DEFAULT_MAX_SECONDS = 5.0
+TUNE_CONFIG = BenchmarkConfig(warmup_rounds=1, min_rounds=3, max_rounds=50, target_time=0.5, track_memory=False)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@dataclass(frozen=True)
+class VariantSet:
+    day: str
+    task: str
+    # name -> implementation, every one takes whatever `prepare` returns
+    variants: dict[str, Callable[[Any], Any]]
+    # the one the day's soln uses
+    default: str
+    prepare: Callable[[Path], Any] = _identity
+    # makes equal answers compare equal, e.g. the same cheats in a different order
+    normalize: Callable[[Any], Any] = _identity
+    # tune on the first N lines of the scale 1 input rather than on whole scales, for the
+    # days where scale 1 is already far too slow to run a few times over
+    line_ladder: tuple[int, ...] | None = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.day}/{self.task}"
+
+    def __post_init__(self) -> None:
+        if self.default not in self.variants:
+            raise ValueError(f"{self.key}: default {self.default!r} isn't one of {', '.join(self.variants)}")
+
+
+_variant_sets: dict[str, VariantSet] = {}
+
+
+def register_variants(variant_set: VariantSet) -> VariantSet:
+    if variant_set.key in _variant_sets:
+        raise ValueError(f"Variants for {variant_set.key} are already registered")
+    _variant_sets[variant_set.key] = variant_set
+    return variant_set
+
+
+def _day01() -> list[VariantSet]:
+    import day01
+
+    return [VariantSet("day01", "soln", {"heap": day01.soln, "sort": day01.soln_easy}, default="heap")]
+
+
+def _day03() -> list[VariantSet]:
+    import day03
+    from input_util import MappedInput
+
+    def pt2_mapped(input_file: Path) -> int:
+        with MappedInput(input_file) as mapped:
+            return day03.extract_and_multiple_pt2_mapped(mapped)
+
+    return [
+        VariantSet(
+            "day03",
+            "part1",
+            {"regex": day03.extract_and_multiple_pt1_regex, "iter": day03.extract_and_multiple_pt1_iter},
+            default="regex",
+            prepare=Path.read_text,
+        ),
+        # the file is the input here, since not reading it into a str is the point of `mapped`
+        VariantSet(
+            "day03",
+            "part2",
+            {
+                "regex": lambda input_file: day03.extract_and_multiple_pt2_regex(input_file.read_text()),
+                "iter": lambda input_file: day03.extract_and_multiple_pt2_iter(input_file.read_text()),
+                "mapped": pt2_mapped,
+            },
+            default="mapped",
+        ),
+    ]
+
+
+def _day07() -> list[VariantSet]:
+    import day07
+    from input_util import extract_ints
+
+    def total(can_find: Callable[[int, list[int]], bool]) -> Callable[[list[list[int]]], int]:
+        return lambda lines: sum(target for target, *nums in lines if can_find(target, nums))
+
+    def cached(lines: list[list[int]]) -> int:
+        # a warm cache from the previous call would make this one look free
+        day07.can_find_equalizer_cache_helper.cache_clear()
+        return total(day07.can_find_equalizer_cache)(lines)
+
+    return [
+        VariantSet(
+            "day07",
+            "equalizer",
+            {"plain": total(day07.can_find_equalizer), "cached": cached},
+            default="cached",
+            prepare=lambda input_file: extract_ints(input_file, per_line=True),
+            line_ladder=(2, 4, 8, 16),
+        )
+    ]
+
+
+def _day20() -> list[VariantSet]:
+    import day20
+    from input_util import Grid, convert_to_point_matrix, parse_input_as_matrix
+
+    def parse(input_file: Path) -> dict[str, Any]:
+        matrix = parse_input_as_matrix(input_file.read_text(), "str")
+        race_map = convert_to_point_matrix(matrix)
+        start_loc, end_loc = day20.find_starting_and_end_location(race_map)
+        grid = Grid.from_matrix(matrix)
+        visited = day20.bfs_without_cheats_v2(grid, start_loc, end_loc)
+        return {"matrix": race_map, "grid": grid, "start_loc": start_loc, "end_loc": end_loc, "visited": visited}
+
+    def savings(cheats: list[Any]) -> Counter[int]:
+        return Counter(cheat.distance_saving for cheat in cheats)
+
+    return [
+        VariantSet(
+            "day20",
+            "bfs",
+            {
+                "points": lambda parsed: day20.bfs_without_cheats(
+                    parsed["matrix"], parsed["start_loc"], parsed["end_loc"]
+                ),
+                "grid_search": lambda parsed: day20.bfs_without_cheats_v2(
+                    parsed["grid"], parsed["start_loc"], parsed["end_loc"]
+                ),
+            },
+            default="grid_search",
+            prepare=parse,
+        ),
+        # part 1 is a cheat of at most 2, which the part 2 search does just as well when told so
+        VariantSet(
+            "day20",
+            "part1",
+            {
+                "neighbors": lambda parsed: day20.modified_bfs_explore(
+                    parsed["matrix"], parsed["start_loc"], parsed["end_loc"], parsed["visited"]
+                ),
+                "pairs": lambda parsed: day20.modified_bfs_explore_v2(
+                    parsed["matrix"], parsed["start_loc"], parsed["end_loc"], parsed["visited"], max_cheat_time=2
+                ),
+            },
+            default="neighbors",
+            prepare=parse,
+            normalize=savings,
+        ),
+    ]
+
+
+BUILTIN_VARIANTS = (_day01, _day03, _day07, _day20)
+_builtins_loaded = False
+
+
+def variant_sets() -> dict[str, VariantSet]:
+    """Every registered set by `day/task`. The days are only imported the first time round."""
+    global _builtins_loaded
+    if not _builtins_loaded:
+        _builtins_loaded = True
+        for builtin in BUILTIN_VARIANTS:
+            for variant_set in builtin():
+                register_variants(variant_set)
+    return dict(_variant_sets)
+
+
+def get_variant_set(key: str) -> VariantSet:
+    """`day01/soln`, `1/soln` and `day01.py/soln` all work, like the days in aoc.py."""
+    day, _, task = key.partition("/")
+    key = f"{normalize_day(day)}/{task}"
+    sets = variant_sets()
+    if key not in sets:
+        raise KeyError(f"No variants registered for {key} (have {', '.join(sets)})")
+    return sets[key]
+
+
+@dataclass
+class TuningPoint:
+    label: str
+    input_bytes: int
+    medians_ns: dict[str, float] = field(default_factory=dict)
+    winner: str | None = None
+    error: str | None = None
+
+
+@dataclass
+class TuningResult:
+    key: str
+    default: str
+    points: list[TuningPoint] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return all(point.error is None for point in self.points)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"key": self.key, "default": self.default, "points": [vars(point) for point in self.points]}
+
+
+def tuning_inputs(
+    variant_set: VariantSet, scales: list[int], seed: int = DEFAULT_SEED, out_dir: Path = DEFAULT_OUT_DIR
+) -> list[tuple[str, Path]]:
+    """(label, path) for every rung of the set's ladder, generating whatever isn't there yet."""
+    if variant_set.line_ladder is None:
+        return [(f"x{scale}", generated_input(variant_set.day, scale, seed, out_dir)) for scale in sorted(scales)]
+    full_input = generated_input(variant_set.day, 1, seed, out_dir)
+    lines = full_input.read_text().splitlines(keepends=True)
+    rungs = []
+    for line_count in variant_set.line_ladder:
+        path = out_dir / f"lines{line_count}" / f"{variant_set.day}.txt"
+        # stale whenever the input it's cut from is
+        stamp = {**(read_stamp(full_input) or {}), "lines": line_count}
+        if not path.exists() or read_stamp(path) != stamp:
+            write_stamped(path, "".join(lines[:line_count]), stamp)
+        rungs.append((f"{line_count} lines", path))
+    return rungs
+
+
+def tune(
+    variant_set: VariantSet,
+    inputs: list[tuple[str, Path]],
+    config: BenchmarkConfig = TUNE_CONFIG,
+    max_seconds: float | None = DEFAULT_MAX_SECONDS,
+) -> TuningResult:
+    """
+    Benchmarks every variant on every input, smallest first. A rung where the variants don't
+    agree is an error and the end of the ladder, there's no point picking the fastest wrong one.
+    """
+    result = TuningResult(key=variant_set.key, default=variant_set.default)
+    for label, input_path in inputs:
+        point = TuningPoint(label=label, input_bytes=input_path.stat().st_size)
+        result.points.append(point)
+        # the days print their answers (and sometimes a lot more), none of which we want here
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            prepared = variant_set.prepare(input_path)
+            answers = {}
+            for name, func in variant_set.variants.items():
+                bench = benchmark(func, prepared, name=f"{variant_set.key}:{name}", config=config)
+                point.medians_ns[name] = bench.median_ns
+                answers[name] = variant_set.normalize(bench.return_value)
+        expected = answers[variant_set.default]
+        disagree = [name for name, answer in answers.items() if answer != expected]
+        if disagree:
+            point.error = f"{', '.join(disagree)} disagree with {variant_set.default}"
+            break
+        point.winner = min(point.medians_ns, key=point.medians_ns.__getitem__)
+        if max_seconds is not None and max(point.medians_ns.values()) > max_seconds * 1e9:
+            break
+    return result
+
+
+def machine() -> dict[str, Any]:
+    return {"arch": platform.machine(), "processor": platform.processor(), "python": platform.python_version()}
+
+
+def load_choices(path: Path = CHOICES_FILE) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_choices(results: list[TuningResult], path: Path = CHOICES_FILE) -> dict[str, Any]:
+    """Adds (or replaces) the tuned sets' records, the other sets keep theirs."""
+    choices = load_choices(path)
+    tuned_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    for result in results:
+        choices[result.key] = {
+            "tuned_at": tuned_at,
+            "machine": machine(),
+            "default": result.default,
+            # only rungs with a winner are something to dispatch on
+            "points": [
+                {"input_bytes": point.input_bytes, "winner": point.winner, "medians_ns": point.medians_ns}
+                for point in result.points
+                if point.winner is not None
+            ],
+        }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(choices, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return choices
+
+
+def choose(key: str, input_bytes: int, choices: dict[str, Any] | None = None) -> str:
+    """
+    The variant that won on the tuned input closest in size (on a log scale, since the
+    ladder doubles) to `input_bytes`, or the default if the set was never tuned here.
+    """
+    variant_set = get_variant_set(key)
+    record = (load_choices() if choices is None else choices).get(variant_set.key)
+    if not record or not record["points"] or record["machine"] != machine():
+        return variant_set.default
+    closest = min(record["points"], key=lambda point: abs(math.log(point["input_bytes"] / max(input_bytes, 1))))
+    # a variant that's since been removed or renamed
+    return closest["winner"] if closest["winner"] in variant_set.variants else variant_set.default
+
+
+def run_variant(key: str, input_file: Path, variant: str | None = None) -> Any:
+    """Prepares `input_file` and runs `variant` on it, or whichever `choose` picks for its size."""
+    variant_set = get_variant_set(key)
+    name = variant or choose(variant_set.key, input_file.stat().st_size)
+    if name not in variant_set.variants:
+        raise KeyError(f"{variant_set.key} has no variant {name!r} (have {', '.join(variant_set.variants)})")
+    return variant_set.variants[name](variant_set.prepare(input_file))
+
+
+def format_tuning(result: TuningResult) -> str:
+    lines = [f"{result.key} (default {result.default})"]
+    for point in result.points:
+        timings = "  ".join(f"{name} {median / 1e6:.3f} ms" for name, median in point.medians_ns.items())
+        outcome = f"ERROR {point.error}" if point.error else f"-> {point.winner}"
+        lines.append(f"    {point.label:<10} {point.input_bytes:>12,} B  {timings}  {outcome}")
+    return "\n".join(lines)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Alternative implementations and which one to use per input size.")
+    parser.add_argument("--choices", type=Path, default=CHOICES_FILE, help="where the tuned choices are kept")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="every variant set and its variants")
+
+    tune_parser = subparsers.add_parser("tune", help="benchmark the variants and record the fastest per input size")
+    tune_parser.add_argument("keys", nargs="*", help="sets to tune, e.g. `day01/soln` (default: all)")
+    tune_parser.add_argument("--scales", type=scale_arg, nargs="+", default=list(DEFAULT_LADDER), help="input scales")
+    tune_parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    tune_parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR, help="where generated inputs are kept")
+    tune_parser.add_argument(
+        "--max-seconds", type=float, default=DEFAULT_MAX_SECONDS, help="stop climbing once a variant takes this long"
+    )
+    tune_parser.add_argument("--json", action="store_true", help="print machine-readable JSON to stdout")
+
+    subparsers.add_parser("show", help="the recorded choices")
+
+    run_parser = subparsers.add_parser("run", help="run the variant chosen for an input")
+    run_parser.add_argument("key", help="e.g. `day03/part2`")
+    run_parser.add_argument("input", type=Path)
+    run_parser.add_argument("--variant", help="run this one rather than the chosen one")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+
+    if args.command == "list":
+        for key, variant_set in variant_sets().items():
+            names = ", ".join(f"{name}*" if name == variant_set.default else name for name in variant_set.variants)
+            print(f"{key}: {names}")
+        return 0
+
+    if args.command == "show":
+        for key, record in sorted(load_choices(args.choices).items()):
+            picks = ", ".join(f"{point['input_bytes']:,} B -> {point['winner']}" for point in record["points"])
+            print(f"{key} (tuned {record['tuned_at']}): {picks or 'nothing recorded'}")
+        return 0
+
+    if args.command == "run":
+        try:
+            variant_set = get_variant_set(args.key)
+            name = args.variant or choose(variant_set.key, args.input.stat().st_size, load_choices(args.choices))
+            print(f"{variant_set.key} [{name}]: {run_variant(variant_set.key, args.input, name)}")
+        except (KeyError, ValueError) as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 2
+        return 0
+
+    try:
+        sets = [get_variant_set(key) for key in args.keys] if args.keys else list(variant_sets().values())
+    except (KeyError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    results = []
+    for variant_set in sets:
+        inputs = tuning_inputs(variant_set, args.scales, args.seed, args.out_dir)
+        result = tune(variant_set, inputs, max_seconds=args.max_seconds)
+        results.append(result)
+        if not args.json:
+            print(format_tuning(result))
+    save_choices(results, args.choices)
+    if args.json:
+        print(json.dumps({"sets": [result.to_dict() for result in results]}, indent=2))
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
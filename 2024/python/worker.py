@@ -0,0 +1,267 @@
+"""
+Long-lived worker that keeps the day modules imported.
+
+Every `python dayNN.py` pays for interpreter startup and imports before it solves anything.
+The worker pays that once, then answers requests over a Unix socket. Module level memo
+tables (day11's `count_stones`, day19's `can_make_design`, ...) stay warm between requests,
+on purpose: the worker turns `memo.set_keep_warm` on, everything else runs them cold.
+Answers are also kept per input file and reused until the file or the day's source changes.
+A day whose source (or a local module it uses) was edited since it was imported gets
+reloaded before it runs, so a save hook always sees the code on disk.
+
+    python worker.py serve &
+    python worker.py run 11 --input ../inputs/day11.txt
+    python worker.py run 9 --bench
+    python worker.py stats
+    python worker.py stop
+
+The protocol is one JSON object per line each way, so anything that can talk to a socket
+(an editor save hook, `socat`) can be a client:
+
+    {"day": "11", "input": "/abs/path/day11.txt", "bench": false, "fresh": false}
+    {"cmd": "stats"}
+    {"cmd": "shutdown"}
+"""
+
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import cache_util
+import memo
+from registry import get_day, run_day
+from timing_util import BenchmarkConfig
+
+# per user, so two people on one box don't end up sharing (or fighting over) a worker
+DEFAULT_SOCKET_PATH = Path(tempfile.gettempdir()) / f"aoc2024-worker-{os.getuid() if hasattr(os, 'getuid') else 0}.sock"
+CLIENT_TIMEOUT_SECONDS = 600
+
+
+class WorkerState:
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self.requests_served = 0
+        self.days_loaded: set[str] = set()
+        # (day, input path) -> (mtime_ns, size, source digest, result dict)
+        self.results: dict[tuple[str, str], tuple[int, int, str, dict[str, Any]]] = {}
+        # module name -> digest of its file as it was when it was (re)loaded
+        self.loaded_digests: dict[str, str] = {}
+        self.reloads = 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "uptime_seconds": time.time() - self.started_at,
+            "requests_served": self.requests_served,
+            "days_loaded": sorted(self.days_loaded),
+            "cached_results": len(self.results),
+            "reloads": self.reloads,
+        }
+
+    def reload_edited(self, day_module: ModuleType) -> bool:
+        """
+        Reloads the local modules the day uses that changed on disk since they were loaded,
+        plus everything that imports from them (their `from x import y`s have to be redone),
+        dependencies first.
+        """
+        edited = set()
+        for module in cache_util.local_dependencies(day_module):
+            digest = cache_util.file_digest(Path(module.__file__))
+            if self.loaded_digests.setdefault(module.__name__, digest) != digest:
+                self.loaded_digests[module.__name__] = digest
+                edited.add(module.__name__)
+        if not edited:
+            return False
+        reloaded: set[str] = set()
+        for module in _dependencies_first(day_module):
+            imports = cache_util.local_imports(module)
+            if module.__name__ in edited or any(dep.__name__ in reloaded for dep in imports):
+                importlib.reload(module)
+                reloaded.add(module.__name__)
+        cache_util.forget_source_digests()
+        # in case memo itself was one of them
+        memo.set_keep_warm(True)
+        self.reloads += 1
+        return True
+
+    def solve(self, day: str, input_file: Path | None, bench: bool, fresh: bool) -> dict[str, Any]:
+        entry = get_day(day)
+        day = entry.day
+        self.reload_edited(entry.load())
+        source_digest = cache_util.source_digest(entry.module_name)
+        input_file = input_file or entry.default_input
+        stat = input_file.stat() if input_file.exists() else None
+        cache_key = (day, str(input_file))
+        cached = self.results.get(cache_key)
+        # benchmarks always run, the point of them is the timings
+        version = (stat.st_mtime_ns, stat.st_size, source_digest) if stat else None
+        if not fresh and not bench and version and cached and cached[:3] == version:
+            return {**cached[3], "cached": True}
+
+        # the solutions print, keep that out of the socket and off the worker's stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            result = run_day(day, input_file, BenchmarkConfig(track_memory=False) if bench else None)
+        self.days_loaded.add(day)
+        response = result.to_dict()
+        if result.benchmark:
+            response["benchmark"] = result.benchmark.to_dict(include_samples=False)
+        if result.ok and version:
+            self.results[cache_key] = (*version, response)
+        return {**response, "cached": False}
+
+
+def _dependencies_first(module: ModuleType) -> list[ModuleType]:
+    order: list[ModuleType] = []
+    seen = {module.__name__}
+
+    def visit(current: ModuleType) -> None:
+        for dep in cache_util.local_imports(current):
+            if dep.__name__ not in seen:
+                seen.add(dep.__name__)
+                visit(dep)
+        order.append(current)
+
+    visit(module)
+    return order
+
+
+class WorkerHandler(socketserver.StreamRequestHandler):
+    server: "WorkerServer"
+
+    def handle(self) -> None:
+        for raw in self.rfile:
+            if not raw.strip():
+                continue
+            try:
+                response = self.server.dispatch(json.loads(raw))
+            except Exception as e:  # noqa: BLE001 - a bad request shouldn't take the worker down
+                response = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+            if self.server.shutting_down:
+                return
+
+
+class WorkerServer(socketserver.UnixStreamServer):
+    # one request at a time: the solutions aren't thread safe and it would skew timings anyway
+    def __init__(self, socket_path: Path) -> None:
+        self.state = WorkerState()
+        self.shutting_down = False
+        super().__init__(str(socket_path), WorkerHandler)
+
+    def dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        self.state.requests_served += 1
+        cmd = request.get("cmd", "solve")
+        if cmd == "solve":
+            input_file = Path(request["input"]) if request.get("input") else None
+            return self.state.solve(
+                request["day"], input_file, bool(request.get("bench")), bool(request.get("fresh"))
+            )
+        if cmd == "stats":
+            return self.state.stats()
+        if cmd == "shutdown":
+            self.shutting_down = True
+            # shutdown() waits for serve_forever to return, so it can't be called from the request itself
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+        raise ValueError(f"Unknown command: {cmd!r}")
+
+
+def serve(socket_path: Path = DEFAULT_SOCKET_PATH) -> None:
+    if socket_path.exists():
+        try:
+            send_request({"cmd": "stats"}, socket_path)
+        except OSError:
+            # left over from a worker that didn't shut down cleanly
+            socket_path.unlink()
+        else:
+            raise RuntimeError(f"A worker is already listening on {socket_path}")
+
+    memo.set_keep_warm(True)
+    with WorkerServer(socket_path) as server:
+        print(f"worker {os.getpid()} listening on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever(poll_interval=0.2)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def send_request(request: dict[str, Any], socket_path: Path = DEFAULT_SOCKET_PATH) -> dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CLIENT_TIMEOUT_SECONDS)
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError(f"Worker on {socket_path} closed the connection without answering")
+    return json.loads(line)
+
+
+def format_response(response: dict[str, Any]) -> str:
+    if response.get("error"):
+        return f"{response.get('day', 'worker')}: ERROR {response['error']}"
+    suffix = ", cached" if response.get("cached") else ""
+    return f"{response['day']}: {response['answers']} ({response['elapsed_ns'] / 1_000_000:.3f} ms{suffix})"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Warm worker for the Advent of Code 2024 solutions.")
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET_PATH)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("serve", help="start a worker in the foreground")
+    run = subparsers.add_parser("run", help="solve days on the worker")
+    run.add_argument("days", nargs="+")
+    run.add_argument("--input", type=Path, default=None, help="input file (default: the day's usual input)")
+    run.add_argument("--bench", action="store_true", help="benchmark on the worker instead of a single run")
+    run.add_argument("--fresh", action="store_true", help="ignore answers cached for an unchanged input")
+    run.add_argument("--json", action="store_true", help="print the raw responses")
+    subparsers.add_parser("stats", help="show what the worker has loaded")
+    subparsers.add_parser("stop", help="shut the worker down")
+    args = parser.parse_args(argv)
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("error: the worker needs Unix domain sockets", file=sys.stderr)
+        return 2
+    if args.command == "serve":
+        serve(args.socket)
+        return 0
+
+    if args.command == "run" and args.input and len(args.days) > 1:
+        print("error: --input is ambiguous with multiple days", file=sys.stderr)
+        return 2
+    try:
+        if args.command == "run":
+            input_path = str(args.input.resolve()) if args.input else None
+            responses = [
+                send_request(
+                    {"day": day, "input": input_path, "bench": args.bench, "fresh": args.fresh}, args.socket
+                )
+                for day in args.days
+            ]
+            for response in responses:
+                print(json.dumps(response, indent=2) if args.json else format_response(response))
+            return 0 if all(not response.get("error") for response in responses) else 1
+        response = send_request({"cmd": "stats" if args.command == "stats" else "shutdown"}, args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"error: no worker listening on {args.socket}, start one with `python worker.py serve`", file=sys.stderr)
+        return 2
+    print(json.dumps(response, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())